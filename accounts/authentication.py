@@ -0,0 +1,147 @@
+"""
+Autenticação JWT com cache do estado do usuário.
+
+A JWTAuthentication padrão faz um SELECT do usuário em toda requisição,
+mas as permissões da API (IsStudent, IsTeacher, DashboardMe...) só usam
+id e papel:
+- o estado de acesso (papel, is_active, is_staff, is_superuser) fica no
+  cache por AUTH_USER_CACHE_TTL segundos e é apagado quando o usuário é
+  salvo ou removido (accounts/signals.py) — mudança de papel ou
+  desativação vale na hora, mesmo para tokens já emitidos;
+- isso só vale com um cache compartilhado entre processos (Redis,
+  Memcached, banco): o LocMemCache é de cada processo e a invalidação não
+  chegaria aos demais workers. Com ele (ou DummyCache) o estado é lido do
+  banco a cada requisição — um SELECT só dos STATE_FIELDS;
+- request.user é um CustomUser com os demais campos adiados: só são lidos
+  do banco (todos de uma vez) se a view acessar algum deles.
+
+O login também grava o papel no token (claim "role"): o frontend decide
+a tela inicial sem chamar /api/accounts/me/.
+"""
+
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+User = get_user_model()
+
+ROLE_CLAIM = "role"
+STATE_FIELDS = ("role", "is_active", "is_staff", "is_superuser")
+
+
+# Backends sem estado compartilhado entre processos
+PROCESS_LOCAL_CACHES = (LocMemCache, DummyCache)
+
+
+def state_cache_key(user_id):
+    return f"accounts:auth-state:{user_id}"
+
+
+def user_state(user_id):
+    """
+    Estado de acesso do usuário (cache → banco).
+
+    Com um cache local ao processo vai sempre ao banco: o estado em cache
+    de outro worker não seria invalidado.
+
+    Returns:
+        dict com STATE_FIELDS, ou None se o usuário não existe.
+    """
+
+    if isinstance(caches["default"], PROCESS_LOCAL_CACHES):
+        return _load_state(user_id)
+
+    key = state_cache_key(user_id)
+    state = cache.get(key)
+    if state is None:
+        state = _load_state(user_id)
+        if state is not None:
+            cache.set(key, state, settings.AUTH_USER_CACHE_TTL)
+    return state
+
+
+def _load_state(user_id):
+    return User.objects.filter(pk=user_id).values(*STATE_FIELDS).first()
+
+
+def invalidate_user_state(user_id):
+    cache.delete(state_cache_key(user_id))
+
+
+class RoleRefreshToken(RefreshToken):
+    """Refresh token (e access token derivado) com o papel do usuário."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[ROLE_CLAIM] = user.role
+        return token
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication sem consulta ao banco quando o estado está no cache
+    (compartilhado; ver user_state).
+
+    Com SIMPLE_JWT["CHECK_REVOKE_TOKEN"] o hash da senha é necessário e a
+    verificação volta a ser a padrão (com consulta).
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        user_id = User._meta.pk.to_python(user_id)  # a claim chega como texto
+        state = user_state(user_id)
+        if state is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not state["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        # O papel vem do estado em cache, não da claim (que pode estar antiga)
+        return lazy_user({User._meta.pk.attname: user_id, **state})
+
+
+def lazy_user(loaded):
+    """
+    CustomUser com apenas os campos de `loaded`; os demais ficam adiados.
+
+    O primeiro acesso a um campo adiado carrega todos eles em uma consulta
+    (o padrão do Django seria uma consulta por campo).
+    """
+
+    user = User.from_db(
+        None,
+        list(loaded),
+        [
+            loaded[field.attname]
+            for field in User._meta.concrete_fields
+            if field.attname in loaded
+        ],
+    )
+    user.refresh_from_db = partial(_load_deferred, user)
+    return user
+
+
+def _load_deferred(user, using=None, fields=None, from_queryset=None):
+    deferred = user.get_deferred_fields()
+    if fields is not None and deferred.issuperset(fields):
+        fields = deferred
+    User.refresh_from_db(user, using=using, fields=fields, from_queryset=from_queryset)
@@ -0,0 +1,89 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.services.user_import_service import FORMATS, UserImportService
+
+
+class Command(BaseCommand):
+    """
+    Importa usuários (com perfis) em lote a partir de CSV ou JSONL.
+
+    Uso:
+        poetry run python manage.py import_users alunos.csv
+        poetry run python manage.py import_users turma.jsonl --workers 8
+        cat alunos.csv | poetry run python manage.py import_users - --format csv
+
+    Colunas / chaves:
+        email (obrigatório), password, username (padrão: email), role
+        (student/teacher/admin, padrão: student), first_name, last_name
+        Perfil do aluno: bio, course, grade — do professor: bio, subjects
+
+    Sem password → senha inutilizável (o usuário define pelo "esqueci a senha").
+    """
+
+    help = "Importa usuários em lote (CSV/JSONL) com hashing paralelo"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Arquivo CSV/JSONL (- para stdin)")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="Formato do arquivo (padrão: pela extensão)",
+        )
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Processos de hashing de senha (1 → sem pool)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Valida e calcula os hashes, sem gravar",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or (
+            "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+        )
+
+        if path == "-":
+            result = self._import(sys.stdin, file_format, options)
+        else:
+            try:
+                file = open(path, encoding="utf-8-sig", newline="")
+            except OSError as exc:
+                raise CommandError(f"Não foi possível abrir {path}: {exc}")
+            with file:
+                result = self._import(file, file_format, options)
+
+        for error in sorted(result.errors, key=lambda error: error["line"]):
+            self.stderr.write(f"linha {error['line']}: {' '.join(error['errors'])}")
+
+        summary = (
+            f"{result.created} usuários {'válidos' if options['dry_run'] else 'criados'}"
+            f" em {result.elapsed:.1f}s ({result.rate:.0f}/s),"
+            f" {len(result.errors)} linhas com erro."
+        )
+        if result.errors:
+            self.stdout.write(self.style.WARNING(summary))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
+
+    def _import(self, file, file_format, options):
+        return UserImportService.run(
+            UserImportService.read(file, file_format),
+            batch_size=options["batch_size"],
+            workers=options["workers"],
+            dry_run=options["dry_run"],
+            on_batch=self._progress,
+        )
+
+    def _progress(self, result):
+        self.stdout.write(
+            f"... {result.created} usuários, {len(result.errors)} erros"
+            f" ({result.rate:.0f}/s)"
+        )
@@ -1,6 +1,8 @@
 from dj_rest_auth.registration.serializers import RegisterSerializer
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from .authentication import RoleRefreshToken
 from .models import CustomUser
 
 
@@ -9,12 +11,15 @@ class CustomRegisterSerializer(RegisterSerializer):
 
     Extende o RegisterSerializer padrão do dj-rest-auth,
     adicionando o campo `role` e salvando isso no usuário.
+
+    O registro é anônimo: só aceita student. Professores e administradores
+    são criados pelo admin (createuser / createadmin).
     """
 
     role = serializers.ChoiceField(
-        choices=CustomUser.Role.choices,
+        choices=[(CustomUser.Role.STUDENT, CustomUser.Role.STUDENT.label)],
         default=CustomUser.Role.STUDENT,
-        help_text="Papel do usuário (student/teacher/admin).",
+        help_text="Papel do usuário (apenas student no autorregistro).",
     )
 
     def get_cleaned_data(self):
@@ -29,3 +34,9 @@ class CustomRegisterSerializer(RegisterSerializer):
         user.role = self.cleaned_data.get("role", CustomUser.Role.STUDENT)
         user.save()
         return user
+
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Login JWT (dj-rest-auth / simplejwt) com o papel do usuário no token."""
+
+    token_class = RoleRefreshToken
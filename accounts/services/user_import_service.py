@@ -0,0 +1,297 @@
+"""
+Service Layer da importação de usuários em lote (CSV / JSONL).
+
+Usado por:
+- manage.py import_users
+
+O arquivo é lido linha a linha, em lotes de IMPORT_USERS_BATCH_SIZE:
+- validação e checagem de duplicados (no arquivo e no banco: 1 consulta por lote);
+- senhas com make_password em um pool de processos (PBKDF2 leva ~100 ms
+  por senha — é o gargalo da importação); o hash do lote seguinte começa
+  enquanto o lote atual é gravado;
+- usuários e perfis (StudentProfile / TeacherProfile) com bulk_create em
+  uma transação por lote.
+
+bulk_create não dispara signals: contadores globais, métricas e perfis
+são tratados aqui.
+"""
+
+import csv
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from performance.services.counter_service import CounterService
+from performance.services.metrics_cache import MetricsCache
+from profiles.models import StudentProfile, TeacherProfile
+
+User = get_user_model()
+
+FORMATS = ("csv", "jsonl")
+USER_FIELDS = ("email", "username", "first_name", "last_name", "role")
+PROFILE_FIELDS = {
+    User.Role.STUDENT: (StudentProfile, ("bio", "course", "grade")),
+    User.Role.TEACHER: (TeacherProfile, ("bio", "subjects")),
+}
+
+
+@dataclass
+class ImportResult:
+    """Resultado da importação: total criado e erros indexados pela linha."""
+
+    created: int = 0
+    errors: list = field(default_factory=list)
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    @property
+    def rate(self):
+        return self.created / self.elapsed if self.elapsed else 0.0
+
+
+class UserImportService:
+    """Cria usuários e perfis em lote a partir de CSV/JSONL."""
+
+    @staticmethod
+    def read(file, file_format):
+        """
+        Gera (número da linha, dict) sem carregar o arquivo inteiro.
+
+        Linhas JSONL inválidas viram o dict {"__error__": mensagem}.
+        """
+
+        if file_format == "csv":
+            reader = csv.DictReader(file)
+            for row in reader:
+                yield reader.line_num, row
+            return
+
+        for line_num, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                row = {"__error__": f"JSON inválido: {exc}"}
+            if not isinstance(row, dict):
+                row = {"__error__": "Cada linha deve ser um objeto JSON."}
+            yield line_num, row
+
+    @staticmethod
+    def run(rows, batch_size=None, workers=None, dry_run=False, on_batch=None):
+        """
+        Importa as linhas.
+
+        Args:
+            rows: iterável de (número da linha, dict) — ver read().
+            batch_size: linhas por lote (INSERT e hashing).
+            workers: processos de hashing (1 → no próprio processo).
+            dry_run: valida e calcula os hashes, mas desfaz cada lote
+                (result.created conta os que seriam criados).
+            on_batch: callback(result) chamado após cada lote gravado.
+        """
+
+        batch_size = batch_size or settings.IMPORT_USERS_BATCH_SIZE
+        workers = workers or settings.IMPORT_USERS_WORKERS
+        result = ImportResult()
+        seen = set()  # emails/usernames já vistos no arquivo
+
+        pool = None
+        if workers > 1:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+
+        try:
+            pending = None
+            for batch in UserImportService._batches(rows, batch_size):
+                valid = UserImportService._validate(batch, seen, result)
+                # Executor.map envia as senhas ao pool imediatamente: o hash
+                # deste lote roda enquanto o anterior é gravado
+                hashes = UserImportService._hash(pool, workers, valid)
+                if pending:
+                    UserImportService._save(*pending, result, dry_run)
+                    if on_batch:
+                        on_batch(result)
+                pending = (valid, hashes)
+
+            if pending:
+                UserImportService._save(*pending, result, dry_run)
+                if on_batch:
+                    on_batch(result)
+        finally:
+            if pool:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        return result
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    @staticmethod
+    def _batches(rows, batch_size):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _validate(batch, seen, result):
+        """Linhas válidas do lote, já normalizadas: [(linha, dados)]."""
+
+        normalized = []
+        for line, row in batch:
+            if "__error__" in row:
+                result.errors.append({"line": line, "errors": [row["__error__"]]})
+                continue
+
+            data = {
+                key: str(value).strip()
+                for key, value in row.items()
+                if key and value is not None
+            }
+            data["email"] = User.objects.normalize_email(data.get("email", ""))
+            data["username"] = data.get("username") or data["email"]
+            data["role"] = data.get("role") or User.Role.STUDENT
+
+            errors = []
+            try:
+                validate_email(data["email"])
+            except ValidationError:
+                errors.append(f"Email inválido: {data['email']!r}.")
+            if data["role"] not in User.Role.values:
+                errors.append(f"Papel inválido: {data['role']!r}.")
+            for key in UserImportService._unique_keys(data):
+                if data[key].lower() in seen:
+                    errors.append(f"{key} repetido no arquivo: {data[key]}.")
+
+            if errors:
+                result.errors.append({"line": line, "errors": errors})
+                continue
+
+            seen.update((data["email"].lower(), data["username"].lower()))
+            normalized.append((line, data))
+
+        # Uma consulta por lote para os que já existem no banco
+        # (email__in diferencia maiúsculas: compara em minúsculas)
+        emails = [data["email"].lower() for _, data in normalized]
+        usernames = [data["username"].lower() for _, data in normalized]
+        existing = {
+            value.lower()
+            for pair in User.objects.annotate(
+                email_lower=Lower("email"), username_lower=Lower("username")
+            )
+            .filter(Q(email_lower__in=emails) | Q(username_lower__in=usernames))
+            .values_list("email", "username")
+            for value in pair
+        }
+
+        valid = []
+        for line, data in normalized:
+            duplicates = [
+                f"{key} já cadastrado: {data[key]}."
+                for key in UserImportService._unique_keys(data)
+                if data[key].lower() in existing
+            ]
+            if duplicates:
+                result.errors.append({"line": line, "errors": duplicates})
+            else:
+                valid.append((line, data))
+        return valid
+
+    @staticmethod
+    def _unique_keys(data):
+        # username padrão = email: um único erro por linha duplicada
+        if data["username"] == data["email"]:
+            return ("email",)
+        return ("email", "username")
+
+    @staticmethod
+    def _hash(pool, workers, valid):
+        """Iterador dos hashes na ordem das linhas (sem senha → inutilizável)."""
+
+        passwords = [data.get("password") or None for _, data in valid]
+        if pool is None:
+            return map(make_password, passwords)
+        chunksize = max(1, len(passwords) // (workers * 4))
+        return pool.map(make_password, passwords, chunksize=chunksize)
+
+    @staticmethod
+    def _save(valid, hashes, result, dry_run):
+        users = [
+            User(
+                password=password,
+                **{key: data[key] for key in USER_FIELDS if key in data},
+            )
+            for (_, data), password in zip(valid, hashes)
+        ]
+
+        try:
+            with transaction.atomic():
+                UserImportService._insert(valid, users)
+                transaction.set_rollback(dry_run)
+        except IntegrityError:
+            # Cadastro concorrente entre a checagem e o INSERT: grava um a um
+            users = UserImportService._insert_each(valid, users, result, dry_run)
+
+        result.created += len(users)
+
+    @staticmethod
+    def _insert(valid, users):
+        User.objects.bulk_create(users)
+
+        profiles = {model: [] for model, _ in PROFILE_FIELDS.values()}
+        for (_, data), user in zip(valid, users):
+            if user.role in PROFILE_FIELDS:
+                model, fields = PROFILE_FIELDS[user.role]
+                profiles[model].append(
+                    model(
+                        user=user, **{key: data[key] for key in fields if key in data}
+                    )
+                )
+        for model, objs in profiles.items():
+            model.objects.bulk_create(objs)
+
+        roles = {}
+        for user in users:
+            roles[user.role] = roles.get(user.role, 0) + 1
+        for role, count in roles.items():
+            CounterService.users_created(role, count)
+        if users:
+            transaction.on_commit(MetricsCache.invalidate)
+
+    @staticmethod
+    def _insert_each(valid, users, result, dry_run):
+        created = []
+        for (line, data), user in zip(valid, users):
+            user.pk = None
+            try:
+                with transaction.atomic():
+                    UserImportService._insert([(line, data)], [user])
+                    transaction.set_rollback(dry_run)
+            except IntegrityError as exc:
+                result.errors.append({"line": line, "errors": [str(exc)]})
+                continue
+            created.append(user)
+        return created
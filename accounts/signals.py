@@ -0,0 +1,32 @@
+"""
+Signals do app accounts.
+
+Mantêm o cache da autenticação JWT (accounts/authentication.py) coerente:
+salvar ou remover um usuário apaga o estado em cache após o commit.
+Atualizações em lote (QuerySet.update) não disparam signals; nesses casos
+o estado antigo vale por até AUTH_USER_CACHE_TTL segundos.
+"""
+
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.authentication import STATE_FIELDS, invalidate_user_state
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+def invalidate_state_on_save(sender, instance, update_fields=None, **kwargs):
+    # Saves parciais que não mudam o estado de acesso (ex.: last_login)
+    if update_fields is not None and not set(update_fields) & set(STATE_FIELDS):
+        return
+    transaction.on_commit(partial(invalidate_user_state, instance.pk))
+
+
+@receiver(post_delete, sender=User)
+def invalidate_state_on_delete(sender, instance, **kwargs):
+    transaction.on_commit(partial(invalidate_user_state, instance.pk))
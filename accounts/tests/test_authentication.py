@@ -0,0 +1,48 @@
+"""
+Estado de acesso na autenticação JWT: cache só quando compartilhado.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from accounts.authentication import state_cache_key, user_state
+
+User = get_user_model()
+
+FILE_CACHE = "django.core.cache.backends.filebased.FileBasedCache"
+
+
+@pytest.fixture
+def student(db):
+    return User.objects.create_user(
+        email="aluno@example.com", username="aluno", password="x", role="student"
+    )
+
+
+def test_process_local_cache_reads_database(student, django_assert_num_queries):
+    # LocMemCache (padrão): mudança feita por outro processo vale na hora
+    User.objects.filter(pk=student.pk).update(role="teacher")
+
+    with django_assert_num_queries(1):
+        assert user_state(student.pk)["role"] == "teacher"
+    assert cache.get(state_cache_key(student.pk)) is None
+
+
+def test_shared_cache_is_used(
+    student,
+    settings,
+    tmp_path,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    settings.CACHES = {"default": {"BACKEND": FILE_CACHE, "LOCATION": str(tmp_path)}}
+    user_state(student.pk)
+
+    with django_assert_num_queries(0):
+        assert user_state(student.pk)["role"] == "student"
+
+    student.role = "teacher"
+    with django_capture_on_commit_callbacks(execute=True):
+        student.save()  # o signal apaga o estado em cache após o commit
+    assert user_state(student.pk)["role"] == "teacher"
@@ -0,0 +1,59 @@
+"""
+Registro e login via dj-rest-auth: autorregistro só cria alunos.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from accounts.serializers import CustomRegisterSerializer
+
+User = get_user_model()
+
+
+def register(**extra):
+    return APIClient().post(
+        "/auth/registration/",
+        {
+            "username": "novo",
+            "email": "novo@example.com",
+            "password1": "Senha@12345",
+            "password2": "Senha@12345",
+            **extra,
+        },
+        format="json",
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("role", ["admin", "teacher"])
+def test_anonymous_registration_cannot_choose_a_privileged_role(role):
+    response = register(role=role)
+
+    assert not User.objects.exclude(role=User.Role.STUDENT).exists()
+    assert "access" not in response.data
+    if response.status_code == 201:
+        assert User.objects.get(email="novo@example.com").role == User.Role.STUDENT
+
+
+@pytest.mark.django_db
+def test_login_keeps_the_token_key_response():
+    User.objects.create_user(
+        email="aluno@example.com", username="aluno", password="Senha@12345"
+    )
+
+    response = APIClient().post(
+        "/auth/login/",
+        {"email": "aluno@example.com", "password": "Senha@12345"},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert set(response.data) == {"key"}
+
+
+def test_custom_register_serializer_only_accepts_student():
+    serializer = CustomRegisterSerializer(data={"role": "admin"})
+
+    assert not serializer.is_valid()
+    assert "role" in serializer.errors
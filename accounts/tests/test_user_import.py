@@ -0,0 +1,38 @@
+"""
+Importação de usuários: duplicados no banco detectados sem diferenciar maiúsculas.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from accounts.services.user_import_service import UserImportService
+
+User = get_user_model()
+
+
+@pytest.fixture
+def existing(db):
+    return User.objects.create_user(
+        email="Aluno@example.com", username="Aluno", password="x", role="student"
+    )
+
+
+def run(*rows):
+    return UserImportService.run(enumerate(rows, start=2), workers=1)
+
+
+def test_email_differing_only_in_case_is_a_duplicate(existing):
+    result = run({"email": "aluno@example.com", "username": "novo"})
+
+    assert result.created == 0
+    assert result.errors == [
+        {"line": 2, "errors": ["email já cadastrado: aluno@example.com."]}
+    ]
+
+
+def test_username_differing_only_in_case_is_a_duplicate(existing):
+    result = run({"email": "novo@example.com", "username": "ALUNO"})
+
+    assert result.created == 0
+    assert result.errors == [{"line": 2, "errors": ["username já cadastrado: ALUNO."]}]
+    assert User.objects.count() == 1
@@ -0,0 +1,9 @@
+"""
+Benchmarks dos caminhos quentes (listagem, correção, métricas, dashboard e PDF).
+
+App instalado apenas em core.settings.bench. Uso:
+    python manage.py bench_seed --settings=core.settings.bench
+    python manage.py bench_run --settings=core.settings.bench
+
+Ver docs/benchmarks.md.
+"""
@@ -0,0 +1,350 @@
+"""
+Massa de dados determinística dos benchmarks.
+
+Com a mesma semente e a mesma escala, o banco gerado é sempre igual
+(usuários, textos, datas, status e notas):
+- 10.000 alunos, 200 professores e 1 admin (escala 1.0);
+- 1.000.000 de redações nos 365 dias anteriores a ANCHOR, ~60% corrigidas,
+  ~30% enviadas (fila de correção) e ~10% rascunhos;
+- perfis, contadores diários (DailyActivity), tabelas de performance
+  (PerformanceRebuildService) e contadores globais (CounterService).
+
+As datas são fixas (ANCHOR), não relativas a hoje: os cenários consultam
+intervalos explícitos. A escrita é em lote (bulk_create), sem signals: o
+que os signals manteriam é calculado aqui.
+"""
+
+import random
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from essays.models import CompetenceScore, Essay
+from performance.models import DailyActivity
+from performance.services.counter_service import CounterService
+from performance.services.metrics_cache import MetricsCache
+from performance.services.rebuild_service import PerformanceRebuildService
+from profiles.models import StudentProfile, TeacherProfile
+
+User = get_user_model()
+
+# Último dia da massa de dados (as redações ficam nos 365 dias anteriores)
+ANCHOR = date(2025, 6, 30)
+DAYS = 365
+
+STUDENTS = 10_000
+TEACHERS = 200
+ESSAYS = 1_000_000
+
+PASSWORD = "bench-password"
+DOMAIN = "bench.local"
+ADMIN_EMAIL = f"admin@{DOMAIN}"
+
+# Distribuição dos status: (limite acumulado, status)
+STATUSES = (
+    (0.60, Essay.Status.CORRECTED),
+    (0.90, Essay.Status.SUBMITTED),
+    (1.00, Essay.Status.DRAFT),
+)
+# Notas ENEM por competência (múltiplos de 40), com pesos
+GRADES = (0, 40, 80, 120, 160, 200)
+GRADE_WEIGHTS = (1, 4, 12, 20, 10, 3)
+
+THEMES = (
+    "Desafios da educação digital no Brasil",
+    "Mobilidade urbana e qualidade de vida",
+    "O estigma associado às doenças mentais",
+    "Democratização do acesso ao cinema",
+    "Manipulação do comportamento pela internet",
+    "Invisibilidade do trabalho de cuidado",
+    "Valorização de comunidades tradicionais",
+    "Combate à insegurança alimentar",
+)
+PARAGRAPHS = (
+    "A Constituição Federal de 1988 assegura a todos os cidadãos o acesso a "
+    "direitos fundamentais. Entretanto, a realidade brasileira evidencia um "
+    "distanciamento entre a lei e a prática, o que torna o tema urgente.",
+    "Em primeiro lugar, cabe destacar a omissão do Estado na formulação de "
+    "políticas públicas eficazes. Sem investimento contínuo, os programas "
+    "existentes não alcançam as populações mais vulneráveis do país.",
+    "Além disso, a herança histórica de desigualdade contribui para a "
+    "manutenção do problema. Como aponta a sociologia, estruturas sociais "
+    "tendem a se reproduzir quando não há intervenção deliberada.",
+    "Outro fator relevante é o papel da mídia, que pode tanto reforçar "
+    "estereótipos quanto promover a conscientização. A forma como o assunto "
+    "é retratado influencia diretamente a opinião pública.",
+    "Nesse contexto, a escola exerce função essencial na formação de "
+    "cidadãos críticos. Projetos pedagógicos que abordem o tema ampliam o "
+    "debate e estimulam a participação da comunidade.",
+    "Dados de institutos de pesquisa revelam que o quadro se agravou na "
+    "última década, sobretudo nas regiões periféricas, onde a oferta de "
+    "serviços públicos é historicamente menor.",
+    "Portanto, é necessário que o Ministério da Educação, em parceria com os "
+    "municípios, promova campanhas e amplie o financiamento, a fim de "
+    "garantir que o direito previsto em lei se concretize.",
+    "Por fim, a sociedade civil organizada deve fiscalizar a execução dessas "
+    "medidas por meio de conselhos participativos, assegurando transparência "
+    "e continuidade às ações propostas.",
+)
+COURSES = ("Pré-ENEM", "Redação Avançada", "Extensivo", "Intensivo")
+GRADES_LABELS = ("1º ano", "2º ano", "3º ano", "Egresso")
+SUBJECTS = ("Redação", "Língua Portuguesa", "Literatura", "Redação, Gramática")
+
+CREATED = DailyActivity.Event.CREATED
+CORRECTED = DailyActivity.Event.CORRECTED
+
+
+@dataclass
+class SeedResult:
+    """Quantidades gravadas pelo seed."""
+
+    students: int = 0
+    teachers: int = 0
+    essays: int = 0
+    corrected: int = 0
+
+
+def student_email(number):
+    return f"student{number:05d}@{DOMAIN}"
+
+
+def teacher_email(number):
+    return f"teacher{number:03d}@{DOMAIN}"
+
+
+def sizes(scale):
+    """(alunos, professores, redações) para a escala (mínimo 1 de cada)."""
+
+    return (
+        max(1, round(STUDENTS * scale)),
+        max(1, round(TEACHERS * scale)),
+        max(1, round(ESSAYS * scale)),
+    )
+
+
+def seed(scale=1.0, seed_value=42, batch_size=None, on_progress=None):
+    """
+    Popula o banco (vazio) com a massa de dados dos benchmarks.
+
+    Args:
+        scale: fração do tamanho padrão (0.01 → 100 alunos, 10 mil redações).
+        seed_value: semente do gerador — mesma semente, mesmo banco.
+        batch_size: linhas por INSERT/transação.
+        on_progress: callback(etapa, feitas, total).
+    """
+
+    batch_size = batch_size or settings.ESSAY_BULK_BATCH_SIZE
+    rng = random.Random(seed_value)
+    n_students, n_teachers, n_essays = sizes(scale)
+    progress = on_progress or (lambda step, done, total: None)
+    result = SeedResult()
+
+    # Um hash para todos: PBKDF2 por usuário levaria minutos
+    password = make_password(PASSWORD)
+    tz = ZoneInfo(settings.TIME_ZONE)
+    anchor = datetime.combine(ANCHOR, time.max, tzinfo=tz)
+    joined = anchor - timedelta(days=DAYS + 30)
+
+    with _explicit_dates():
+        students = _create_users(
+            User.Role.STUDENT, n_students, student_email, password, joined, batch_size
+        )
+        teachers = _create_users(
+            User.Role.TEACHER, n_teachers, teacher_email, password, joined, batch_size
+        )
+        _create_users(
+            User.Role.ADMIN,
+            1,
+            lambda number: ADMIN_EMAIL,
+            password,
+            joined,
+            batch_size,
+            is_staff=True,
+            is_superuser=True,
+        )
+        result.students, result.teachers = len(students), len(teachers)
+        progress("usuários", result.students + result.teachers + 1, None)
+
+        essays_per_student = Counter()
+        corrections_per_teacher = Counter()
+        activity = Counter()  # (dia, evento, professor) → quantidade
+
+        done = 0
+        while done < n_essays:
+            size = min(batch_size, n_essays - done)
+            essays, scores = [], []
+            for number in range(done + 1, done + size + 1):
+                essay, score = _essay(rng, number, students, teachers, anchor)
+                essays.append(essay)
+                scores.append(score)
+
+                essays_per_student[essay.student_id] += 1
+                activity[(essay.created_at.astimezone(tz).date(), CREATED, None)] += 1
+                if score is not None:
+                    day = score.corrected_at.astimezone(tz).date()
+                    teacher_id = score.corrected_by_id
+                    corrections_per_teacher[teacher_id] += 1
+                    activity[(day, CORRECTED, None)] += 1
+                    activity[(day, CORRECTED, teacher_id)] += 1
+
+            with transaction.atomic():
+                Essay.objects.bulk_create(essays)
+                for essay, score in zip(essays, scores):
+                    if score is not None:
+                        score.essay = essay
+                CompetenceScore.objects.bulk_create(
+                    [score for score in scores if score is not None]
+                )
+
+            done += size
+            result.corrected += sum(score is not None for score in scores)
+            progress("redações", done, n_essays)
+        result.essays = done
+
+        _create_profiles(
+            rng,
+            students,
+            teachers,
+            essays_per_student,
+            corrections_per_teacher,
+            joined,
+        )
+        DailyActivity.objects.bulk_create(
+            [
+                DailyActivity(day=day, event=event, teacher_id=teacher_id, count=count)
+                for (day, event, teacher_id), count in sorted(
+                    activity.items(),
+                    key=lambda item: (item[0][0], item[0][1], item[0][2] or 0),
+                )
+            ],
+            batch_size=batch_size,
+        )
+        progress("atividade diária", len(activity), len(activity))
+
+    # Tabelas derivadas, pelos mesmos serviços usados em produção
+    chunk = 500
+    for start in range(0, len(students), chunk):
+        PerformanceRebuildService.rebuild_students(
+            students[start : start + chunk], batch_size
+        )
+        progress("performance", min(start + chunk, len(students)), len(students))
+
+    CounterService.reconcile()
+    MetricsCache.invalidate()
+    return result
+
+
+# ==========================================================
+# Helpers
+# ==========================================================
+@contextmanager
+def _explicit_dates():
+    """Desliga auto_now/auto_now_add: as datas vêm do gerador, não do relógio."""
+
+    fields = [
+        User._meta.get_field("created_at"),
+        User._meta.get_field("updated_at"),
+        Essay._meta.get_field("created_at"),
+        Essay._meta.get_field("updated_at"),
+        CompetenceScore._meta.get_field("corrected_at"),
+        StudentProfile._meta.get_field("created_at"),
+        TeacherProfile._meta.get_field("created_at"),
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def _create_users(role, count, email, password, joined, batch_size, **extra):
+    """Cria `count` usuários do papel e devolve os ids, na ordem dos números."""
+
+    users = [
+        User(
+            email=email(number),
+            username=email(number),
+            first_name=role.label,
+            last_name=f"{number:05d}",
+            role=role,
+            password=password,
+            date_joined=joined,
+            created_at=joined,
+            updated_at=joined,
+            **extra,
+        )
+        for number in range(1, count + 1)
+    ]
+    User.objects.bulk_create(users, batch_size=batch_size)
+    return [user.pk for user in users]
+
+
+def _essay(rng, number, students, teachers, anchor):
+    """Redação número `number` e a nota (None se não corrigida)."""
+
+    created_at = anchor - timedelta(seconds=rng.randrange(DAYS * 86400))
+    paragraphs = rng.sample(PARAGRAPHS, rng.randint(4, 6))
+    draw = rng.random()
+    status = next(status for limit, status in STATUSES if draw < limit)
+
+    essay = Essay(
+        student_id=students[rng.randrange(len(students))],
+        title=f"{THEMES[number % len(THEMES)]} #{number}",
+        text="\n\n".join(paragraphs),
+        status=status,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    if status != Essay.Status.CORRECTED:
+        return essay, None
+
+    grades = rng.choices(GRADES, weights=GRADE_WEIGHTS, k=5)
+    corrected_at = min(
+        anchor, created_at + timedelta(minutes=rng.randrange(30, 7 * 1440))
+    )
+    essay.score_total = sum(grades)
+    essay.updated_at = corrected_at
+    score = CompetenceScore(
+        corrected_by_id=teachers[rng.randrange(len(teachers))],
+        corrected_at=corrected_at,
+        **{f"c{index}": grade for index, grade in enumerate(grades, start=1)},
+    )
+    return essay, score
+
+
+def _create_profiles(rng, students, teachers, essays_per_student, corrections, joined):
+    StudentProfile.objects.bulk_create(
+        [
+            StudentProfile(
+                user_id=user_id,
+                course=rng.choice(COURSES),
+                grade=rng.choice(GRADES_LABELS),
+                total_essays=essays_per_student[user_id],
+                created_at=joined,
+            )
+            for user_id in students
+        ],
+        batch_size=2000,
+    )
+    TeacherProfile.objects.bulk_create(
+        [
+            TeacherProfile(
+                user_id=user_id,
+                subjects=rng.choice(SUBJECTS),
+                total_corrections=corrections[user_id],
+                created_at=joined,
+            )
+            for user_id in teachers
+        ],
+        batch_size=2000,
+    )
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks import runner
+
+STYLES = {
+    "regression": "ERROR",
+    "improvement": "SUCCESS",
+    "new": "WARNING",
+    "missing": "WARNING",
+}
+
+
+def report(command, baseline, current, threshold, min_delta_ms):
+    """Escreve a comparação e levanta CommandError (código 1) se houve regressão."""
+
+    for key, (old, new) in runner.mismatches(baseline, current).items():
+        command.stdout.write(
+            command.style.WARNING(f"Execuções não comparáveis em {key}: {old} × {new}")
+        )
+
+    rows = runner.compare(baseline, current, threshold, min_delta_ms)
+    for row in rows:
+        line = f"{row.status:11} {row.name:34} {row.detail}"
+        style = STYLES.get(row.status)
+        command.stdout.write(getattr(command.style, style)(line) if style else line)
+
+    regressions = [row.name for row in rows if row.status == "regression"]
+    if regressions:
+        raise CommandError(
+            f"{len(regressions)} cenário(s) com regressão: {', '.join(regressions)}"
+        )
+    command.stdout.write(command.style.SUCCESS("Nenhuma regressão."))
+
+
+class Command(BaseCommand):
+    """
+    Compara dois resultados de bench_run.
+
+    Uso:
+        poetry run python manage.py bench_compare baseline.json atual.json \\
+            --settings=core.settings.bench
+        poetry run python manage.py bench_compare a.json b.json --threshold 0.10
+
+    Regressão: p50 ou p95 acima da linha de base em mais de --threshold
+    (fração) e de --min-delta-ms, ou mais consultas SQL por iteração.
+    Termina com código 1 se houver regressão.
+    """
+
+    help = "Compara um resultado de benchmark com a linha de base"
+
+    def add_arguments(self, parser):
+        parser.add_argument("baseline", type=Path)
+        parser.add_argument("current", type=Path)
+        parser.add_argument("--threshold", type=float, default=0.15)
+        parser.add_argument("--min-delta-ms", type=float, default=1.0)
+
+    def handle(self, *args, **options):
+        for key in ("baseline", "current"):
+            if not options[key].exists():
+                raise CommandError(f"Arquivo não encontrado: {options[key]}")
+
+        report(
+            self,
+            runner.load(options["baseline"]),
+            runner.load(options["current"]),
+            threshold=options["threshold"],
+            min_delta_ms=options["min_delta_ms"],
+        )
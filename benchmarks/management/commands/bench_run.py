@@ -0,0 +1,107 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from benchmarks import runner
+from benchmarks.management.commands.bench_compare import report
+from benchmarks.scenarios import ScenarioError
+
+RESULTS_DIR = Path(settings.BASE_DIR) / "benchmarks" / "results"
+
+
+class Command(BaseCommand):
+    """
+    Mede os cenários e grava os percentis em JSON.
+
+    Uso:
+        poetry run python manage.py bench_run --settings=core.settings.bench
+        poetry run python manage.py bench_run --only "performance.*" \\
+            --iterations 200 --settings=core.settings.bench
+        poetry run python manage.py bench_run --baseline baseline.json \\
+            --settings=core.settings.bench
+
+    Com --baseline, compara ao final e termina com erro (código 1) se algum
+    cenário regrediu — próprio para rodar antes de cada release.
+    """
+
+    help = "Executa os benchmarks e (opcionalmente) compara com uma linha de base"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=5)
+        parser.add_argument(
+            "--only",
+            action="append",
+            help='Padrão do nome do cenário, ex.: "dashboard.*" (pode repetir)',
+        )
+        parser.add_argument(
+            "--clear-cache",
+            action="store_true",
+            help="Limpa o cache antes de cada iteração (métricas sempre frias)",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="Arquivo JSON (padrão: benchmarks/results/<data-hora>.json)",
+        )
+        parser.add_argument(
+            "--baseline", type=Path, help="JSON de uma execução anterior"
+        )
+        parser.add_argument("--threshold", type=float, default=0.15)
+        parser.add_argument("--min-delta-ms", type=float, default=1.0)
+        parser.add_argument(
+            "--list", action="store_true", help="Lista os cenários e sai"
+        )
+
+    def handle(self, *args, **options):
+        scenarios = runner.select(options["only"])
+        if options["list"]:
+            for scenario in scenarios:
+                self.stdout.write(f"{scenario.name:34} {scenario.description}")
+            return
+
+        if not scenarios:
+            raise CommandError("Nenhum cenário corresponde a --only.")
+        if options["iterations"] < 1 or options["warmup"] < 0:
+            raise CommandError("--iterations deve ser >= 1 e --warmup >= 0.")
+
+        baseline = None
+        if options["baseline"]:
+            if not options["baseline"].exists():
+                raise CommandError(f"Arquivo não encontrado: {options['baseline']}")
+            baseline = runner.load(options["baseline"])
+
+        try:
+            results = runner.run(
+                scenarios,
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+                clear_cache=options["clear_cache"],
+                on_result=self._report,
+            )
+        except ScenarioError as exc:
+            raise CommandError(str(exc))
+
+        output = options["output"] or RESULTS_DIR / (
+            timezone.localtime().strftime("%Y%m%d-%H%M%S") + ".json"
+        )
+        output.parent.mkdir(parents=True, exist_ok=True)
+        runner.dump(results, output)
+        self.stdout.write(self.style.SUCCESS(f"Resultados em {output}"))
+
+        if baseline is not None:
+            report(
+                self,
+                baseline,
+                results,
+                threshold=options["threshold"],
+                min_delta_ms=options["min_delta_ms"],
+            )
+
+    def _report(self, name, data):
+        self.stdout.write(
+            f"{name:34} p50 {data['p50_ms']:9.2f} ms  p95 {data['p95_ms']:9.2f} ms  "
+            f"p99 {data['p99_ms']:9.2f} ms  {data['queries']:3} consultas"
+        )
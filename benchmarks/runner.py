@@ -0,0 +1,256 @@
+"""
+Execução dos cenários, estatísticas e comparação com uma linha de base.
+
+Formato do JSON de resultados:
+    {
+      "meta": {commit, versões, banco, tamanho da massa, iterações...},
+      "scenarios": {
+        "<nome>": {"iterations": 50, "queries": 7, "min_ms": ...,
+                   "mean_ms": ..., "p50_ms": ..., "p90_ms": ...,
+                   "p95_ms": ..., "p99_ms": ..., "max_ms": ..., "stdev_ms": ...}
+      }
+    }
+
+Regressão (compare): p50 ou p95 mais lentos que a linha de base além do
+limite relativo (threshold) E do limite absoluto (min_delta_ms) — o
+absoluto evita alarmes em cenários de poucos milissegundos — ou mais
+consultas SQL por iteração.
+"""
+
+import fnmatch
+import json
+import platform
+import statistics
+import subprocess
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, connections
+from django.utils import timezone
+
+from essays.models import Essay
+
+from .scenarios import SCENARIOS, BenchContext
+
+User = get_user_model()
+
+PERCENTILES = {"p50": 0.50, "p90": 0.90, "p95": 0.95, "p99": 0.99}
+COMPARED = ("p50_ms", "p95_ms")
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Linha da comparação de um cenário."""
+
+    name: str
+    status: str  # ok | regression | improvement | new | missing
+    detail: str = ""
+
+
+def select(patterns=None):
+    """Cenários cujo nome casa com algum padrão (fnmatch); todos por padrão."""
+
+    if not patterns:
+        return list(SCENARIOS.values())
+    return [
+        scenario
+        for name, scenario in SCENARIOS.items()
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    ]
+
+
+def run(scenarios, iterations=50, warmup=5, clear_cache=False, on_result=None):
+    """
+    Mede os cenários e devolve o dict de resultados (ver docstring do módulo).
+
+    Args:
+        iterations: iterações medidas por cenário.
+        warmup: iterações descartadas antes da medição (caches, conexões).
+        clear_cache: limpa o cache do Django antes de cada iteração medida
+            (mede o caminho frio das métricas em cache).
+        on_result: callback(nome, estatísticas) após cada cenário.
+    """
+
+    ctx = BenchContext()
+    results = {}
+
+    for scenario in scenarios:
+        call = scenario.prepare(ctx)
+        try:
+            for iteration in range(warmup):
+                call(iteration)
+
+            # Consultas de UMA iteração, fora da medição de tempo
+            if clear_cache:
+                cache.clear()
+            queries = count_queries(call, warmup)
+
+            timings = []
+            for iteration in range(warmup + 1, warmup + 1 + iterations):
+                if clear_cache:
+                    cache.clear()
+                started = time.perf_counter_ns()
+                call(iteration)
+                timings.append(time.perf_counter_ns() - started)
+        finally:
+            if hasattr(call, "cleanup"):
+                call.cleanup()
+
+        results[scenario.name] = {
+            "description": scenario.description,
+            "queries": queries,
+            **stats(timings),
+        }
+        if on_result:
+            on_result(scenario.name, results[scenario.name])
+
+    return {
+        "meta": meta(iterations, warmup, clear_cache),
+        "scenarios": results,
+    }
+
+
+def count_queries(call, iteration):
+    """
+    Consultas SQL de uma iteração, em todas as conexões.
+
+    execute_wrapper, e não CaptureQueriesContext: o client de testes dispara
+    request_started, que zera connection.queries no meio da captura.
+    """
+
+    executed = 0
+
+    def counter(execute, sql, params, many, context):
+        nonlocal executed
+        executed += 1
+        return execute(sql, params, many, context)
+
+    with ExitStack() as stack:
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(counter))
+        call(iteration)
+    return executed
+
+
+def stats(timings_ns):
+    """Estatísticas em milissegundos (percentil pelo método nearest-rank)."""
+
+    values = sorted(value / 1_000_000 for value in timings_ns)
+    data = {
+        "iterations": len(values),
+        "min_ms": values[0],
+        "mean_ms": statistics.fmean(values),
+    }
+    for name, fraction in PERCENTILES.items():
+        data[f"{name}_ms"] = values[min(len(values) - 1, int(len(values) * fraction))]
+    data["max_ms"] = values[-1]
+    data["stdev_ms"] = statistics.stdev(values) if len(values) > 1 else 0.0
+    return {
+        key: round(value, 3) if isinstance(value, float) else value
+        for key, value in data.items()
+    }
+
+
+def meta(iterations, warmup, clear_cache):
+    return {
+        "created_at": timezone.now().isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "cache": settings.CACHES["default"]["BACKEND"],
+        "dataset": dataset(),
+        "iterations": iterations,
+        "warmup": warmup,
+        "clear_cache": clear_cache,
+    }
+
+
+def dataset():
+    """Tamanho da massa de dados (para não comparar bancos diferentes)."""
+
+    return {
+        "students": User.objects.filter(role=User.Role.STUDENT).count(),
+        "teachers": User.objects.filter(role=User.Role.TEACHER).count(),
+        "essays": Essay.objects.count(),
+    }
+
+
+def compare(baseline, current, threshold=0.15, min_delta_ms=1.0):
+    """
+    Compara dois resultados cenário a cenário.
+
+    Returns:
+        list[Comparison]: na ordem dos cenários atuais, com os ausentes no fim.
+    """
+
+    base = baseline["scenarios"]
+    rows = []
+    for name, new in current["scenarios"].items():
+        old = base.get(name)
+        if old is None:
+            rows.append(Comparison(name, "new"))
+            continue
+
+        changes = []
+        status = "ok"
+        for key in COMPARED:
+            delta = new[key] - old[key]
+            ratio = delta / old[key] if old[key] else 0.0
+            changes.append(
+                f"{key[:3]} {old[key]:.2f} → {new[key]:.2f} ms ({ratio:+.0%})"
+            )
+            if ratio > threshold and delta > min_delta_ms:
+                status = "regression"
+            elif ratio < -threshold and -delta > min_delta_ms and status == "ok":
+                status = "improvement"
+
+        if new["queries"] > old["queries"]:
+            status = "regression"
+            changes.append(f"consultas {old['queries']} → {new['queries']}")
+
+        rows.append(Comparison(name, status, ", ".join(changes)))
+
+    rows.extend(
+        Comparison(name, "missing") for name in base if name not in current["scenarios"]
+    )
+    return rows
+
+
+def mismatches(baseline, current):
+    """Condições diferentes entre as execuções: {chave: (base, atual)}."""
+
+    return {
+        key: (baseline["meta"].get(key), current["meta"].get(key))
+        for key in ("database", "dataset", "clear_cache")
+        if baseline["meta"].get(key) != current["meta"].get(key)
+    }
+
+
+def load(path):
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def dump(results, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2, ensure_ascii=False)
+        handle.write("\n")
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
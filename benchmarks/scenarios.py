@@ -0,0 +1,245 @@
+"""
+Cenários dos benchmarks: os caminhos quentes da aplicação.
+
+Cada cenário recebe um BenchContext e devolve a função de UMA iteração
+(call(numero_da_iteracao)). As requisições passam pela pilha completa
+(middlewares, autenticação, views, serializers e templates) com o client
+de testes do Django:
+- API → token JWT de verdade no cabeçalho Authorization;
+- dashboard → sessão (force_login).
+
+Cenários que escrevem no banco (correção) desfazem a transação a cada
+iteração: a massa de dados continua igual entre execuções. Se a função da
+iteração tiver o atributo `cleanup`, o runner o chama ao final (ex.: apagar
+os PDFs gerados).
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import Client
+from rest_framework.test import APIClient
+
+from accounts.authentication import RoleRefreshToken
+from dashboard.pdf import generate_pdf
+from essays.models import Essay
+
+from .fixtures import ADMIN_EMAIL, ANCHOR, PARAGRAPHS, student_email, teacher_email
+
+User = get_user_model()
+
+# Intervalos fixos, relativos à massa de dados (e não a hoje)
+MONTH = {
+    "start": (ANCHOR - timedelta(days=29)).isoformat(),
+    "end": ANCHOR.isoformat(),
+}
+WEEK = {
+    "start": (ANCHOR - timedelta(days=6)).isoformat(),
+    "end": ANCHOR.isoformat(),
+}
+PAGE = {"page_size": 20}
+SCORES = {"c1": 160, "c2": 120, "c3": 160, "c4": 120, "c5": 80}
+
+
+class ScenarioError(Exception):
+    """Resposta inesperada (status, dados ausentes) em um cenário."""
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    prepare: object  # (BenchContext) -> call(iteração)
+
+
+class BenchContext:
+    """Usuários de referência da massa de dados e clients autenticados."""
+
+    def __init__(self):
+        self.student = User.objects.get(email=student_email(1))
+        self.teacher = User.objects.get(email=teacher_email(1))
+        self.admin = User.objects.get(email=ADMIN_EMAIL)
+
+    def user(self, role):
+        return {"student": self.student, "teacher": self.teacher, "admin": self.admin}[
+            role
+        ]
+
+    def api(self, role):
+        """APIClient com o access token JWT do usuário do papel."""
+
+        token = RoleRefreshToken.for_user(self.user(role)).access_token
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return client
+
+    def browser(self, role):
+        """Client com sessão, como o navegador no dashboard."""
+
+        client = Client()
+        client.force_login(self.user(role))
+        return client
+
+
+SCENARIOS = {}
+
+
+def scenario(name, description):
+    def register(prepare):
+        SCENARIOS[name] = Scenario(name, description, prepare)
+        return prepare
+
+    return register
+
+
+def check(response, status=200):
+    if response.status_code != status:
+        body = b"" if response.streaming else response.content[:300]
+        raise ScenarioError(
+            f"{response.request['PATH_INFO']}: status {response.status_code} "
+            f"(esperado {status}) {body!r}"
+        )
+    # Streaming (exportações): o custo está em gerar o corpo inteiro
+    if response.streaming:
+        for _ in response.streaming_content:
+            pass
+    return response
+
+
+# ==========================================================
+# 1. Redações (API)
+# ==========================================================
+@scenario("essays.list", "GET /api/essays/my/?page_size=20 — 1ª página do aluno")
+def essays_list(ctx):
+    client = ctx.api("student")
+    return lambda iteration: check(client.get("/api/essays/my/", PAGE))
+
+
+@scenario("essays.list.page", "GET /api/essays/my/?cursor=… — 2ª página do aluno")
+def essays_list_page(ctx):
+    client = ctx.api("student")
+    cursor = check(client.get("/api/essays/my/", PAGE)).json()["next"]
+    if not cursor:
+        raise ScenarioError("O aluno de referência tem só uma página de redações.")
+    return lambda iteration: check(client.get(cursor))
+
+
+@scenario("essays.correct", "POST /api/essays/<id>/correct/ (desfeito a cada vez)")
+def essays_correct(ctx):
+    client = ctx.api("teacher")
+    # Uma redação enviada diferente por iteração, sempre as mesmas ids
+    essay_ids = list(
+        Essay.objects.filter(status=Essay.Status.SUBMITTED)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:1000]
+    )
+    if not essay_ids:
+        raise ScenarioError("Nenhuma redação enviada na massa de dados.")
+
+    def call(iteration):
+        essay_id = essay_ids[iteration % len(essay_ids)]
+        with transaction.atomic():
+            check(
+                client.post(f"/api/essays/{essay_id}/correct/", SCORES, format="json"),
+                status=201,
+            )
+            transaction.set_rollback(True)
+
+    return call
+
+
+# ==========================================================
+# 2. Performance (API)
+# ==========================================================
+def _get(role, path, params=None):
+    def prepare(ctx):
+        client = ctx.api(role)
+        return lambda iteration: check(client.get(path, params))
+
+    return prepare
+
+
+for _role in ("student", "teacher", "admin"):
+    scenario(f"performance.me.{_role}", f"GET /api/performance/me/ ({_role})")(
+        _get(_role, "/api/performance/me/")
+    )
+
+scenario("performance.student", "GET /api/performance/student/")(
+    _get("student", "/api/performance/student/")
+)
+scenario("performance.teacher", "GET /api/performance/teacher/")(
+    _get("teacher", "/api/performance/teacher/")
+)
+scenario("performance.admin", "GET /api/performance/admin/")(
+    _get("admin", "/api/performance/admin/")
+)
+scenario(
+    "performance.timeseries.student",
+    "GET /api/performance/timeseries/ — 30 dias do aluno",
+)(_get("student", "/api/performance/timeseries/", MONTH))
+scenario(
+    "performance.timeseries.admin",
+    "GET /api/performance/timeseries/ — 30 dias por semana, por professor",
+)(
+    _get(
+        "admin",
+        "/api/performance/timeseries/",
+        {**MONTH, "granularity": "week", "breakdown": "teacher"},
+    )
+)
+scenario(
+    "performance.export.scores",
+    "GET /api/performance/export/scores/ — 7 dias em CSV",
+)(_get("admin", "/api/performance/export/scores/", WEEK))
+
+
+# ==========================================================
+# 3. Dashboard (HTML)
+# ==========================================================
+def _dashboard(role):
+    def prepare(ctx):
+        client = ctx.browser(role)
+        return lambda iteration: check(client.get("/"))
+
+    return prepare
+
+
+for _role in ("student", "teacher", "admin"):
+    scenario(f"dashboard.home.{_role}", f"GET / — DashboardHomeView ({_role})")(
+        _dashboard(_role)
+    )
+
+
+# ==========================================================
+# 4. PDF
+# ==========================================================
+@scenario("pdf.generate.cached", "generate_pdf com o PDF já no cache de arquivos")
+def pdf_cached(ctx):
+    essay = {"titulo": "Benchmark", "texto": "\n\n".join(PARAGRAPHS)}
+    generate_pdf(essay)
+    return lambda iteration: generate_pdf(essay)
+
+
+@scenario("pdf.generate.cold", "generate_pdf sem cache (renderização WeasyPrint)")
+def pdf_cold(ctx):
+    text = "\n\n".join(PARAGRAPHS)
+    created = []
+
+    def call(iteration):
+        # Título único → HTML inédito → o PDF é sempre renderizado
+        created.append(
+            generate_pdf(
+                {"titulo": f"Benchmark {os.getpid()}-{iteration}", "texto": text}
+            )
+        )
+
+    def cleanup():
+        for path in created:
+            if os.path.exists(path):
+                os.remove(path)
+
+    call.cleanup = cleanup
+    return call
@@ -0,0 +1,234 @@
+"""
+Instrumentação de desempenho por requisição.
+
+RequestTimingMiddleware mede, nas requisições amostradas
+(REQUEST_TIMING_SAMPLE_RATE):
+- tempo total;
+- consultas SQL: quantidade e tempo (connection.execute_wrapper);
+- renderização de templates (render() e TemplateResponse);
+- acertos e faltas no cache do Django.
+
+O resultado vai para o cabeçalho Server-Timing (visível no DevTools do
+navegador; só para usuários staff, a menos que REQUEST_TIMING_HEADER_PUBLIC),
+para uma linha JSON no logger "core.performance" e para um resumo em
+memória por nome de rota (últimas REQUEST_TIMING_WINDOW requisições de
+cada uma), exibido em /health/performance/ para a equipe.
+
+Desligado por padrão (REQUEST_TIMING_SAMPLE_RATE = 0): cada ambiente liga.
+
+O resumo é por processo: com vários workers do Gunicorn, cada um mostra
+as próprias requisições. Em respostas em streaming (exportações), o tempo
+vai até o início do envio.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.template.backends.django import Template as DjangoTemplate
+
+logger = logging.getLogger("core.performance")
+
+# Medições da requisição em andamento (None → não amostrada)
+_current = ContextVar("request_timing", default=None)
+_MISSING = object()
+
+
+class RequestTiming:
+    """Números de uma requisição."""
+
+    __slots__ = ("sql_count", "sql_time", "template_time", "cache_hits", "cache_misses")
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        # execute_wrapper: chamado em toda consulta das conexões instrumentadas
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_count += 1
+            self.sql_time += time.perf_counter() - started
+
+
+class TimingSummary:
+    """Resumo em memória por nome de rota (janela das últimas requisições)."""
+
+    def __init__(self, window):
+        self.window = window
+        self.lock = threading.Lock()
+        self.routes = defaultdict(lambda: deque(maxlen=self.window))
+
+    def add(self, route, total, sql_count, sql_time):
+        with self.lock:
+            self.routes[route].append((total, sql_count, sql_time))
+
+    def as_dict(self):
+        with self.lock:
+            routes = {route: list(samples) for route, samples in self.routes.items()}
+
+        summary = {}
+        for route, samples in sorted(routes.items()):
+            totals = sorted(sample[0] for sample in samples)
+            summary[route] = {
+                "requests": len(samples),
+                "p50_ms": _ms(_percentile(totals, 0.50)),
+                "p95_ms": _ms(_percentile(totals, 0.95)),
+                "max_ms": _ms(totals[-1]),
+                "avg_sql_queries": round(
+                    sum(sample[1] for sample in samples) / len(samples), 1
+                ),
+                "avg_sql_ms": _ms(sum(sample[2] for sample in samples) / len(samples)),
+            }
+        return summary
+
+    def clear(self):
+        with self.lock:
+            self.routes.clear()
+
+
+summary = TimingSummary(settings.REQUEST_TIMING_WINDOW)
+
+
+class RequestTimingMiddleware:
+    """Server-Timing + log estruturado + resumo por rota."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        _instrument_templates()
+        _instrument_caches()
+
+    def __call__(self, request):
+        rate = settings.REQUEST_TIMING_SAMPLE_RATE
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return self.get_response(request)
+
+        timing = RequestTiming()
+        token = _current.set(timing)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timing))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total = time.perf_counter() - started
+
+        if _show_header(request):
+            response["Server-Timing"] = ", ".join(
+                [
+                    f"total;dur={total * 1000:.1f}",
+                    f'db;dur={timing.sql_time * 1000:.1f};desc="{timing.sql_count} queries"',
+                    f"tpl;dur={timing.template_time * 1000:.1f}",
+                    f'cache;desc="hit={timing.cache_hits} miss={timing.cache_misses}"',
+                ]
+            )
+
+        match = request.resolver_match
+        route = match.view_name if match else "<unresolved>"
+        summary.add(route, total, timing.sql_count, timing.sql_time)
+
+        logger.info(
+            json.dumps(
+                {
+                    "route": route,
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "total_ms": _ms(total),
+                    "sql_queries": timing.sql_count,
+                    "sql_ms": _ms(timing.sql_time),
+                    "template_ms": _ms(timing.template_time),
+                    "cache_hits": timing.cache_hits,
+                    "cache_misses": timing.cache_misses,
+                }
+            )
+        )
+        return response
+
+
+def _show_header(request):
+    # Depois da view: request.user já é o usuário da API (DRF o propaga)
+    if settings.REQUEST_TIMING_HEADER_PUBLIC:
+        return True
+    user = getattr(request, "user", None)
+    return bool(user is not None and user.is_staff)
+
+
+# ==========================================================
+# Instrumentação (aplicada uma vez por processo)
+# ==========================================================
+def _instrument_templates():
+    render = DjangoTemplate.render
+    if getattr(render, "_timed", False):
+        return
+
+    def timed_render(self, context=None, request=None):
+        timing = _current.get()
+        if timing is None:
+            return render(self, context, request)
+        started = time.perf_counter()
+        try:
+            return render(self, context, request)
+        finally:
+            timing.template_time += time.perf_counter() - started
+
+    timed_render._timed = True
+    DjangoTemplate.render = timed_render
+
+
+def _instrument_caches():
+    for alias in settings.CACHES:
+        backend = type(caches[alias])
+        get, get_many = backend.get, backend.get_many
+        if getattr(get, "_timed", False):
+            continue
+
+        def timed_get(self, key, default=None, version=None, _get=get):
+            value = _get(self, key, _MISSING, version=version)
+            timing = _current.get()
+            if timing is not None:
+                if value is _MISSING:
+                    timing.cache_misses += 1
+                else:
+                    timing.cache_hits += 1
+            return default if value is _MISSING else value
+
+        def timed_get_many(self, keys, version=None, _get_many=get_many):
+            keys = list(keys)
+            timing = _current.get()
+            # Backends sem get_many próprio chamam get() por chave: não contar 2x
+            token = _current.set(None)
+            try:
+                values = _get_many(self, keys, version=version)
+            finally:
+                _current.reset(token)
+            if timing is not None:
+                timing.cache_hits += len(values)
+                timing.cache_misses += len(keys) - len(values)
+            return values
+
+        timed_get._timed = timed_get_many._timed = True
+        backend.get, backend.get_many = timed_get, timed_get_many
+
+
+def _percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
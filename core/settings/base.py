@@ -107,6 +107,7 @@ INSTALLED_APPS = [
     "essays",
     "performance",
     "dashboard",
+    "jobs",
     "visual",
 ]
 
@@ -119,6 +120,8 @@ SITE_ID = 1
 # ==============================================================
 
 MIDDLEWARE = [
+    # Server-Timing + métricas por rota (seção 28) — primeiro: mede tudo
+    "core.middleware.RequestTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -228,28 +231,38 @@ LOGOUT_REDIRECT_URL = "/accounts/login/"
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",  # Login via navegador
-        "rest_framework_simplejwt.authentication.JWTAuthentication",  # Login via API
+        "accounts.authentication.CachedJWTAuthentication",  # Login via API (JWT)
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    # Token bucket nas views com throttle_scope (seção 27)
+    "DEFAULT_THROTTLE_CLASSES": [
+        "core.throttling.TokenBucketThrottle",
+    ],
 }
 
-# Serializer customizado para registro via API
-REST_AUTH_REGISTER_SERIALIZERS = {
-    "REGISTER_SERIALIZER": "accounts.serializers.CustomRegisterSerializer",
+# dj-rest-auth: apenas a claim "role" nos tokens JWT. USE_JWT e
+# REGISTER_SERIALIZER ficam nos padrões: /auth/login/ responde {"key": ...}
+# e /auth/registration/ usa o RegisterSerializer do dj-rest-auth (papel
+# student, padrão do modelo)
+REST_AUTH = {
+    "JWT_TOKEN_CLAIMS_SERIALIZER": "accounts.serializers.RoleTokenObtainPairSerializer",
 }
 
-# Ativa JWT no dj-rest-auth
-REST_USE_JWT = True
-
-# Configurações JWT (tempo de expiração)
+# Configurações JWT (tempo de expiração; claim "role" no token)
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_OBTAIN_SERIALIZER": "accounts.serializers.RoleTokenObtainPairSerializer",
 }
 
+# Segundos em que o estado do usuário (papel, ativo) fica em cache na
+# autenticação JWT; salvar/remover o usuário apaga o cache na hora. Só com
+# CACHE_BACKEND compartilhado: com o LocMemCache o estado vem sempre do banco
+AUTH_USER_CACHE_TTL = config("AUTH_USER_CACHE_TTL", default=60, cast=int)
+
 
 # ==============================================================
 # 11. CONFIGURAÇÕES ALLAUTH
@@ -299,6 +312,7 @@ JAZZMIN_SETTINGS = {
         "essays",
         "performance",
         "dashboard",
+        "jobs",
     ],
     "topmenu_links": [
         {"name": "Dashboard", "url": "admin:index"},
@@ -313,6 +327,7 @@ JAZZMIN_SETTINGS = {
         "essays.CompetenceScore": "fas fa-star",
         "performance": "fas fa-chart-line",
         "dashboard": "fas fa-tachometer-alt",
+        "jobs.Job": "fas fa-tasks",
     },
     "default_icon_parents": "fas fa-folder",
     "default_icon_children": "fas fa-file",
@@ -347,3 +362,204 @@ JAZZMIN_UI_TWEAKS = {
     "brand_small_text": False,
     "footer_small_text": False,
 }
+
+
+# ==============================================================
+# 17. REDAÇÕES — OPERAÇÕES EM LOTE
+# ==============================================================
+
+# Tamanho de cada INSERT/UPDATE em lote (bulk_create / bulk_update)
+ESSAY_BULK_BATCH_SIZE = config("ESSAY_BULK_BATCH_SIZE", default=500, cast=int)
+
+# Máximo de itens aceitos por requisição nas APIs de lote
+ESSAY_BATCH_MAX_ITEMS = config("ESSAY_BATCH_MAX_ITEMS", default=5000, cast=int)
+
+# Fila de correção: duração da reserva e máximo de redações por pedido
+ESSAY_CLAIM_LEASE_MINUTES = config("ESSAY_CLAIM_LEASE_MINUTES", default=15, cast=int)
+ESSAY_CLAIM_MAX_BATCH = config("ESSAY_CLAIM_MAX_BATCH", default=20, cast=int)
+
+
+# ==============================================================
+# 18. FILA DE TAREFAS (jobs) — manage.py runworker
+# ==============================================================
+
+# Tentativas por tarefa e espera entre elas (exponencial, em segundos)
+JOBS_MAX_ATTEMPTS = config("JOBS_MAX_ATTEMPTS", default=5, cast=int)
+JOBS_BACKOFF_SECONDS = config("JOBS_BACKOFF_SECONDS", default=10, cast=int)
+JOBS_BACKOFF_MAX_SECONDS = config("JOBS_BACKOFF_MAX_SECONDS", default=3600, cast=int)
+
+# Reserva do worker: após esse tempo sem renovação, a tarefa volta à fila.
+# A reserva é renovada a cada JOBS_HEARTBEAT_SECONDS enquanto a tarefa roda
+JOBS_LEASE_SECONDS = config("JOBS_LEASE_SECONDS", default=300, cast=int)
+JOBS_HEARTBEAT_SECONDS = config("JOBS_HEARTBEAT_SECONDS", default=60, cast=int)
+
+# Intervalo de consulta da fila quando ela está vazia
+JOBS_POLL_INTERVAL = config("JOBS_POLL_INTERVAL", default=1.0, cast=float)
+
+# True → a correção grava só a nota/histórico e as métricas agregadas
+# são recalculadas pelo worker (exige runworker em execução)
+PERFORMANCE_METRICS_ASYNC = config(
+    "PERFORMANCE_METRICS_ASYNC", default=False, cast=bool
+)
+
+
+# ==============================================================
+# 19. PERFORMANCE — SÉRIES TEMPORAIS
+# ==============================================================
+
+# Máximo de períodos por série em /api/performance/timeseries/
+# (um ano por dia cabe no limite padrão)
+PERFORMANCE_TIMESERIES_MAX_BUCKETS = config(
+    "PERFORMANCE_TIMESERIES_MAX_BUCKETS", default=400, cast=int
+)
+
+
+# ==============================================================
+# 20. CACHE — MÉTRICAS GLOBAIS DOS DASHBOARDS
+# ==============================================================
+
+# Em produção use um cache compartilhado entre processos, ex.:
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# CACHE_LOCATION=redis://127.0.0.1:6379/1
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default="enem-corrections"),
+    }
+}
+
+# Segundos em que a métrica é fresca / servida vencida enquanto recalcula
+METRICS_CACHE_TTL = config("METRICS_CACHE_TTL", default=60, cast=int)
+METRICS_CACHE_STALE_TTL = config("METRICS_CACHE_STALE_TTL", default=600, cast=int)
+
+# Lock single-flight do recálculo e espera máxima com o cache vazio
+METRICS_CACHE_LOCK_TIMEOUT = config("METRICS_CACHE_LOCK_TIMEOUT", default=30, cast=int)
+METRICS_CACHE_WAIT_SECONDS = config(
+    "METRICS_CACHE_WAIT_SECONDS", default=2.0, cast=float
+)
+
+# False → recalcula na própria requisição (útil em scripts e testes)
+METRICS_CACHE_ASYNC_REFRESH = config(
+    "METRICS_CACHE_ASYNC_REFRESH", default=True, cast=bool
+)
+
+# ==============================================================
+# 21. PDF — CACHE DE RENDERIZAÇÃO (dashboard/pdf.py)
+# ==============================================================
+
+# PDFs gerados ficam em MEDIA_ROOT/<PDF_CACHE_DIR>/<sha256>.pdf, onde o hash
+# cobre o HTML renderizado + PDF_TEMPLATE_VERSION. Aumente a versão ao mudar
+# algo que não aparece no HTML (fontes, CSS externo, versão do WeasyPrint)
+# para invalidar os arquivos já gerados.
+PDF_CACHE_DIR = config("PDF_CACHE_DIR", default="pdfs/rendered")
+PDF_TEMPLATE_VERSION = config("PDF_TEMPLATE_VERSION", default="1")
+
+# Limpeza (manage.py clean_pdf_cache): PDFs sem uso há N dias e, acima do
+# tamanho total, os menos usados. Os anexados a redações ficam. 0 → desliga
+PDF_CACHE_MAX_AGE_DAYS = config("PDF_CACHE_MAX_AGE_DAYS", default=30, cast=int)
+PDF_CACHE_MAX_BYTES = config(
+    "PDF_CACHE_MAX_BYTES", default=2 * 1024 * 1024 * 1024, cast=int
+)
+
+# ==============================================================
+# 22. REDAÇÕES — EXPORTAÇÃO DA TURMA (GET /api/essays/export/)
+# ==============================================================
+
+# Máximo de redações por exportação: ZIP (streaming) e PDF único (em memória
+# no WeasyPrint durante a renderização)
+ESSAY_EXPORT_MAX_ESSAYS = config("ESSAY_EXPORT_MAX_ESSAYS", default=5000, cast=int)
+ESSAY_EXPORT_MAX_MERGED = config("ESSAY_EXPORT_MAX_MERGED", default=200, cast=int)
+
+# ==============================================================
+# 23. PDF — ENTREGA DOS ARQUIVOS (dashboard/delivery.py)
+# ==============================================================
+
+# Com nginx na frente, informe o prefixo de uma location "internal" que
+# aponta para MEDIA_ROOT (ex.: /protected-media/): o Django só verifica a
+# permissão e o nginx envia o arquivo (X-Accel-Redirect).
+PDF_ACCEL_REDIRECT_PREFIX = config("PDF_ACCEL_REDIRECT_PREFIX", default="")
+
+# ==============================================================
+# 24. REDAÇÕES — UPLOAD DE PDF (essays/uploads.py)
+# ==============================================================
+
+# Limites verificados durante o recebimento (o restante do arquivo é
+# descartado assim que um deles é ultrapassado)
+ESSAY_PDF_MAX_BYTES = config("ESSAY_PDF_MAX_BYTES", default=10 * 1024 * 1024, cast=int)
+ESSAY_PDF_MAX_PAGES = config("ESSAY_PDF_MAX_PAGES", default=10, cast=int)
+
+# ==============================================================
+# 25. EXPORTAÇÃO DE DADOS (CSV/JSONL) — admin e manage.py export_data
+# ==============================================================
+
+# Linhas buscadas por ida ao banco (.iterator(chunk_size=...))
+DATA_EXPORT_CHUNK_SIZE = config("DATA_EXPORT_CHUNK_SIZE", default=2000, cast=int)
+
+# ==============================================================
+# 26. IMPORTAÇÃO DE USUÁRIOS (manage.py import_users)
+# ==============================================================
+
+# Linhas por lote (um INSERT de usuários + perfis por lote)
+IMPORT_USERS_BATCH_SIZE = config("IMPORT_USERS_BATCH_SIZE", default=500, cast=int)
+
+# Processos que calculam os hashes de senha (PBKDF2 ~100 ms cada)
+IMPORT_USERS_WORKERS = config(
+    "IMPORT_USERS_WORKERS", default=os.cpu_count() or 1, cast=int
+)
+
+# ==============================================================
+# 27. THROTTLING — TOKEN BUCKET (core/throttling.py)
+# ==============================================================
+
+THROTTLE_ENABLED = config("THROTTLE_ENABLED", default=True, cast=bool)
+
+# escopo → papel ("*" = demais papéis) → (taxa sustentada, rajada) ou None.
+# Um balde por usuário (não há balde compartilhado pelo papel)
+THROTTLE_BUCKETS = {
+    # Envio de redações: API (individual e lote) e formulário do dashboard
+    "essay_submit": {
+        "*": ("30/hour", 10),
+        "teacher": ("600/hour", 60),
+        "admin": None,
+    },
+    # Correções: individual, em lote e pela fila
+    "essay_correction": {"*": ("600/hour", 60), "admin": None},
+}
+
+# ==============================================================
+# 28. INSTRUMENTAÇÃO DE REQUISIÇÕES (core/middleware.py)
+# ==============================================================
+
+# Fração das requisições medidas (0 → desligado, 1 → todas). Desligado por
+# padrão: ligue por ambiente (dev.py mede tudo; em produção, algo como 0.05
+# mantém o resumo representativo com custo desprezível).
+REQUEST_TIMING_SAMPLE_RATE = config(
+    "REQUEST_TIMING_SAMPLE_RATE", default=0.0, cast=float
+)
+
+# Cabeçalho Server-Timing: só para usuários staff, a menos que seja público
+# (expõe quantidade de consultas e tempos internos)
+REQUEST_TIMING_HEADER_PUBLIC = config(
+    "REQUEST_TIMING_HEADER_PUBLIC", default=False, cast=bool
+)
+
+# Requisições mantidas por rota no resumo em memória (/health/performance/)
+REQUEST_TIMING_WINDOW = config("REQUEST_TIMING_WINDOW", default=500, cast=int)
+
+# Linha JSON por requisição amostrada no logger "core.performance"
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "core.performance": {
+            "handlers": ["console"],
+            "level": config("REQUEST_TIMING_LOG_LEVEL", default="INFO"),
+            "propagate": False,
+        },
+    },
+}
@@ -0,0 +1,40 @@
+"""
+Settings dos benchmarks: comandos bench_seed, bench_run e bench_compare.
+
+    poetry run python manage.py bench_run --settings=core.settings.bench
+
+Banco e MEDIA_ROOT próprios: a massa de dados (10 mil alunos, 1 milhão de
+redações) nunca se mistura com o banco de desenvolvimento. Para medir como
+em produção, aponte BENCH_DB_* para um PostgreSQL.
+"""
+
+from .base import *  # noqa: F401,F403
+from .base import BASE_DIR, config
+
+DEBUG = False
+ALLOWED_HOSTS = ["testserver", "localhost"]
+
+# Comandos bench_seed / bench_run / bench_compare
+INSTALLED_APPS = [*INSTALLED_APPS, "benchmarks"]  # noqa: F405
+
+DATABASES = {
+    "default": {
+        "ENGINE": config("BENCH_DB_ENGINE", default="django.db.backends.sqlite3"),
+        "NAME": config(
+            "BENCH_DB_NAME", default=str(BASE_DIR / "benchmarks" / "bench.sqlite3")
+        ),
+        "USER": config("BENCH_DB_USER", default=""),
+        "PASSWORD": config("BENCH_DB_PASSWORD", default=""),
+        "HOST": config("BENCH_DB_HOST", default=""),
+        "PORT": config("BENCH_DB_PORT", default=""),
+    }
+}
+
+MEDIA_ROOT = config("BENCH_MEDIA_ROOT", default=str(BASE_DIR / "benchmarks" / "media"))
+
+# Senhas dos usuários gerados: o hash é calculado uma vez só
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Mede as views, não os limites nem a instrumentação
+THROTTLE_ENABLED = False
+REQUEST_TIMING_SAMPLE_RATE = 0.0
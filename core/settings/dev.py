@@ -1,4 +1,14 @@
+from decouple import config
+
 from .base import *
 
 DEBUG = True
 ALLOWED_HOSTS = ["*"]
+
+# Instrumentação ligada no desenvolvimento: Server-Timing no DevTools
+REQUEST_TIMING_SAMPLE_RATE = config(
+    "REQUEST_TIMING_SAMPLE_RATE", default=1.0, cast=float
+)
+REQUEST_TIMING_HEADER_PUBLIC = config(
+    "REQUEST_TIMING_HEADER_PUBLIC", default=True, cast=bool
+)
@@ -0,0 +1,42 @@
+"""
+Cabeçalho Server-Timing do RequestTimingMiddleware: só para a equipe.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def timing(settings):
+    settings.REQUEST_TIMING_SAMPLE_RATE = 1.0
+    settings.REQUEST_TIMING_HEADER_PUBLIC = False
+
+
+def test_anonymous_gets_no_header(client, db):
+    response = client.get("/health/")
+
+    assert "Server-Timing" not in response
+
+
+def test_staff_gets_header(client, db):
+    client.force_login(
+        User.objects.create_user(
+            email="equipe@example.com",
+            username="equipe",
+            password="x",
+            role="admin",
+            is_staff=True,
+        )
+    )
+
+    response = client.get("/health/")
+
+    assert response["Server-Timing"].startswith("total;dur=")
+
+
+def test_public_header(client, db, settings):
+    settings.REQUEST_TIMING_HEADER_PUBLIC = True
+
+    assert "Server-Timing" in client.get("/health/")
@@ -0,0 +1,115 @@
+"""
+Token bucket: rajada, reposição, 429 na API e redirect nos formulários.
+"""
+
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.throttling import TokenBucketThrottle
+from essays.models import Essay
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def buckets(settings):
+    settings.THROTTLE_ENABLED = True
+    settings.THROTTLE_BUCKETS = {"essay_submit": {"*": ("60/minute", 2)}}
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def student(db):
+    return User.objects.create_user(
+        email="aluno@example.com", username="aluno", password="x", role="student"
+    )
+
+
+def take(user, now):
+    throttle = TokenBucketThrottle()
+    key, rate, burst = throttle.get_bucket("essay_submit", user)
+    return throttle.consume(key, rate, burst, now), throttle.wait()
+
+
+def test_burst_then_refill_one_token_per_period(student):
+    # Rajada de 2; depois, um token por segundo (60/minute)
+    assert take(student, 100.0) == (True, None)
+    assert take(student, 100.0) == (True, None)
+
+    allowed, wait = take(student, 100.0)
+    assert not allowed and wait == pytest.approx(1.0)
+
+    allowed, wait = take(student, 100.5)
+    assert not allowed and wait == pytest.approx(0.5)
+
+    assert take(student, 101.0)[0]
+    assert not take(student, 101.0)[0]
+
+
+def test_refill_never_exceeds_the_burst(student):
+    take(student, 100.0)
+
+    # Muito tempo parado: volta só até a rajada (2), não acumula
+    assert take(student, 10_000.0)[0]
+    assert take(student, 10_000.0)[0]
+    assert not take(student, 10_000.0)[0]
+
+
+def test_buckets_are_per_user(student):
+    other = User.objects.create_user(
+        email="outro@example.com", username="outro", password="x", role="student"
+    )
+    take(student, 100.0)
+    take(student, 100.0)
+
+    assert not take(student, 100.0)[0]
+    assert take(other, 100.0)[0]
+
+
+def test_role_without_limit_is_not_throttled(settings, student):
+    settings.THROTTLE_BUCKETS = {"essay_submit": {"*": ("1/hour", 1), "admin": None}}
+    admin = User.objects.create_user(
+        email="admin@example.com", username="admin", password="x", role="admin"
+    )
+
+    assert TokenBucketThrottle.get_bucket("essay_submit", admin) is None
+    assert TokenBucketThrottle.get_bucket("essay_submit", student) is not None
+
+
+def test_essay_create_returns_429_with_retry_after(student):
+    client = APIClient()
+    client.force_authenticate(student)
+    url = reverse("essays:essay-create")
+    payload = {"title": "Tema", "text": "Texto da redação"}
+
+    assert client.post(url, payload).status_code == 201
+    assert client.post(url, payload).status_code == 201
+
+    response = client.post(url, payload)
+    assert response.status_code == 429
+    assert int(response["Retry-After"]) >= 1
+    assert Essay.objects.count() == 2
+
+
+def test_upload_form_redirects_with_retry_after_without_reading_the_body(
+    student, client
+):
+    client.force_login(student)
+    take(student, time.time())
+    take(student, time.time())  # rajada esgotada
+
+    response = client.post(
+        reverse("dashboard:essay-submit"), {"theme": "Tema", "text": "Texto"}
+    )
+
+    assert response.status_code == 302
+    assert response["Location"] == reverse("dashboard:dashboard-role", args=["student"])
+    assert int(response["Retry-After"]) >= 1
+    assert not Essay.objects.exists()
@@ -0,0 +1,101 @@
+"""
+Throttling por token bucket, guardado no cache do Django.
+
+Cada balde tem uma capacidade (rajada) e uma taxa de reposição (taxa
+sustentada): um cliente pode enviar `rajada` requisições seguidas e, depois
+disso, uma a cada 1/taxa segundos. Configuração em THROTTLE_BUCKETS
+(core/settings/base.py): um balde por usuário e escopo, com o limite
+escolhido pelo papel.
+
+Uso na API: throttle_scope = "<escopo>" na view (TokenBucketThrottle está
+em DEFAULT_THROTTLE_CLASSES). Views Django comuns usam check_throttle().
+
+O balde é lido com um get e gravado com um set. Sem operação atômica no
+cache, requisições simultâneas do mesmo usuário podem passar um pouco do
+limite — o mesmo compromisso dos throttles padrão do DRF. Por isso não há
+balde compartilhado entre usuários: com get/set, as escritas concorrentes
+de todo o papel se sobrescreveriam, e um único cliente poderia esvaziá-lo
+para os demais.
+"""
+
+import math
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+@lru_cache(maxsize=None)
+def parse_rate(rate):
+    """Converte "30/hour" em tokens por segundo (30 / 3600)."""
+
+    num, period = rate.split("/")
+    return int(num) / PERIODS[period[0]]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Throttle do DRF para views com `throttle_scope`."""
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+        if not scope or not settings.THROTTLE_ENABLED:
+            return True
+
+        user = request.user
+        if not user.is_authenticated:
+            return True  # as views com escopo exigem login
+
+        bucket = self.get_bucket(scope, user)
+        if not bucket:
+            return True
+
+        return self.consume(*bucket, time.time())
+
+    def wait(self):
+        return self.wait_seconds
+
+    @staticmethod
+    def get_bucket(scope, user):
+        """(chave no cache, tokens por segundo, rajada) do usuário, ou None."""
+
+        limits = settings.THROTTLE_BUCKETS.get(scope, {})
+        limit = limits.get(user.role, limits.get("*"))
+        if not limit:
+            return None
+
+        rate, burst = limit
+        return f"throttle:{scope}:user:{user.pk}", parse_rate(rate), burst
+
+    def consume(self, key, rate, burst, now):
+        """Retira um token do balde; False (e wait_seconds) se estiver vazio."""
+
+        tokens, stamp = cache.get(key, (burst, now))
+        tokens = min(burst, tokens + (now - stamp) * rate)
+        if tokens < 1:
+            self.wait_seconds = (1 - tokens) / rate
+            return False
+
+        # O balde some do cache quando estaria cheio de novo (cheio = sem chave)
+        cache.set(key, (tokens - 1, now), math.ceil(burst / rate))
+        return True
+
+
+def check_throttle(request, view):
+    """
+    Throttle para views Django (fora do DRF).
+
+    Returns:
+        None se a requisição pode seguir, ou os segundos até o próximo token.
+    """
+
+    throttle = TokenBucketThrottle()
+    if throttle.allow_request(request, view):
+        return None
+    return math.ceil(throttle.wait())
@@ -7,7 +7,7 @@ Organização:
 3) Autenticação REST (dj-rest-auth + allauth)
 4) Dashboard (Django Templates)
 5) API REST v1 — Accounts, Profiles, Essays, Performance
-6) Healthcheck
+6) Healthcheck (+ resumo de desempenho por rota, para a equipe)
 7) Static & Media (modo DEV)
 8) Preparado para API v2
 """
@@ -15,10 +15,13 @@ Organização:
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
+from django.contrib.admin.views.decorators import staff_member_required
 from django.http import JsonResponse
 from django.urls import include, path
 from django.views.generic import RedirectView
 
+from core.middleware import summary
+
 # ==========================================================
 # HEALTHCHECK — útil em Docker, Railway, Render e CI/CD
 # ==========================================================
@@ -34,6 +37,20 @@ def healthcheck(_request):
     )
 
 
+@staff_member_required
+def performance_summary(request):
+    """Tempos por rota medidos pelo RequestTimingMiddleware (?reset=1 zera)."""
+
+    data = {
+        "sample_rate": settings.REQUEST_TIMING_SAMPLE_RATE,
+        "window": settings.REQUEST_TIMING_WINDOW,
+        "routes": summary.as_dict(),
+    }
+    if request.GET.get("reset"):
+        summary.clear()
+    return JsonResponse(data)
+
+
 # ==========================================================
 # URLS PRINCIPAIS
 # ==========================================================
@@ -84,6 +101,7 @@ urlpatterns = [
     # 6. Healthcheck
     # ------------------------------------------------------
     path("health/", healthcheck, name="healthcheck"),
+    path("health/performance/", performance_summary, name="performance-summary"),
     # ------------------------------------------------------
     # 7. API FUTURA v2 (placeholder)
     # ------------------------------------------------------
@@ -0,0 +1,127 @@
+"""
+Entrega de arquivos PDF com cache condicional e leitura parcial.
+
+Usado por EssayPDFFileView (dashboard/views.py):
+- ETag / Last-Modified → 304 quando o navegador já tem o arquivo.
+- Range: bytes=início-fim → 206 com apenas o trecho pedido (o leitor do
+  flipbook busca o PDF página a página).
+- Resposta completa via FileResponse (o servidor WSGI usa sendfile quando
+  disponível, sem copiar os bytes pelo Python).
+- PDF_ACCEL_REDIRECT_PREFIX → delega a entrega ao nginx (X-Accel-Redirect).
+"""
+
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+BLOCK_SIZE = 64 * 1024
+
+
+def pdf_response(request, field_file, filename):
+    """
+    Responde com o PDF de um FileField.
+
+    Raises:
+        Http404: arquivo inexistente no storage.
+    """
+
+    path = field_file.path
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise Http404("Arquivo PDF não encontrado.")
+
+    etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = _file_response(
+            request, field_file.name, path, stat.st_size, etag, last_modified
+        )
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Accept-Ranges"] = "bytes"
+    response["Content-Disposition"] = f'inline; filename="{filename}"'
+    # Revalida a cada acesso: resposta 304 sem corpo quando nada mudou
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _file_response(request, name, path, size, etag, last_modified):
+    if settings.PDF_ACCEL_REDIRECT_PREFIX:
+        # O nginx trata Range e envia o arquivo; o Django só autoriza
+        response = HttpResponse(content_type="application/pdf")
+        response["X-Accel-Redirect"] = settings.PDF_ACCEL_REDIRECT_PREFIX + name
+        return response
+
+    byte_range = _requested_range(request, size, etag, last_modified)
+    if byte_range is None:
+        return FileResponse(open(path, "rb"), content_type="application/pdf")
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    start, end = byte_range
+    response = FileResponse(
+        _read_range(path, start, end - start + 1),
+        status=206,
+        content_type="application/pdf",
+    )
+    response["Content-Length"] = str(end - start + 1)
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return response
+
+
+def _requested_range(request, size, etag, last_modified):
+    """
+    (início, fim) inclusive do cabeçalho Range.
+
+    Returns:
+        None → arquivo inteiro (sem Range, If-Range divergente ou
+        vários intervalos); False → intervalo impossível (416).
+    """
+
+    header = request.headers.get("Range", "").strip()
+    match = RANGE_RE.match(header)
+    if not match or size == 0:
+        return None
+
+    if_range = request.headers.get("If-Range")
+    if if_range and if_range != etag:
+        # If-Range com data: só vale se for exatamente a data do arquivo
+        if parse_http_date_safe(if_range) != last_modified:
+            return None
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    elif last:
+        start = max(size - int(last), 0)  # sufixo: últimos N bytes
+        end = size - 1
+    else:
+        return None
+
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _read_range(path, start, length):
+    with open(path, "rb") as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(BLOCK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.template.defaultfilters import filesizeformat
+
+from dashboard.pdf import clean_pdf_cache
+
+
+class Command(BaseCommand):
+    """
+    Limpa o cache de PDFs renderizados (MEDIA_ROOT/<PDF_CACHE_DIR>).
+
+    Uso:
+        poetry run python manage.py clean_pdf_cache
+        poetry run python manage.py clean_pdf_cache --dry-run
+        poetry run python manage.py clean_pdf_cache --max-age-days 7 --max-bytes 0
+
+    Deve rodar periodicamente (ex.: cron diário). PDFs anexados a redações
+    (Essay.pdf) nunca são apagados.
+    """
+
+    help = "Apaga PDFs renderizados sem uso (por idade e tamanho total)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-age-days",
+            type=int,
+            help="Sem uso há mais de N dias (padrão: PDF_CACHE_MAX_AGE_DAYS; 0 desliga)",
+        )
+        parser.add_argument(
+            "--max-bytes",
+            type=int,
+            help="Tamanho máximo do cache (padrão: PDF_CACHE_MAX_BYTES; 0 desliga)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas mostra o que seria apagado",
+        )
+
+    def handle(self, *args, **options):
+        for key in ("max_age_days", "max_bytes"):
+            if options[key] is not None and options[key] < 0:
+                raise CommandError(f"--{key.replace('_', '-')} não pode ser negativo.")
+
+        result = clean_pdf_cache(
+            max_age_days=options["max_age_days"],
+            max_bytes=options["max_bytes"],
+            dry_run=options["dry_run"],
+        )
+
+        verb = "seriam apagados" if options["dry_run"] else "apagados"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.files} arquivos {verb} ({filesizeformat(result.bytes)}); "
+                f"cache com {filesizeformat(result.kept_bytes)}."
+            )
+        )
@@ -1,17 +1,195 @@
-from django.template.loader import render_to_string
-from weasyprint import HTML
+"""
+Renderização do PDF das redações com cache endereçado por conteúdo.
+
+O arquivo fica em MEDIA_ROOT/<PDF_CACHE_DIR>/<aa>/<sha256>.pdf, onde o hash
+cobre o HTML renderizado + PDF_TEMPLATE_VERSION:
+- mesmo conteúdo → reaproveita o arquivo existente (sem chamar o WeasyPrint);
+- escrita atômica (arquivo temporário + os.replace): renderizações
+  concorrentes do mesmo conteúdo nunca deixam um PDF pela metade;
+- cada reaproveitamento atualiza o mtime do arquivo: clean_pdf_cache()
+  (manage.py clean_pdf_cache) apaga primeiro os menos usados, por idade
+  (PDF_CACHE_MAX_AGE_DAYS) e tamanho total (PDF_CACHE_MAX_BYTES), sem
+  tocar nos arquivos ainda referenciados por Essay.pdf.
+"""
+
+import hashlib
 import os
+import tempfile
+import time
+from dataclasses import dataclass
+
 from django.conf import settings
+from django.template.loader import render_to_string
+
+TEMPLATE = "pdf/correction.html"
+
+# Temporários mais antigos que isso são restos de renderizações interrompidas
+STALE_TMP_SECONDS = 3600
+# Nomes consultados por vez em Essay.pdf
+REFERENCE_BATCH_SIZE = 500
+
+
+def generate_pdf(essay):
+    """
+    Renderiza (ou reaproveita) o PDF da redação.
+
+    Args:
+        essay: dict com "titulo" e "texto".
 
+    Returns:
+        str: caminho absoluto do PDF.
+    """
+    return render_pdf(TEMPLATE, {"essay": essay})
 
-def generate_pdf(essay, essay_id=None):
-    html_string = render_to_string("pdf/correction.html", {"essay": essay})
 
-    # Caminho para salvar o PDF
-    pdf_dir = os.path.join(settings.MEDIA_ROOT, "pdfs")
+def render_pdf(template, context):
+    """Renderiza `template` em PDF, reaproveitando o arquivo se já existir."""
+
+    html_string = render_to_string(template, context)
+    pdf_path = cached_pdf_path(html_string)
+
+    if os.path.exists(pdf_path):
+        _touch(pdf_path)
+        return pdf_path
+
+    pdf_dir = os.path.dirname(pdf_path)
     os.makedirs(pdf_dir, exist_ok=True)
-    filename = f"{essay_id or 'temp'}.pdf"
-    pdf_path = os.path.join(pdf_dir, filename)
-    HTML(string=html_string).write_pdf(pdf_path)
+
+    # Temporário no mesmo diretório: os.replace é atômico no mesmo sistema de arquivos
+    fd, tmp_path = tempfile.mkstemp(dir=pdf_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            _write_pdf(html_string, tmp)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.chmod(tmp_path, settings.FILE_UPLOAD_PERMISSIONS or 0o644)
+        os.replace(tmp_path, pdf_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
     return pdf_path
+
+
+def render_pdf_to_file(template, context, target):
+    """
+    Renderiza `template` direto em `target` (arquivo binário), sem passar pelo
+    cache — para documentos de uso único, como o PDF da exportação da turma.
+    """
+    _write_pdf(render_to_string(template, context), target)
+
+
+def _write_pdf(html_string, target):
+    # Import tardio: o WeasyPrint (e as bibliotecas nativas do Pango) só é
+    # carregado quando um PDF precisa ser renderizado, não em todo processo
+    # que importa dashboard.tasks (autodiscover do jobs, manage.py ...)
+    from weasyprint import HTML
+
+    HTML(string=html_string).write_pdf(target)
+
+
+def cached_pdf_path(html_string):
+    """Caminho do PDF para este HTML na versão atual do template."""
+
+    digest = hashlib.sha256()
+    digest.update(settings.PDF_TEMPLATE_VERSION.encode())
+    digest.update(b"\0")
+    digest.update(html_string.encode())
+    key = digest.hexdigest()
+
+    return os.path.join(
+        settings.MEDIA_ROOT, settings.PDF_CACHE_DIR, key[:2], f"{key}.pdf"
+    )
+
+
+def _touch(path):
+    # mtime = último uso (a limpeza apaga os menos usados primeiro)
+    try:
+        os.utime(path)
+    except OSError:
+        pass  # removido pela limpeza entre o exists() e aqui
+
+
+# ==========================================================
+# Limpeza do cache
+# ==========================================================
+@dataclass
+class CleanupResult:
+    """Arquivos apagados (ou que seriam, em dry_run) e espaço liberado."""
+
+    files: int = 0
+    bytes: int = 0
+    kept_bytes: int = 0
+
+
+def clean_pdf_cache(max_age_days=None, max_bytes=None, dry_run=False):
+    """
+    Apaga PDFs do cache que não são usados há max_age_days e, se o total
+    ainda passar de max_bytes, os menos usados até caber.
+
+    Arquivos referenciados por Essay.pdf nunca são apagados (o PDF anexado à
+    redação continua disponível). None → valores das settings; 0 desliga o
+    critério.
+    """
+
+    from essays.models import Essay
+
+    max_age_days = (
+        settings.PDF_CACHE_MAX_AGE_DAYS if max_age_days is None else max_age_days
+    )
+    max_bytes = settings.PDF_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    root = os.path.join(settings.MEDIA_ROOT, settings.PDF_CACHE_DIR)
+    now = time.time()
+    result = CleanupResult()
+
+    # (mtime, tamanho, caminho) dos PDFs; temporários velhos saem direto
+    files = []
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if name.endswith(".tmp"):
+                if now - stat.st_mtime > STALE_TMP_SECONDS:
+                    _remove(path, stat.st_size, result, dry_run)
+            elif name.endswith(".pdf"):
+                files.append((stat.st_mtime, stat.st_size, path))
+
+    # Nomes em Essay.pdf são relativos a MEDIA_ROOT
+    referenced = set()
+    names = [os.path.relpath(path, settings.MEDIA_ROOT) for _, _, path in files]
+    for start in range(0, len(names), REFERENCE_BATCH_SIZE):
+        referenced.update(
+            Essay.objects.filter(
+                pdf__in=names[start : start + REFERENCE_BATCH_SIZE]
+            ).values_list("pdf", flat=True)
+        )
+
+    files.sort()  # menos usados primeiro
+    total = sum(size for _, size, _ in files)
+    cutoff = now - max_age_days * 86400 if max_age_days else None
+    for mtime, size, path in files:
+        too_old = cutoff is not None and mtime < cutoff
+        too_big = bool(max_bytes) and total > max_bytes
+        if not (too_old or too_big):
+            continue
+        if os.path.relpath(path, settings.MEDIA_ROOT) in referenced:
+            continue
+        _remove(path, size, result, dry_run)
+        total -= size
+
+    result.kept_bytes = total
+    return result
+
+
+def _remove(path, size, result, dry_run):
+    if not dry_run:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            return
+    result.files += 1
+    result.bytes += size
@@ -1,10 +1,20 @@
-from django.db.models import Avg
-from django.contrib.auth import get_user_model
-from datetime import date, timedelta
+"""
+Métricas e contexto dos dashboards por papel (aluno, professor, admin).
 
-from essays.models import Essay
+Cada papel calcula os seus KPIs com UMA consulta agregada
+(Count/Avg com filter=Q(...)); as métricas globais vêm do MetricsCache.
+DashboardHomeView apenas junta o resultado — não faz contagens próprias.
+"""
 
-User = get_user_model()
+from datetime import datetime, time
+
+from django.db.models import Avg, Count, Min, Q
+from django.urls import reverse
+from django.utils import timezone
+
+from essays.models import CompetenceScore, Essay
+from performance.models import DailyActivity
+from performance.services.metrics_cache import GlobalMetrics
 
 
 def dashboard_metrics(user):
@@ -35,34 +45,52 @@ def dashboard_metrics(user):
 
 
 def _metrics_student(user):
-    essays = Essay.objects.filter(student=user)
+    # KPIs do aluno em uma única consulta
+    kpis = Essay.objects.filter(student=user).aggregate(
+        essays_count=Count("id"),
+        pending_count=Count("id", filter=Q(status=Essay.Status.SUBMITTED)),
+        corrected_count=Count("id", filter=Q(status=Essay.Status.CORRECTED)),
+        avg_score=Avg("score_total"),
+    )
     return {
         "title": "Dashboard do Aluno",
-        "essays_count": essays.count(),
-        "pending_count": essays.filter(status="pending").count(),
-        "avg_score": essays.aggregate(Avg("score_total"))["score_total__avg"] or 0,
+        **kpis,
+        "avg_score": kpis["avg_score"] or 0,
     }
 
 
 def _metrics_teacher(user):
-    from essays.models import CompetenceScore, Essay
+    # KPIs do professor em uma única consulta; pendentes vêm do cache global
+    today = datetime.combine(
+        timezone.localdate(), time.min, tzinfo=timezone.get_current_timezone()
+    )
+    kpis = CompetenceScore.objects.filter(corrected_by=user).aggregate(
+        total_corrected=Count("id"),
+        today_count=Count("id", filter=Q(corrected_at__gte=today)),
+        first_correction=Min("corrected_at"),
+    )
+
+    first = kpis.pop("first_correction")
+    days = (timezone.localdate() - timezone.localdate(first)).days + 1 if first else 1
 
-    corrected = CompetenceScore.objects.filter(corrected_by=user).count()
-    pending = Essay.objects.filter(status="pending").count()
     return {
         "title": "Painel do Professor",
-        "total_corrected": corrected,
-        "pending_count": pending,
+        **kpis,
+        "avg_per_day": round(kpis["total_corrected"] / days, 1),
+        "pending_count": GlobalMetrics.platform_counts()["pending_count"],
     }
 
 
 def _metrics_admin(user):
+    # Contagens globais: servidas do cache compartilhado (MetricsCache)
+    counts = GlobalMetrics.platform_counts()
     return {
         "title": "Administração Geral",
-        "users_count": User.objects.count(),
-        "teachers_count": User.objects.filter(role="teacher").count(),
-        "essays_count": Essay.objects.count(),
-        "pending_count": Essay.objects.filter(status="pending").count(),
+        "users_count": counts["users_count"],
+        "teachers_count": counts["teachers_count"],
+        "essays_count": counts["essays_count"],
+        "pending_count": counts["pending_count"],
+        "corrected_count": counts["corrected_count"],
     }
 
 
@@ -89,8 +117,8 @@ def get_dashboard_context(user, role, metrics):
 
 
 def _context_student(user, metrics):
-    essays = Essay.objects.filter(student=user).order_by("-created_at")
-    last_essays = essays[:5]
+    # Últimas redações do aluno (rascunhos, enviadas e corrigidas)
+    last_essays = list(Essay.objects.filter(student=user).order_by("-created_at")[:10])
     competencies = metrics.get("competencies", [0, 0, 0, 0, 0])
 
     return {
@@ -101,19 +129,27 @@ def _context_student(user, metrics):
         "best_competence": metrics.get("best_competence", "—"),
         "recent_essays": last_essays,
         "competencies": competencies,
+        "corrected_essays_count": metrics.get("corrected_count", 0),
+        "pending_essays_count": metrics.get("pending_count", 0),
+        "show_student_cards": True,
     }
 
 
 def _context_teacher(user, metrics):
-    labels = []
-    values = []
-
-    for i in range(6, -1, -1):
-        day = date.today() - timedelta(days=i)
-        labels.append(day.strftime("%d/%m"))
-        values.append(
-            Essay.objects.filter(status="corrected", updated_at__date=day).count()
+    # Correções dos últimos 7 dias (contadores diários, em cache)
+    labels, values = GlobalMetrics.activity(DailyActivity.Event.CORRECTED)
+
+    # Redações enviadas ou corrigidas, com link para o PDF
+    essays = list(
+        Essay.objects.filter(
+            status__in=[Essay.Status.SUBMITTED, Essay.Status.CORRECTED]
         )
+        .select_related("student")
+        .order_by("-created_at")[:20]
+    )
+    # pdf_url: view de entrega (Range/ETag); sem PDF, o flipbook gera o arquivo
+    for essay in essays:
+        essay.pdf_url = reverse("dashboard:pdf-file", args=[essay.pk])
 
     return {
         "dashboard_template": "dashboard/teacher_dashboard.html",
@@ -123,18 +159,19 @@ def _context_teacher(user, metrics):
         "avg_per_day": metrics.get("avg_per_day", 0),
         "labels": labels,
         "values": values,
-        "pending": Essay.objects.filter(status="pending")[:10],
+        "pending": Essay.objects.filter(status=Essay.Status.SUBMITTED).order_by(
+            "created_at", "id"
+        )[:10],
+        "essays": essays,
+        "corrected_essays_count": metrics.get("total_corrected", 0),
+        "pending_essays_count": metrics.get("pending_count", 0),
+        "show_teacher_cards": True,
     }
 
 
 def _context_admin(user, metrics):
-    labels = []
-    values = []
-
-    for i in range(6, -1, -1):
-        day = date.today() - timedelta(days=i)
-        labels.append(day.strftime("%d/%m"))
-        values.append(Essay.objects.filter(created_at__date=day).count())
+    # Envios dos últimos 7 dias (contadores diários, em cache)
+    labels, values = GlobalMetrics.activity(DailyActivity.Event.CREATED)
 
     return {
         "dashboard_template": "dashboard/admin_dashboard_pro.html",
@@ -144,5 +181,9 @@ def _context_admin(user, metrics):
         "pending_count": metrics.get("pending_count", 0),
         "labels": labels,
         "values": values,
-        "recent_essays": Essay.objects.order_by("-created_at")[:10],
+        "recent_essays": GlobalMetrics.recent_essays(),
+        "corrected_essays_count": metrics.get("corrected_count", 0),
+        "pending_essays_count": metrics.get("pending_count", 0),
+        "total_users": metrics.get("users_count", 0),
+        "show_admin_cards": True,
     }
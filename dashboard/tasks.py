@@ -0,0 +1,86 @@
+"""
+Tarefas em segundo plano do app dashboard (executadas pelo runworker).
+"""
+
+import os
+
+from django.conf import settings
+
+from essays.models import Essay
+from essays.uploads import UPLOAD_DIR, is_uploaded
+from jobs.registry import task
+
+from .pdf import generate_pdf
+
+# Status a partir dos quais a geração pode ser (re)enfileirada
+REGENERABLE = (Essay.PdfStatus.NONE, Essay.PdfStatus.FAILED)
+
+
+def mark_pdf_failed(payload, error):
+    """Tentativas esgotadas: a redação passa a exibir o erro."""
+
+    Essay.objects.filter(pk=payload.get("essay_id")).update(
+        pdf_status=Essay.PdfStatus.FAILED,
+        pdf_error=error.strip().splitlines()[-1][:500],
+    )
+
+
+@task("dashboard.generate_pdf", on_failure=mark_pdf_failed)
+def generate_essay_pdf(essay_id):
+    """
+    Gera o PDF de uma redação e anexa o arquivo em Essay.pdf.
+
+    A renderização roda fora de transação; o resultado é gravado com um
+    único UPDATE. Idempotente: o arquivo é endereçado pelo conteúdo.
+
+    Nunca substitui um PDF enviado pelo aluno (pdfs/uploads/): se ele ainda
+    existe, a redação volta a "pronto"; se sumiu do disco, "falhou" — o
+    aluno precisa enviar de novo.
+    """
+
+    essay = Essay.objects.only("title", "text", "pdf").filter(pk=essay_id).first()
+    if essay is None:
+        return
+
+    if is_uploaded(essay.pdf.name):
+        if essay.pdf.storage.exists(essay.pdf.name):
+            Essay.objects.filter(pk=essay.pk).update(
+                pdf_status=Essay.PdfStatus.READY, pdf_error=""
+            )
+        else:
+            Essay.objects.filter(pk=essay.pk).update(
+                pdf_status=Essay.PdfStatus.FAILED,
+                pdf_error="O PDF enviado não foi encontrado. Envie o arquivo novamente.",
+            )
+        return
+
+    # Conteúdo inalterado → reaproveita o arquivo já renderizado
+    path = generate_pdf({"titulo": essay.title, "texto": essay.text})
+
+    # Um upload feito durante a renderização prevalece
+    Essay.objects.filter(pk=essay.pk).exclude(pdf__startswith=f"{UPLOAD_DIR}/").update(
+        pdf=os.path.relpath(path, settings.MEDIA_ROOT),
+        pdf_status=Essay.PdfStatus.READY,
+        pdf_error="",
+    )
+
+
+def schedule_essay_pdf(essay_id):
+    """
+    Marca o PDF da redação como "gerando" e enfileira a renderização.
+
+    Só a partir de "sem PDF" ou "falhou": um PDF pronto (gerado ou enviado)
+    não é refeito, e chamadas repetidas não duplicam a tarefa.
+
+    Returns:
+        bool: True se a geração foi enfileirada.
+    """
+
+    scheduled = Essay.objects.filter(pk=essay_id, pdf_status__in=REGENERABLE).update(
+        pdf_status=Essay.PdfStatus.PENDING, pdf_error=""
+    )
+    if scheduled:
+        generate_essay_pdf.enqueue(
+            {"essay_id": essay_id}, key=f"dashboard.generate_pdf:{essay_id}"
+        )
+    return bool(scheduled)
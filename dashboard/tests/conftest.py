@@ -0,0 +1,32 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from essays.models import Essay
+from essays.services.correction_service import CorrectionService
+
+User = get_user_model()
+
+SCORES = {"c1": 160, "c2": 120, "c3": 160, "c4": 120, "c5": 80}
+
+
+@pytest.fixture
+def users(db):
+    """Um usuário por papel, com redações corrigidas, enviadas e rascunho."""
+
+    people = {
+        role: User.objects.create_user(
+            email=f"{role}@example.com", username=role, password="x", role=role
+        )
+        for role in ("student", "teacher", "admin")
+    }
+    for index in range(5):
+        essay = Essay.objects.create(
+            student=people["student"],
+            title=f"Redação {index}",
+            text="texto",
+            status=Essay.Status.SUBMITTED,
+        )
+        if index < 3:
+            CorrectionService.correct(essay.pk, people["teacher"], SCORES)
+    Essay.objects.create(student=people["student"], title="Rascunho", text="texto")
+    return people
@@ -0,0 +1,25 @@
+"""
+Orçamento de consultas SQL do dashboard (DashboardHomeView) por papel.
+
+Mede com o cache frio — o pior caso: as métricas em cache são recalculadas.
+Inclui as consultas da sessão e do usuário autenticado. Se um destes testes
+falhar, revise a mudança antes de aumentar o limite.
+"""
+
+import pytest
+from django.core.cache import cache
+
+# Sessão + usuário + métricas/listagens do papel (cache frio)
+QUERY_BUDGETS = {"student": 4, "teacher": 7, "admin": 5}
+
+
+@pytest.mark.parametrize("role", sorted(QUERY_BUDGETS))
+def test_dashboard_home_queries(role, users, client, django_assert_max_num_queries):
+    client.force_login(users[role])
+    cache.clear()
+
+    with django_assert_max_num_queries(QUERY_BUDGETS[role]):
+        response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.context["role"] == role
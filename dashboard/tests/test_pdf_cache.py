@@ -0,0 +1,85 @@
+"""
+Limpeza do cache de PDFs: idade, tamanho total, temporários e PDFs anexados.
+"""
+
+import os
+import time
+
+import pytest
+from django.core.management import call_command
+
+from dashboard.pdf import clean_pdf_cache
+from essays.models import Essay
+
+DAY = 86400
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.PDF_CACHE_DIR = "pdfs/rendered"
+    settings.PDF_CACHE_MAX_AGE_DAYS = 30
+    settings.PDF_CACHE_MAX_BYTES = 0
+    return tmp_path
+
+
+@pytest.fixture
+def cached(media_root):
+    """Cria um arquivo no cache com o tamanho e a idade (em dias) pedidos."""
+
+    def make(name, size=10, age_days=0):
+        path = media_root / "pdfs" / "rendered" / name[:2] / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * size)
+        mtime = time.time() - age_days * DAY
+        os.utime(path, (mtime, mtime))
+        return path
+
+    return make
+
+
+def test_removes_only_unused_files_older_than_max_age(cached, db):
+    old = cached("aa-old.pdf", age_days=40)
+    recent = cached("bb-recent.pdf", age_days=1)
+
+    result = clean_pdf_cache()
+
+    assert not old.exists()
+    assert recent.exists()
+    assert (result.files, result.bytes) == (1, 10)
+
+
+def test_keeps_pdf_attached_to_an_essay(cached, users):
+    attached = cached("cc-attached.pdf", age_days=40)
+    essay = Essay.objects.create(student=users["student"], title="T", text="x")
+    Essay.objects.filter(pk=essay.pk).update(pdf="pdfs/rendered/cc/cc-attached.pdf")
+
+    clean_pdf_cache()
+
+    assert attached.exists()
+
+
+def test_size_limit_evicts_least_recently_used_first(cached, db):
+    oldest = cached("dd-1.pdf", size=100, age_days=3)
+    middle = cached("ee-2.pdf", size=100, age_days=2)
+    newest = cached("ff-3.pdf", size=100, age_days=1)
+
+    result = clean_pdf_cache(max_bytes=250)
+
+    assert not oldest.exists()
+    assert middle.exists() and newest.exists()
+    assert result.kept_bytes == 200
+
+
+def test_removes_stale_temporaries_and_dry_run_deletes_nothing(cached, db):
+    stale = cached("gg-render.tmp", age_days=1)
+    fresh = cached("hh-render.tmp")
+    old = cached("ii-old.pdf", age_days=40)
+
+    assert clean_pdf_cache(dry_run=True).files == 2
+    assert stale.exists() and old.exists()
+
+    call_command("clean_pdf_cache")
+
+    assert not stale.exists() and not old.exists()
+    assert fresh.exists()
@@ -0,0 +1,102 @@
+"""
+Flipbook e geração de PDF: acesso por dono e PDF pronto/enviado preservado.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dashboard.tasks import generate_essay_pdf
+from essays.models import Essay
+from essays.uploads import UPLOAD_DIR
+from jobs.models import Job
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def essay(users):
+    return Essay.objects.create(student=users["student"], title="Tema", text="Texto")
+
+
+def pdf_jobs():
+    return Job.objects.filter(task="dashboard.generate_pdf")
+
+
+def flipbook(essay):
+    return reverse("dashboard:pdf-flipbook", args=[essay.pk])
+
+
+def test_other_student_gets_404_and_nothing_is_queued(essay, client):
+    other = User.objects.create_user(
+        email="outro@example.com", username="outro", password="x", role="student"
+    )
+    client.force_login(other)
+
+    assert client.get(flipbook(essay)).status_code == 404
+    assert client.post(flipbook(essay)).status_code == 404
+    assert not pdf_jobs().exists()
+
+
+def test_owner_get_queues_generation(essay, users, client):
+    client.force_login(users["student"])
+
+    assert client.get(flipbook(essay)).status_code == 200
+
+    essay.refresh_from_db()
+    assert essay.pdf_status == Essay.PdfStatus.PENDING
+    assert pdf_jobs().count() == 1
+
+
+def test_teacher_get_does_not_write(essay, users, client):
+    client.force_login(users["teacher"])
+
+    response = client.get(flipbook(essay))
+
+    assert response.status_code == 200
+    assert "Gerar PDF" in response.content.decode()
+    essay.refresh_from_db()
+    assert essay.pdf_status == Essay.PdfStatus.NONE
+    assert not pdf_jobs().exists()
+
+
+def test_ready_pdf_is_not_regenerated(essay, users, client):
+    Essay.objects.filter(pk=essay.pk).update(
+        pdf=f"{UPLOAD_DIR}/ab/scan.pdf", pdf_status=Essay.PdfStatus.READY
+    )
+    client.force_login(users["teacher"])
+    api = APIClient()
+    api.force_authenticate(users["student"])
+
+    client.post(flipbook(essay))
+    response = api.post(f"/api/essays/{essay.pk}/pdf/")
+
+    assert response.status_code == 200
+    assert response.json()["pdf_status"] == Essay.PdfStatus.READY
+    assert not pdf_jobs().exists()
+
+
+@pytest.mark.parametrize("exists", [True, False])
+def test_task_never_replaces_uploaded_pdf(exists, essay, media_root):
+    name = f"{UPLOAD_DIR}/ab/scan.pdf"
+    if exists:
+        (media_root / UPLOAD_DIR / "ab").mkdir(parents=True)
+        (media_root / name).write_bytes(b"%PDF-1.4")
+    Essay.objects.filter(pk=essay.pk).update(
+        pdf=name, pdf_status=Essay.PdfStatus.PENDING
+    )
+
+    generate_essay_pdf(essay.pk)
+
+    essay.refresh_from_db()
+    assert essay.pdf.name == name
+    assert essay.pdf_status == (
+        Essay.PdfStatus.READY if exists else Essay.PdfStatus.FAILED
+    )
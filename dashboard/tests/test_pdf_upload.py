@@ -0,0 +1,59 @@
+"""
+Envio de PDF pelo formulário: o arquivo só é gravado se a redação for criada.
+"""
+
+import os
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from essays.models import Essay
+from essays.uploads import UPLOAD_DIR
+
+PDF = b"%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n%%EOF\n"
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.THROTTLE_ENABLED = False
+    return tmp_path
+
+
+def uploaded_files(media_root):
+    """Arquivos em pdfs/uploads/ (inclusive temporários)."""
+
+    return [
+        os.path.join(root, name)
+        for root, _, names in os.walk(media_root / UPLOAD_DIR)
+        for name in names
+    ]
+
+
+def submit(client, **data):
+    pdf = SimpleUploadedFile("redacao.pdf", PDF, content_type="application/pdf")
+    return client.post(reverse("dashboard:essay-submit"), {"file": pdf, **data})
+
+
+def test_submit_stores_pdf(users, client, media_root):
+    client.force_login(users["student"])
+
+    submit(client, theme="Tema", text="Texto")
+
+    essay = Essay.objects.get(title="Tema")
+    assert essay.pdf.name.startswith(f"{UPLOAD_DIR}/")
+    assert uploaded_files(media_root) == [str(media_root / essay.pdf.name)]
+
+
+@pytest.mark.parametrize(
+    "role, data",
+    [("teacher", {"theme": "Tema", "text": "Texto"}), ("student", {"theme": "Tema"})],
+)
+def test_rejected_submit_leaves_no_file(role, data, users, client, media_root):
+    client.force_login(users[role])
+
+    submit(client, **data)
+
+    assert not Essay.objects.filter(title="Tema").exists()
+    assert uploaded_files(media_root) == []
@@ -3,6 +3,7 @@ from django.urls import path
 
 from .views import (
     DashboardHomeView,
+    EssayPDFFileView,
     EssayPDFFlipbookView,
     EssayPDFUploadView,
     StudentEssaySubmitView,
@@ -10,12 +11,14 @@ from .views import (
 
 urlpatterns = [
     path("", DashboardHomeView.as_view(), name="dashboard"),
-    path("<str:role>/", DashboardHomeView.as_view(), name="dashboard-role"),
+    # Antes de "<str:role>/", que também casaria com "pdf/"
     path("pdf/", EssayPDFUploadView.as_view(), name="pdf-upload"),
+    path("<str:role>/", DashboardHomeView.as_view(), name="dashboard-role"),
     path(
         "pdf/flipbook/<int:essay_id>/",
         EssayPDFFlipbookView.as_view(),
         name="pdf-flipbook",
     ),
+    path("pdf/file/<int:essay_id>/", EssayPDFFileView.as_view(), name="pdf-file"),
     path("essay/submit/", StudentEssaySubmitView.as_view(), name="essay-submit"),
 ]
@@ -1,56 +1,104 @@
 import requests
 from django.contrib import messages
-from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse
 from django.shortcuts import redirect, render
+from django.urls import reverse
 from django.views.generic import TemplateView, View
 
 from essays.models import Essay
+from essays.uploads import PDFUploadMixin
+from performance.models import DailyActivity
+from performance.services.rollup_service import ActivityRollupService
+from profiles.tasks import schedule_sync_counters
 
-from .pdf import generate_pdf
+from .delivery import pdf_response
 from .services import dashboard_metrics, get_dashboard_context
-
-User = get_user_model()
+from .tasks import schedule_essay_pdf
 
 
 class EssayPDFFlipbookView(LoginRequiredMixin, View):
-    def get(self, request, essay_id, *args, **kwargs):
-        import os
+    """
+    Visualiza o PDF da redação (servido por EssayPDFFileView).
+
+    - Mesma regra de acesso de EssayPDFFileView: aluno só as próprias
+      redações; professor e admin, todas.
+    - Sem PDF, na redação do próprio aluno → enfileira a geração e a página
+      consulta GET /api/essays/<id>/pdf/ até o arquivo ficar pronto. Para
+      os demais, o GET não escreve nada: a página oferece o botão "Gerar".
+    - POST → gera (ou tenta de novo após uma falha); PDF pronto não é refeito.
+    """
 
-        from django.conf import settings
-        from django.http import Http404
+    def get(self, request, essay_id, *args, **kwargs):
+        essay = self._essay(request, essay_id)
 
-        # Buscar o Essay e usar o campo pdf, se disponível
-        try:
-            essay = Essay.objects.get(id=essay_id)
-
-            if essay.pdf:
-                # Verifica se o arquivo existe
-                pdf_path = os.path.join(settings.MEDIA_ROOT, str(essay.pdf))
-                if os.path.exists(pdf_path):
-                    pdf_url = essay.pdf.url
-                else:
-                    raise Http404(
-                        f"PDF da redação #{essay_id} não encontrado. O arquivo foi removido ou não existe."
-                    )
-            else:
-                # Tenta o caminho padrão
-                pdf_path = os.path.join(settings.MEDIA_ROOT, "pdfs", f"{essay_id}.pdf")
-                if os.path.exists(pdf_path):
-                    pdf_url = f"/media/pdfs/{essay_id}.pdf"
-                else:
-                    raise Http404(
-                        f"PDF da redação #{essay_id} não foi enviado. Por favor, faça o upload do arquivo PDF primeiro."
-                    )
-
-        except Essay.DoesNotExist:
-            raise Http404(f"Redação #{essay_id} não encontrada no sistema.")
+        if (
+            essay.pdf_status == Essay.PdfStatus.NONE
+            and essay.student_id == request.user.pk
+            and schedule_essay_pdf(essay.pk)
+        ):
+            essay.pdf_status = Essay.PdfStatus.PENDING
 
         return render(
-            request, "dashboard/pdf_flipbook.html", {"pdf_url": pdf_url, "essay": essay}
+            request,
+            "dashboard/pdf_flipbook.html",
+            {
+                "essay": essay,
+                "pdf_url": (
+                    reverse("dashboard:pdf-file", args=[essay.pk])
+                    if essay.pdf_status == Essay.PdfStatus.READY
+                    else ""
+                ),
+            },
         )
 
+    def post(self, request, essay_id, *args, **kwargs):
+        essay = self._essay(request, essay_id)
+        schedule_essay_pdf(essay.pk)
+        return redirect("dashboard:pdf-flipbook", essay_id=essay.pk)
+
+    @staticmethod
+    def _essay(request, essay_id):
+        essays = Essay.objects.only(
+            "id", "student_id", "title", "pdf_status", "pdf_error"
+        )
+        if request.user.role == "student":
+            essays = essays.filter(student=request.user)
+
+        essay = essays.filter(pk=essay_id).first()
+        if essay is None:
+            raise Http404(f"Redação #{essay_id} não encontrada no sistema.")
+        return essay
+
+
+class EssayPDFFileView(LoginRequiredMixin, View):
+    """
+    Entrega o arquivo PDF da redação (iframe do flipbook e download).
+
+    - Aluno acessa apenas as próprias redações; professor e admin, todas.
+    - ETag/Last-Modified (304), Range (206) e X-Accel-Redirect opcional:
+      ver dashboard/delivery.py.
+    - Arquivo removido do disco → volta o status para "none", e o próximo
+      acesso ao flipbook gera o PDF de novo.
+    """
+
+    def get(self, request, essay_id, *args, **kwargs):
+        essays = Essay.objects.only("id", "student_id", "pdf", "pdf_status")
+        if request.user.role == "student":
+            essays = essays.filter(student=request.user)
+
+        essay = essays.filter(pk=essay_id).first()
+        if essay is None or not essay.pdf:
+            raise Http404(f"PDF da redação #{essay_id} não encontrado.")
+
+        try:
+            return pdf_response(request, essay.pdf, f"redacao-{essay.pk}.pdf")
+        except Http404:
+            Essay.objects.filter(pk=essay.pk, pdf=essay.pdf.name).update(
+                pdf_status=Essay.PdfStatus.NONE
+            )
+            raise
+
 
 class DashboardHomeView(LoginRequiredMixin, TemplateView):
     """
@@ -81,81 +129,41 @@ class DashboardHomeView(LoginRequiredMixin, TemplateView):
             }
         )
 
-        # 🔥 CONTEXTO DO DASHBOARD POR PAPEL
+        # 🔥 CONTEXTO DO DASHBOARD POR PAPEL (KPIs, listas e cards)
         ctx.update(get_dashboard_context(user, role, metrics))
 
-        # ✅ Dados adicionais para os templates, evitando lógicas diretas no HTML
-        if role == "teacher":
-            from essays.models import CompetenceScore
-
-            ctx["corrected_essays_count"] = CompetenceScore.objects.filter(
-                corrected_by=user
-            ).count()
-            ctx["pending_essays_count"] = Essay.objects.filter(status="pending").count()
-            ctx["show_teacher_cards"] = True
-
-            # Listar redações enviadas (exemplo: status=submitted ou corrected)
-            essays = (
-                Essay.objects.filter(
-                    status__in=[Essay.Status.SUBMITTED, Essay.Status.CORRECTED]
-                )
-                .select_related("student")
-                .order_by("-created_at")[:20]
-            )
-            # Adicionar campo pdf_url: prioriza o upload, senão usa caminho antigo
-            for essay in essays:
-                if essay.pdf:
-                    essay.pdf_url = essay.pdf.url
-                else:
-                    essay.pdf_url = f"/media/pdfs/{essay.id}.pdf"
-            ctx["essays"] = essays
-
-        elif role == "student":
-            ctx["corrected_essays_count"] = Essay.objects.filter(
-                student=user, status="corrected"
-            ).count()
-            ctx["pending_essays_count"] = Essay.objects.filter(
-                student=user, status="pending"
-            ).count()
-            ctx["show_student_cards"] = True
-            # Lista últimas redações do aluno (rascunhos, enviadas e corrigidas)
-            ctx["recent_essays"] = (
-                Essay.objects.filter(student=user).order_by("-created_at")
-            )[:10]
-
-        elif role == "admin":
-            ctx["corrected_essays_count"] = Essay.objects.filter(
-                status="corrected"
-            ).count()
-            ctx["pending_essays_count"] = Essay.objects.filter(status="pending").count()
-            ctx["total_users"] = User.objects.count()
-            ctx["show_admin_cards"] = True
-
         return ctx
 
 
 # View profissional para upload/envio automático de PDF
-class EssayPDFUploadView(LoginRequiredMixin, View):
-    def post(self, request, *args, **kwargs):
+class EssayPDFUploadView(PDFUploadMixin, LoginRequiredMixin, View):
+    throttle_scope = "essay_submit"
+
+    def post_upload(self, request, upload_error, *args, **kwargs):
+        if upload_error:
+            messages.error(request, upload_error)
+            return redirect("dashboard:pdf-upload")
+
         texto = request.POST.get("texto")
         titulo = request.POST.get("titulo")
         user = request.user
         pdf_file = request.FILES.get("pdf")
 
+        # PDF validado pelo PDFUploadHandler: grava agora, um único INSERT
         essay_obj = Essay(
             student=user, title=titulo, text=texto, status=Essay.Status.SUBMITTED
         )
         if pdf_file:
-            essay_obj.pdf = pdf_file
+            essay_obj.pdf = pdf_file.save()
+            essay_obj.pdf_status = Essay.PdfStatus.READY
         essay_obj.save()
+        ActivityRollupService.record(DailyActivity.Event.CREATED)
+        schedule_sync_counters(user.pk)
 
-        # Gere o PDF automaticamente se não foi enviado
+        # Gere o PDF automaticamente se não foi enviado (em segundo plano);
+        # o flipbook acompanha o status até o arquivo ficar pronto
         if not pdf_file:
-            essay_data = {"titulo": titulo, "texto": texto}
-            pdf_path = generate_pdf(essay_data, essay_id=essay_obj.id)
-            # Opcional: salvar o PDF gerado no campo pdf
-            # with open(pdf_path, 'rb') as f:
-            #     essay_obj.pdf.save(f"{essay_obj.id}.pdf", f, save=True)
+            schedule_essay_pdf(essay_obj.id)
 
         return redirect("dashboard:dashboard-role", role="teacher")
 
@@ -164,13 +172,19 @@ class EssayPDFUploadView(LoginRequiredMixin, View):
         return render(request, "dashboard/pdf_upload.html")
 
 
-class StudentEssaySubmitView(LoginRequiredMixin, View):
+class StudentEssaySubmitView(PDFUploadMixin, LoginRequiredMixin, View):
     """
     View para processar submissão de redação do aluno via formulário HTML.
     Cria a redação e redireciona de volta ao dashboard com mensagem de sucesso.
     """
 
-    def post(self, request, *args, **kwargs):
+    throttle_scope = "essay_submit"
+
+    def post_upload(self, request, upload_error, *args, **kwargs):
+        if upload_error:
+            messages.error(request, upload_error)
+            return redirect("dashboard:dashboard-role", role="student")
+
         # Verifica se o usuário é aluno
         if request.user.role != "student":
             messages.error(request, "Apenas alunos podem enviar redações.")
@@ -188,17 +202,21 @@ class StudentEssaySubmitView(LoginRequiredMixin, View):
 
         # Cria a redação
         try:
+            # PDF (se houver) validado pelo PDFUploadHandler: grava só agora,
+            # depois das validações acima, e cria com um único INSERT
             essay = Essay.objects.create(
                 student=request.user,
                 title=title,
                 text=text,
                 status=Essay.Status.SUBMITTED,  # Marca como enviado para correção
+                pdf=pdf_file.save() if pdf_file else None,
+                pdf_status=(
+                    Essay.PdfStatus.READY if pdf_file else Essay.PdfStatus.NONE
+                ),
             )
 
-            # Se houver arquivo PDF, salva
-            if pdf_file:
-                essay.pdf = pdf_file
-                essay.save()
+            ActivityRollupService.record(DailyActivity.Event.CREATED)
+            schedule_sync_counters(request.user.pk)
 
             messages.success(
                 request, f"✅ Redação '{title}' enviada com sucesso! ID: {essay.id}"
@@ -0,0 +1,17 @@
+"""
+Exceções de domínio do módulo de Redações ENEM.
+
+Herdam de APIException para que as views DRF respondam com o status
+correto sem try/except espalhado.
+"""
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class EssayConflict(APIException):
+    """A redação já foi corrigida ou está reservada por outro professor."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "Redação indisponível para correção."
+    default_code = "conflict"
@@ -0,0 +1,111 @@
+import csv
+import json
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from essays.services.submission_service import SubmissionService
+
+
+class Command(BaseCommand):
+    """
+    Importa redações em lote a partir de um arquivo CSV ou JSONL.
+
+    Uso:
+        poetry run python manage.py import_essays turma.jsonl
+        poetry run python manage.py import_essays turma.csv --batch-size=1000
+
+    Cada linha/registro precisa de:
+        title, text e "student_email" (ou "student" com o id do aluno)
+
+    O arquivo é lido em streaming: apenas um bloco fica em memória.
+    """
+
+    help = "Importa redações em lote (CSV/JSONL) usando bulk_create"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="Arquivo .csv ou .jsonl")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="Formato do arquivo (padrão: deduzido pela extensão)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.ESSAY_BULK_BATCH_SIZE,
+            help="Quantidade de redações por bloco",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"Arquivo não encontrado: {path}")
+
+        fmt = options["format"] or path.suffix.lstrip(".").lower()
+        if fmt not in ("csv", "jsonl"):
+            raise CommandError("Formato não suportado. Use --format=csv|jsonl.")
+
+        batch_size = options["batch_size"]
+        created = 0
+        failed = 0
+        offset = 0
+        started = time.perf_counter()
+
+        with path.open(encoding="utf-8", newline="") as handle:
+            records = self._read(handle, fmt)
+
+            for chunk in self._chunks(records, batch_size):
+                result = SubmissionService.bulk_submit(chunk, batch_size=batch_size)
+                created += result.created
+                failed += len(result.errors)
+
+                for error in result.errors:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"Registro {offset + error['index'] + 1}: {error['errors']}"
+                        )
+                    )
+                offset += len(chunk)
+
+        elapsed = time.perf_counter() - started
+        rate = created / elapsed if elapsed else created
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{created} redações importadas, {failed} com erro "
+                f"em {elapsed:.2f}s ({rate:.0f} redações/s)"
+            )
+        )
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    @staticmethod
+    def _read(handle, fmt):
+        if fmt == "csv":
+            yield from csv.DictReader(handle)
+            return
+
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Mantém a posição do registro: o serviço reporta como inválido
+                yield None
+
+    @staticmethod
+    def _chunks(records, size):
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
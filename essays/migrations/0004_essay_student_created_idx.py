@@ -0,0 +1,22 @@
+# Generated by Django 5.1 on 2026-10-18 10:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("essays", "0003_essay_pdf"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="essay",
+            index=models.Index(
+                fields=["student", "-created_at", "-id"],
+                name="essay_student_created_idx",
+            ),
+        ),
+    ]
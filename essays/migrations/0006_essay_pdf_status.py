@@ -0,0 +1,39 @@
+# Generated by Django 5.1 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+def mark_existing_pdfs_ready(apps, schema_editor):
+    """Redações que já têm arquivo anexado começam como 'ready'."""
+    Essay = apps.get_model("essays", "Essay")
+    Essay.objects.exclude(pdf__isnull=True).exclude(pdf="").update(pdf_status="ready")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("essays", "0005_essay_claim"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="essay",
+            name="pdf_error",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddField(
+            model_name="essay",
+            name="pdf_status",
+            field=models.CharField(
+                choices=[
+                    ("none", "Sem PDF"),
+                    ("pending", "Gerando"),
+                    ("ready", "Pronto"),
+                    ("failed", "Falhou"),
+                ],
+                default="none",
+                max_length=10,
+            ),
+        ),
+        migrations.RunPython(mark_existing_pdfs_ready, migrations.RunPython.noop),
+    ]
@@ -1,12 +1,18 @@
 from django.db import models
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
+from django.utils import timezone
 
 User = settings.AUTH_USER_MODEL
 
 
 class Essay(models.Model):
-    pdf = models.FileField(upload_to="pdfs/", null=True, blank=True, help_text="Arquivo PDF da redação (upload manual ou automático)")
+    pdf = models.FileField(
+        upload_to="pdfs/",
+        null=True,
+        blank=True,
+        help_text="Arquivo PDF da redação (upload manual ou automático)",
+    )
     """
     Redação enviada por um aluno.
     Agora funciona como a entidade "Agregadora".
@@ -17,6 +23,12 @@ class Essay(models.Model):
         SUBMITTED = "submitted", "Enviada"
         CORRECTED = "corrected", "Corrigida"
 
+    class PdfStatus(models.TextChoices):
+        NONE = "none", "Sem PDF"
+        PENDING = "pending", "Gerando"
+        READY = "ready", "Pronto"
+        FAILED = "failed", "Falhou"
+
     student = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -36,12 +48,54 @@ class Essay(models.Model):
         null=True, blank=True, help_text="Nota final ENEM (0–1000)."
     )
 
+    # Fila de correção: professor que reservou a redação e fim da reserva
+    claimed_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="claimed_essays",
+    )
+    claim_expires_at = models.DateTimeField(null=True, blank=True)
+
+    # Geração do PDF em segundo plano (dashboard.generate_pdf)
+    pdf_status = models.CharField(
+        max_length=10,
+        choices=PdfStatus.choices,
+        default=PdfStatus.NONE,
+    )
+    pdf_error = models.TextField(blank=True, default="")
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Suporta a paginação por cursor (created_at, id) da listagem do aluno
+            models.Index(
+                fields=["student", "-created_at", "-id"],
+                name="essay_student_created_idx",
+            ),
+            # Fila de correção: próximas redações enviadas em ordem de chegada
+            models.Index(
+                fields=["status", "created_at", "id"],
+                name="essay_status_created_idx",
+            ),
+        ]
+
+    def is_claimed_by_other(self, user, now=None):
+        """True se outro professor tem uma reserva ainda válida."""
+        if self.claimed_by_id is None or self.claimed_by_id == user.pk:
+            return False
+        now = now or timezone.now()
+        return self.claim_expires_at is not None and self.claim_expires_at > now
+
     def update_total(self):
         """
-        Soma das 5 competências — usado pelo signal.
+        Soma das 5 competências.
+
+        O fluxo normal usa CorrectionService; este helper serve para
+        ressincronizar manualmente (shell/admin) uma nota editada.
         """
         if hasattr(self, "competence_score"):
             self.score_total = self.competence_score.total()
@@ -55,6 +109,10 @@ class Essay(models.Model):
 class CompetenceScore(models.Model):
     """
     Notas das competências ENEM.
+
+    Grave pelo CorrectionService (deltas nas métricas, na mesma transação).
+    Saves feitos por fora são ressincronizados pelo post_save em
+    essays/signals.py, reconstruindo as métricas do aluno.
     """
 
     essay = models.OneToOneField(
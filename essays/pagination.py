@@ -0,0 +1,125 @@
+"""
+Paginação por cursor (keyset) do módulo de Redações ENEM.
+
+Por que keyset e não offset?
+- OFFSET obriga o banco a percorrer todas as linhas anteriores à página.
+- Com o cursor (created_at, id) cada página é um range scan no índice
+  essay_student_created_idx, com custo fixo independente do histórico.
+
+Formato do cursor:
+- base64 urlsafe de "<created_at ISO 8601>|<id>" da última linha entregue.
+- O cliente apenas repassa o valor de "next"; nunca precisa montá-lo.
+"""
+
+import base64
+import binascii
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class EssayKeysetPagination(BasePagination):
+    """
+    Pagina redações em ordem decrescente de (created_at, id).
+
+    Regras:
+    - Opcional: sem cursor/page_size na URL, a view devolve a lista simples
+      (formato anterior, mantido para clientes existentes).
+    - O queryset recebido DEVE estar ordenado por ("-created_at", "-id").
+    - page_size pode ser ajustado pelo cliente até max_page_size.
+    - Busca page_size + 1 linhas para saber se existe próxima página
+      sem precisar de COUNT(*).
+    """
+
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Cursor inválido."
+
+    def is_requested(self, request):
+        """Paginação opcional: só com ?cursor= ou ?page_size= na URL."""
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None  # resposta antiga: lista simples
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            created_at, pk = position
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            )
+
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(last.created_at, last.id)
+        )
+
+    @staticmethod
+    def encode_cursor(created_at, pk):
+        raw = f"{created_at.isoformat()}|{pk}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            created_raw, pk_raw = raw.rsplit("|", 1)
+            created_at = parse_datetime(created_raw)
+            pk = int(pk_raw)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return created_at, pk
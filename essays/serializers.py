@@ -12,6 +12,7 @@ Padrões aplicados:
 - Pronto para integrações com React + Vite.
 """
 
+from django.urls import reverse
 from rest_framework import serializers
 from .models import Essay, CompetenceScore
 
@@ -38,6 +39,7 @@ class EssaySerializer(serializers.ModelSerializer):
             "text",
             "status",  # somente leitura
             "score_total",  # somente leitura
+            "pdf_status",  # somente leitura
             "created_at",
             "updated_at",
         ]
@@ -47,13 +49,122 @@ class EssaySerializer(serializers.ModelSerializer):
             "student",
             "status",
             "score_total",
+            "pdf_status",
             "created_at",
             "updated_at",
         ]
 
 
 # ==========================================================
-# 2. CompetenceScoreSerializer
+# 2. EssayListSerializer
+# ==========================================================
+class EssayListSerializer(serializers.ModelSerializer):
+    """
+    Projeção enxuta usada nas listagens paginadas.
+
+    Observações:
+    - NÃO inclui 'text': o corpo da redação é buscado em /api/essays/<id>/.
+    - Mantém o payload de cada página com tamanho previsível.
+    """
+
+    class Meta:
+        model = Essay
+        fields = [
+            "id",
+            "title",
+            "status",
+            "score_total",
+            "pdf_status",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
+# ==========================================================
+# 3. EssayQueueSerializer
+# ==========================================================
+class EssayQueueSerializer(EssaySerializer):
+    """
+    Redação entregue pela fila de correção (inclui o fim da reserva).
+    """
+
+    class Meta(EssaySerializer.Meta):
+        fields = EssaySerializer.Meta.fields + ["claim_expires_at"]
+        read_only_fields = fields
+
+
+class EssayQueueClaimSerializer(serializers.Serializer):
+    """Body de POST /api/essays/queue/claim/: {"count": 5}."""
+
+    count = serializers.IntegerField(min_value=1, default=1)
+
+
+class EssayQueueReleaseSerializer(serializers.Serializer):
+    """Body de POST /api/essays/queue/release/: {"essay_ids": [1, 2, 3]}."""
+
+    essay_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=True
+    )
+
+
+# ==========================================================
+# 3.1 EssayPDFSerializer
+# ==========================================================
+class EssayPDFSerializer(serializers.ModelSerializer):
+    """
+    Status da geração do PDF (consultado pelo flipbook até ficar pronto).
+
+    - pdf_url só é preenchido com pdf_status = "ready".
+    - pdf_error traz a última linha do erro quando pdf_status = "failed".
+    """
+
+    pdf_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Essay
+        fields = ["id", "pdf_status", "pdf_error", "pdf_url"]
+        read_only_fields = fields
+
+    def get_pdf_url(self, obj):
+        if obj.pdf_status != Essay.PdfStatus.READY or not obj.pdf:
+            return None
+        return reverse("dashboard:pdf-file", args=[obj.pk])
+
+
+# ==========================================================
+# 3.2 EssayExportQuerySerializer
+# ==========================================================
+class EssayExportQuerySerializer(serializers.Serializer):
+    """
+    Valida os parâmetros de GET /api/essays/export/.
+
+    - output: zip (um PDF por redação) | pdf (documento único)
+    - student: id do aluno (opcional)
+    - start / end: datas locais de envio, inclusive (opcionais)
+    - status: status da redação (padrão: corrected)
+
+    Obs.: o parâmetro se chama 'output' porque 'format' é reservado pelo DRF.
+    """
+
+    output = serializers.ChoiceField(choices=["zip", "pdf"], default="zip")
+    student = serializers.IntegerField(required=False, min_value=1)
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    status = serializers.ChoiceField(
+        choices=Essay.Status.choices, default=Essay.Status.CORRECTED
+    )
+
+    def validate(self, attrs):
+        if attrs.get("start") and attrs.get("end") and attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError(
+                {"start": "A data inicial deve ser anterior à final."}
+            )
+        return attrs
+
+
+# ==========================================================
+# 4. CompetenceScoreSerializer
 # ==========================================================
 class CompetenceScoreSerializer(serializers.ModelSerializer):
     """
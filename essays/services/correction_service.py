@@ -0,0 +1,359 @@
+"""
+Service Layer responsável pela correção de redações.
+
+Usado por:
+- EssayCorrectionView → POST /api/essays/<id>/correct/
+- EssayBulkCorrectionView → POST /api/essays/correct/bulk/
+- EssayQueueCorrectView → POST /api/essays/queue/<id>/correct/
+
+É o caminho de escrita de CompetenceScore: redação, nota, histórico e
+métricas agregadas são atualizados juntos, na mesma transação. As notas
+gravadas aqui saem marcadas (SERVICE_WRITE); as gravadas por fora (shell,
+correções de dados) são ressincronizadas pelo signal em essays/signals.py.
+"""
+
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import Http404
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import as_serializer_error
+
+from essays.exceptions import EssayConflict
+from essays.models import CompetenceScore, Essay
+from essays.serializers import CompetenceScoreSerializer
+from performance.models import CompetenceHistory, DailyActivity
+from performance.services.counter_service import CounterService
+from performance.services.metrics_cache import MetricsCache
+from performance.services.performance_service import PerformanceService
+from performance.services.rollup_service import ActivityRollupService
+from profiles.tasks import schedule_sync_counters
+
+COMPETENCES = ("c1", "c2", "c3", "c4", "c5")
+
+# Atributo que marca a nota salva pelo serviço (o signal não ressincroniza)
+SERVICE_WRITE = "_service_write"
+
+
+@dataclass
+class BulkCorrectionResult:
+    """Resultado de uma correção em lote."""
+
+    corrected_ids: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+    @property
+    def corrected(self):
+        return len(self.corrected_ids)
+
+    def as_dict(self):
+        return {
+            "corrected": self.corrected,
+            "essay_ids": self.corrected_ids,
+            "errors": self.errors,
+        }
+
+
+class CorrectionService:
+    """
+    Camada de serviço para gravar correções com o mínimo de comandos SQL.
+
+    Recorreção (regrade): UPDATE da nota + deltas nas métricas.
+
+    Unitária (correct), por transação:
+    - 1 SELECT ... FOR UPDATE da redação (somente colunas necessárias)
+    - 1 INSERT de CompetenceScore + 1 UPDATE de Essay
+    - PerformanceService.update_all_metrics (histórico + agregados)
+
+    Em lote, por transação:
+    - 1 SELECT das redações + 1 SELECT das notas já existentes
+    - INSERT em lote de CompetenceScore e CompetenceHistory
+    - UPDATE em lote de Essay (status + score_total)
+    - 1 UPDATE dos contadores globais (PlatformCounter)
+    - métricas agregadas recalculadas UMA vez por aluno afetado
+    """
+
+    @staticmethod
+    def correct(essay_id, teacher, scores) -> CompetenceScore:
+        """
+        Corrige UMA redação.
+
+        Args:
+            essay_id: id da redação.
+            teacher: usuário que está corrigindo.
+            scores: dict validado com c1..c5.
+
+        Raises:
+            Http404: redação inexistente.
+            EssayConflict: já corrigida ou reservada por outro professor.
+        """
+
+        values = {name: scores[name] for name in COMPETENCES}
+
+        with transaction.atomic():
+            essay = (
+                Essay.objects.select_for_update()
+                .only(
+                    "id",
+                    "student_id",
+                    "status",
+                    "claimed_by_id",
+                    "claim_expires_at",
+                )
+                .filter(pk=essay_id)
+                .first()
+            )
+            if essay is None:
+                raise Http404("Redação não encontrada.")
+
+            now = timezone.now()
+            if essay.status == Essay.Status.CORRECTED:
+                raise EssayConflict("Redação já corrigida.")
+            if essay.is_claimed_by_other(teacher, now):
+                raise EssayConflict("Redação reservada por outro professor.")
+
+            competence = CorrectionService._create_score(essay, teacher, values)
+
+            CounterService.essay_status_changed(
+                [(essay.status, Essay.Status.CORRECTED)]
+            )
+            essay.status = Essay.Status.CORRECTED
+            essay.score_total = competence.total()
+            Essay.objects.filter(pk=essay.pk).update(
+                status=essay.status,
+                score_total=essay.score_total,
+                claimed_by=None,
+                claim_expires_at=None,
+                updated_at=now,
+            )
+
+            PerformanceService.update_all_metrics(essay, competence)
+            ActivityRollupService.record(
+                DailyActivity.Event.CORRECTED, teacher_id=teacher.pk, moment=now
+            )
+            schedule_sync_counters(teacher.pk)
+
+        return competence
+
+    @staticmethod
+    def _create_score(essay, teacher, values) -> CompetenceScore:
+        """
+        INSERT da nota em um savepoint próprio.
+
+        Só a violação do OneToOne (nota criada por outra transação entre o
+        SELECT e o INSERT) vira EssayConflict; qualquer outro IntegrityError
+        da correção propaga como erro.
+        """
+
+        competence = CompetenceScore(essay=essay, corrected_by=teacher, **values)
+        setattr(competence, SERVICE_WRITE, True)
+        try:
+            with transaction.atomic():
+                competence.save(force_insert=True)
+        except IntegrityError:
+            raise EssayConflict("Redação já corrigida.")
+        return competence
+
+    @staticmethod
+    def regrade(essay_id, teacher, scores) -> CompetenceScore:
+        """
+        Altera as notas de uma redação já corrigida.
+
+        As métricas do aluno recebem apenas a diferença (nova − antiga),
+        sem recalcular o histórico inteiro.
+        """
+
+        values = {name: scores[name] for name in COMPETENCES}
+
+        with transaction.atomic():
+            competence = (
+                CompetenceScore.objects.select_for_update()
+                .select_related("essay")
+                .filter(essay_id=essay_id)
+                .first()
+            )
+            if competence is None:
+                raise Http404("Correção não encontrada.")
+
+            previous = PerformanceService.scores_of(competence)
+            for name, value in values.items():
+                setattr(competence, name, value)
+            competence.corrected_by = teacher
+            setattr(competence, SERVICE_WRITE, True)
+            competence.save(update_fields=[*COMPETENCES, "corrected_by"])
+
+            essay = competence.essay
+            essay.score_total = competence.total()
+            Essay.objects.filter(pk=essay.pk).update(
+                score_total=essay.score_total, updated_at=timezone.now()
+            )
+
+            PerformanceService.update_all_metrics(essay, competence, previous)
+
+        return competence
+
+    @staticmethod
+    def bulk_correct(rows, teacher, batch_size=None) -> BulkCorrectionResult:
+        """
+        Corrige várias redações em uma única transação.
+
+        Args:
+            rows: sequência de dicts {"essay_id", "c1", ..., "c5"}.
+            teacher: usuário que está corrigindo.
+            batch_size: tamanho de cada INSERT/UPDATE em lote.
+        """
+
+        batch_size = batch_size or settings.ESSAY_BULK_BATCH_SIZE
+        result = BulkCorrectionResult()
+
+        # Uma única instância: os campos do serializer são montados uma só vez
+        validator = CompetenceScoreSerializer()
+
+        validated = {}
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                result.errors.append(
+                    {"index": index, "errors": {"non_field_errors": ["Item inválido."]}}
+                )
+                continue
+
+            try:
+                essay_id = int(row.get("essay_id"))
+            except (TypeError, ValueError):
+                result.errors.append(
+                    {"index": index, "errors": {"essay_id": ["ID inválido."]}}
+                )
+                continue
+
+            if essay_id in validated:
+                result.errors.append(
+                    {"index": index, "errors": {"essay_id": ["ID repetido no lote."]}}
+                )
+                continue
+
+            try:
+                scores = validator.run_validation(row)
+            except ValidationError as exc:
+                result.errors.append(
+                    {"index": index, "errors": as_serializer_error(exc)}
+                )
+                continue
+
+            validated[essay_id] = (index, scores)
+
+        if not validated:
+            return result
+
+        with transaction.atomic():
+            essays = (
+                Essay.objects.select_for_update()
+                .only("id", "student_id", "status", "claimed_by_id", "claim_expires_at")
+                .in_bulk(list(validated))
+            )
+            already_corrected = set(
+                CompetenceScore.objects.filter(essay_id__in=list(essays)).values_list(
+                    "essay_id", flat=True
+                )
+            )
+
+            now = timezone.now()
+            scores = []
+            history = []
+            to_update = []
+            students = {}
+            transitions = []
+
+            for essay_id, (index, data) in validated.items():
+                essay = essays.get(essay_id)
+                if essay is None:
+                    result.errors.append(
+                        {
+                            "index": index,
+                            "errors": {"essay_id": ["Redação não encontrada."]},
+                        }
+                    )
+                    continue
+
+                if essay_id in already_corrected:
+                    result.errors.append(
+                        {
+                            "index": index,
+                            "errors": {"essay_id": ["Redação já corrigida."]},
+                        }
+                    )
+                    continue
+
+                if essay.is_claimed_by_other(teacher, now):
+                    result.errors.append(
+                        {
+                            "index": index,
+                            "errors": {
+                                "essay_id": ["Redação reservada por outro professor."]
+                            },
+                        }
+                    )
+                    continue
+
+                values = {name: data[name] for name in COMPETENCES}
+
+                scores.append(
+                    CompetenceScore(essay_id=essay_id, corrected_by=teacher, **values)
+                )
+                history.append(
+                    CompetenceHistory(
+                        student_id=essay.student_id, essay_id=essay_id, **values
+                    )
+                )
+
+                transitions.append((essay.status, Essay.Status.CORRECTED))
+                essay.status = Essay.Status.CORRECTED
+                essay.score_total = sum(values.values())
+                essay.updated_at = now
+                essay.claimed_by = None
+                essay.claim_expires_at = None
+                to_update.append(essay)
+
+                totals = students.setdefault(
+                    essay.student_id,
+                    {"count": 0, "sums": dict.fromkeys(COMPETENCES, 0)},
+                )
+                totals["count"] += 1
+                for name, value in values.items():
+                    totals["sums"][name] += value
+
+                result.corrected_ids.append(essay_id)
+
+            CompetenceScore.objects.bulk_create(scores, batch_size=batch_size)
+            CompetenceHistory.objects.bulk_create(history, batch_size=batch_size)
+            Essay.objects.bulk_update(
+                to_update,
+                [
+                    "status",
+                    "score_total",
+                    "updated_at",
+                    "claimed_by",
+                    "claim_expires_at",
+                ],
+                batch_size=batch_size,
+            )
+
+            for student_id, totals in students.items():
+                PerformanceService.record_bulk_corrections(
+                    student_id, totals["sums"], totals["count"], now
+                )
+
+            if result.corrected_ids:
+                ActivityRollupService.record(
+                    DailyActivity.Event.CORRECTED,
+                    result.corrected,
+                    teacher_id=teacher.pk,
+                    moment=now,
+                )
+                CounterService.essay_status_changed(transitions)
+                schedule_sync_counters(teacher.pk)
+                transaction.on_commit(MetricsCache.invalidate)
+
+        result.errors.sort(key=lambda error: error["index"])
+        return result
@@ -0,0 +1,135 @@
+"""
+Service Layer da exportação de redações da turma.
+
+Usado por:
+- EssayExportView → GET /api/essays/export/
+
+Formatos:
+- ZIP: um PDF por redação, renderizados na própria requisição e enviados
+  ao cliente um a um (entradas sem compressão, escritas em um ZipFile sem
+  seek). A memória fica limitada a uma redação por vez, independentemente
+  do tamanho da exportação. Os PDFs passam pelo cache de renderização
+  (dashboard/pdf.py): redações já exportadas ou abertas no flipbook não são
+  renderizadas de novo.
+- PDF único: um documento WeasyPrint com uma redação por página, gravado em
+  um arquivo temporário anônimo (some quando a resposta fecha o arquivo) —
+  nunca no cache, onde cada combinação de filtros viraria um arquivo novo.
+"""
+
+import tempfile
+import zipfile
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.utils.text import slugify
+
+from dashboard.pdf import generate_pdf, render_pdf_to_file
+from essays.models import Essay
+
+MERGED_TEMPLATE = "pdf/export.html"
+
+
+class _ZipStream:
+    """Destino do ZipFile: acumula os bytes escritos até serem enviados."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+class EssayExportService:
+    """Monta exportações em lote das redações filtradas."""
+
+    @staticmethod
+    def queryset(student_id=None, start=None, end=None, status=None):
+        """Redações filtradas por aluno, período (datas locais) e status."""
+
+        queryset = Essay.objects.all()
+        if student_id:
+            queryset = queryset.filter(student_id=student_id)
+        if status:
+            queryset = queryset.filter(status=status)
+
+        tz = ZoneInfo(settings.TIME_ZONE)
+        if start:
+            queryset = queryset.filter(
+                created_at__gte=datetime.combine(start, time.min, tzinfo=tz)
+            )
+        if end:
+            queryset = queryset.filter(
+                created_at__lte=datetime.combine(end, time.max, tzinfo=tz)
+            )
+        return queryset.order_by("student_id", "created_at", "id")
+
+    @staticmethod
+    def stream_zip(queryset):
+        """
+        Gera os bytes do ZIP (um PDF por redação) à medida que as entradas
+        ficam prontas — para usar em StreamingHttpResponse.
+        """
+
+        stream = _ZipStream()
+        with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_STORED) as archive:
+            for row in EssayExportService._rows(queryset):
+                path = generate_pdf(EssayExportService._context(row))
+                # PDF já é comprimido: ZIP_STORED evita gastar CPU à toa
+                archive.write(path, EssayExportService._entry_name(row))
+                yield stream.pop()
+        yield stream.pop()  # diretório central do ZIP
+
+    @staticmethod
+    def merged_pdf(queryset):
+        """
+        PDF único (uma redação por página) em um arquivo temporário aberto,
+        posicionado no início. Fechá-lo (o FileResponse fecha ao terminar a
+        resposta) apaga o arquivo.
+        """
+
+        essays = [
+            {
+                "titulo": row["title"],
+                "texto": row["text"],
+                "aluno": row["student__email"],
+            }
+            for row in EssayExportService._rows(queryset)
+        ]
+        output = tempfile.TemporaryFile(suffix=".pdf")
+        try:
+            render_pdf_to_file(MERGED_TEMPLATE, {"essays": essays}, output)
+        except BaseException:
+            output.close()
+            raise
+        output.seek(0)
+        return output
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    @staticmethod
+    def _rows(queryset):
+        """Somente as colunas usadas, lidas em blocos (memória constante)."""
+        return queryset.values("id", "title", "text", "student__email").iterator(
+            chunk_size=200
+        )
+
+    @staticmethod
+    def _context(row):
+        # Mesmo contexto do flipbook → mesmo hash no cache de renderização
+        return {"titulo": row["title"], "texto": row["text"]}
+
+    @staticmethod
+    def _entry_name(row):
+        title = slugify(row["title"])[:60] or "redacao"
+        return f"{row['student__email']}/{row['id']}-{title}.pdf"
@@ -0,0 +1,112 @@
+"""
+Service Layer da fila de correção.
+
+Professores reservam (claim) as próximas redações enviadas por um tempo
+limitado (lease). Enquanto a reserva vale, nenhum outro professor recebe
+a mesma redação — o que elimina as colisões no OneToOne de CompetenceScore.
+
+Estratégia por banco:
+- PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED → professores concorrentes
+  pulam as linhas já travadas em vez de esperar por elas.
+- SQLite: um único UPDATE ... WHERE id IN (SELECT ... LIMIT n) → atômico,
+  pois o SQLite serializa escritores.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from essays.models import Essay
+
+
+class CorrectionQueueService:
+    """Reserva, libera e consulta redações da fila de correção."""
+
+    @staticmethod
+    def claimable(now):
+        """Redações enviadas sem reserva válida."""
+        return Q(status=Essay.Status.SUBMITTED) & (
+            Q(claim_expires_at__isnull=True) | Q(claim_expires_at__lte=now)
+        )
+
+    @staticmethod
+    def claim(teacher, count=1, lease=None):
+        """
+        Reserva até `count` redações para o professor.
+
+        Returns:
+            list[Essay]: redações reservadas, em ordem de chegada (vazia
+            com count < 1).
+        """
+
+        if count < 1:
+            return []
+        count = min(count, settings.ESSAY_CLAIM_MAX_BATCH)
+        lease = lease or timedelta(minutes=settings.ESSAY_CLAIM_LEASE_MINUTES)
+
+        now = timezone.now()
+        expires_at = now + lease
+        candidates = (
+            Essay.objects.filter(CorrectionQueueService.claimable(now))
+            .order_by("created_at", "id")
+            .values_list("id", flat=True)
+        )
+
+        with transaction.atomic():
+            if connection.features.has_select_for_update_skip_locked:
+                ids = list(candidates.select_for_update(skip_locked=True)[:count])
+                Essay.objects.filter(id__in=ids).update(
+                    claimed_by=teacher, claim_expires_at=expires_at
+                )
+            else:
+                Essay.objects.filter(id__in=candidates[:count]).filter(
+                    CorrectionQueueService.claimable(now)
+                ).update(claimed_by=teacher, claim_expires_at=expires_at)
+
+        # expires_at identifica exatamente as linhas reservadas nesta chamada
+        return list(
+            Essay.objects.filter(claimed_by=teacher, claim_expires_at=expires_at)
+            .select_related("student")
+            .order_by("created_at", "id")
+        )
+
+    @staticmethod
+    def active_claims(teacher, limit=None):
+        """Reservas ainda válidas do professor, em ordem de chegada."""
+
+        queryset = (
+            Essay.objects.filter(
+                status=Essay.Status.SUBMITTED,
+                claimed_by=teacher,
+                claim_expires_at__gt=timezone.now(),
+            )
+            .select_related("student")
+            .order_by("created_at", "id")
+        )
+        return list(queryset[:limit] if limit else queryset)
+
+    @staticmethod
+    def next_for(teacher):
+        """
+        Próxima redação do professor: uma reserva ativa ou uma nova reserva.
+        """
+
+        claims = CorrectionQueueService.active_claims(teacher, limit=1)
+        if claims:
+            return claims[0]
+
+        claimed = CorrectionQueueService.claim(teacher, count=1)
+        return claimed[0] if claimed else None
+
+    @staticmethod
+    def release(teacher, essay_ids):
+        """Devolve as redações à fila. Retorna quantas foram liberadas."""
+
+        return Essay.objects.filter(
+            id__in=essay_ids,
+            claimed_by=teacher,
+            status=Essay.Status.SUBMITTED,
+        ).update(claimed_by=None, claim_expires_at=None)
@@ -0,0 +1,182 @@
+"""
+Service Layer responsável pela submissão de redações em lote.
+
+Usado por:
+- EssayBatchCreateView → POST /api/essays/batch/
+- manage.py import_essays → importação de turmas (CSV/JSONL)
+"""
+
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import as_serializer_error
+
+from essays.models import Essay
+from essays.serializers import EssaySerializer
+from performance.models import DailyActivity
+from performance.services.counter_service import CounterService
+from performance.services.metrics_cache import MetricsCache
+from performance.services.rollup_service import ActivityRollupService
+from profiles.tasks import schedule_sync_counters
+
+User = get_user_model()
+
+
+@dataclass
+class BulkSubmitResult:
+    """Resultado de um lote: ids criados e erros indexados pela posição do item."""
+
+    created_ids: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+    @property
+    def created(self):
+        return len(self.created_ids)
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "ids": self.created_ids,
+            "errors": self.errors,
+        }
+
+
+class SubmissionService:
+    """
+    Camada de serviço para criar muitas redações com poucos INSERTs.
+
+    Fluxo:
+    1. Valida cada item com EssaySerializer (mesmas regras da API unitária).
+    2. Resolve os alunos com UMA consulta (ids + emails).
+    3. Insere com bulk_create em blocos de ESSAY_BULK_BATCH_SIZE.
+    4. Enfileira a atualização dos contadores de perfil (runworker).
+    """
+
+    @staticmethod
+    def bulk_submit(items, student=None, batch_size=None) -> BulkSubmitResult:
+        """
+        Cria redações com status SUBMITTED.
+
+        Args:
+            items: sequência de dicts com title, text e — quando `student`
+                não é informado — "student" (id) ou "student_email".
+            student: aluno dono de TODOS os itens (envio do próprio aluno).
+            batch_size: tamanho de cada INSERT em lote.
+        """
+
+        batch_size = batch_size or settings.ESSAY_BULK_BATCH_SIZE
+        result = BulkSubmitResult()
+
+        # Uma única instância: os campos do serializer são montados uma só vez
+        validator = EssaySerializer()
+
+        validated = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                result.errors.append(
+                    {"index": index, "errors": {"non_field_errors": ["Item inválido."]}}
+                )
+                continue
+
+            try:
+                data = validator.run_validation(item)
+            except ValidationError as exc:
+                result.errors.append(
+                    {"index": index, "errors": as_serializer_error(exc)}
+                )
+                continue
+
+            validated.append((index, item, data))
+
+        students = None
+        if student is None:
+            students = SubmissionService._resolve_students(
+                [item for _, item, _ in validated]
+            )
+
+        essays = []
+        for index, item, data in validated:
+            owner_id = (
+                student.pk if student else SubmissionService._student_id(item, students)
+            )
+            if owner_id is None:
+                result.errors.append(
+                    {"index": index, "errors": {"student": ["Aluno não encontrado."]}}
+                )
+                continue
+
+            essays.append(
+                Essay(
+                    student_id=owner_id,
+                    title=data["title"],
+                    text=data["text"],
+                    status=Essay.Status.SUBMITTED,
+                )
+            )
+
+        with transaction.atomic():
+            for start in range(0, len(essays), batch_size):
+                chunk = Essay.objects.bulk_create(essays[start : start + batch_size])
+                result.created_ids.extend(essay.pk for essay in chunk)
+
+            ActivityRollupService.record(DailyActivity.Event.CREATED, len(essays))
+            CounterService.essays_created(Essay.Status.SUBMITTED, len(essays))
+            transaction.on_commit(MetricsCache.invalidate)
+
+            # Contadores do perfil ficam para o worker (1 tarefa por aluno,
+            # enfileiradas com 1 consulta + 1 INSERT)
+            schedule_sync_counters(*(essay.student_id for essay in essays))
+
+        return result
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    @staticmethod
+    def _resolve_students(items):
+        """Mapeia ids e emails informados para ids de alunos (1 consulta)."""
+
+        ids = set()
+        emails = set()
+        for item in items:
+            if item.get("student_email"):
+                emails.add(str(item["student_email"]).strip().lower())
+            elif item.get("student") not in (None, ""):
+                try:
+                    ids.add(int(item["student"]))
+                except (TypeError, ValueError):
+                    continue
+
+        if not ids and not emails:
+            return {"ids": set(), "emails": {}}
+
+        # email__in diferencia maiúsculas: compara o email em minúsculas
+        rows = (
+            User.objects.filter(role="student")
+            .annotate(email_lower=Lower("email"))
+            .filter(Q(pk__in=ids) | Q(email_lower__in=emails))
+        )
+
+        found_ids = set()
+        found_emails = {}
+        for pk, email in rows.values_list("pk", "email"):
+            found_ids.add(pk)
+            found_emails[email.lower()] = pk
+
+        return {"ids": found_ids, "emails": found_emails}
+
+    @staticmethod
+    def _student_id(item, students):
+        if item.get("student_email"):
+            return students["emails"].get(str(item["student_email"]).strip().lower())
+
+        try:
+            pk = int(item.get("student"))
+        except (TypeError, ValueError):
+            return None
+        return pk if pk in students["ids"] else None
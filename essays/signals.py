@@ -1,12 +1,71 @@
-from django.db.models.signals import post_save
+"""
+Signals do módulo de Redações ENEM.
+
+CorrectionService grava CompetenceScore, Essay e as métricas de desempenho
+na mesma transação e marca as notas que salva (SERVICE_WRITE): para elas o
+post_save não faz nada, evitando o segundo save da redação.
+
+Aqui fica o que não passa pelo serviço:
+- notas criadas/editadas por fora (shell, correções de dados): a redação é
+  ressincronizada e as métricas do aluno reconstruídas;
+- a remoção de notas (admin, shell ou cascata ao apagar a redação).
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from .models import CompetenceScore
+
+from performance.services.counter_service import CounterService
+from performance.services.metrics_cache import MetricsCache
+from performance.services.performance_service import PerformanceService
+from performance.services.rebuild_service import PerformanceRebuildService
+
+from .models import CompetenceScore, Essay
+from .services.correction_service import SERVICE_WRITE
 
 
 @receiver(post_save, sender=CompetenceScore)
-def update_essay_score(sender, instance, **kwargs):
+def sync_essay_on_external_save(sender, instance, raw=False, **kwargs):
     """
-    Sempre que as competências forem criadas/alteradas,
-    a nota total da redação é atualizada automaticamente.
+    Nota salva fora do CorrectionService: nota total e status da redação,
+    contadores globais e histórico/agregados do aluno (reconstruídos do zero
+    — caminho raro, sem deltas).
     """
-    instance.essay.update_total()
+    if raw or getattr(instance, SERVICE_WRITE, False):
+        return
+
+    essay = (
+        Essay.objects.filter(pk=instance.essay_id)
+        .only("id", "student_id", "status")
+        .first()
+    )
+    if essay is None:
+        return
+
+    CounterService.essay_status_changed([(essay.status, Essay.Status.CORRECTED)])
+    Essay.objects.filter(pk=essay.pk).update(
+        score_total=instance.total(), status=Essay.Status.CORRECTED
+    )
+    PerformanceRebuildService.rebuild_students([essay.student_id])
+    transaction.on_commit(MetricsCache.invalidate)
+
+
+@receiver(post_delete, sender=CompetenceScore)
+def revert_performance_on_delete(sender, instance, **kwargs):
+    """
+    Remove o ponto do histórico e a contribuição da nota apagada das somas
+    do aluno (O(1)).
+    """
+    PerformanceService.delete_competence_history(instance.essay_id)
+
+    student_id = (
+        Essay.objects.filter(pk=instance.essay_id)
+        .values_list("student_id", flat=True)
+        .first()
+    )
+    if student_id is None:
+        return
+
+    PerformanceService.revert_metrics(
+        student_id, PerformanceService.scores_of(instance), instance.corrected_at
+    )
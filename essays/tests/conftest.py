@@ -0,0 +1,37 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from essays.models import Essay
+
+User = get_user_model()
+
+
+@pytest.fixture
+def scores():
+    return {"c1": 160, "c2": 120, "c3": 160, "c4": 120, "c5": 80}
+
+
+@pytest.fixture
+def student(db):
+    return User.objects.create_user(
+        email="aluno@example.com", username="aluno", password="x", role="student"
+    )
+
+
+@pytest.fixture
+def teacher(db):
+    return User.objects.create_user(
+        email="prof@example.com", username="prof", password="x", role="teacher"
+    )
+
+
+@pytest.fixture
+def submit(db):
+    """Cria uma redação enviada (status SUBMITTED) para o aluno."""
+
+    def create(student, title="Redação"):
+        return Essay.objects.create(
+            student=student, title=title, text="texto", status=Essay.Status.SUBMITTED
+        )
+
+    return create
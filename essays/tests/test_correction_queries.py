@@ -0,0 +1,48 @@
+"""
+Orçamento de consultas SQL de CorrectionService.correct().
+
+Se um destes testes falhar, alguma mudança acrescentou comandos ao caminho
+da correção: revise antes de aumentar o limite.
+"""
+
+from essays.models import Essay
+from essays.services.correction_service import CorrectionService
+from performance.models import CompetenceHistory, MonthlyEvolution, StudentPerformance
+
+# Primeira correção do aluno (e do dia): performance, mês e contadores
+# diários ainda não existem → INSERTs com savepoints
+FIRST_CORRECTION_BUDGET = 28
+# Aluno com correções no mês, dia já iniciado: só UPDATEs nas agregações
+# (inclui SAVEPOINT/RELEASE da transação e do INSERT da nota)
+STEADY_STATE_BUDGET = 14
+
+
+def test_first_correction_of_student(
+    student, teacher, submit, scores, django_assert_max_num_queries
+):
+    essay = submit(student)
+
+    with django_assert_max_num_queries(FIRST_CORRECTION_BUDGET):
+        CorrectionService.correct(essay.pk, teacher, scores)
+
+    essay.refresh_from_db()
+    assert essay.status == Essay.Status.CORRECTED
+    assert essay.score_total == sum(scores.values())
+    assert StudentPerformance.objects.get(student=student).total_essays_corrected == 1
+    assert CompetenceHistory.objects.filter(essay=essay).count() == 1
+    assert MonthlyEvolution.objects.get(student=student).essays_count == 1
+
+
+def test_steady_state_correction(
+    student, teacher, submit, scores, django_assert_max_num_queries
+):
+    CorrectionService.correct(submit(student, "Primeira").pk, teacher, scores)
+    essay = submit(student, "Segunda")
+
+    with django_assert_max_num_queries(STEADY_STATE_BUDGET):
+        CorrectionService.correct(essay.pk, teacher, scores)
+
+    performance = StudentPerformance.objects.get(student=student)
+    assert performance.total_essays_corrected == 2
+    assert performance.average_score == sum(scores.values())
+    assert MonthlyEvolution.objects.get(student=student).essays_count == 2
@@ -0,0 +1,85 @@
+"""
+Exportação da turma: renderização na própria requisição e PDF único em
+arquivo temporário (fora do cache de renderização).
+"""
+
+import io
+import sys
+import types
+import zipfile
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from essays.services import export_service
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path / "media")
+    return tmp_path / "media"
+
+
+@pytest.fixture(autouse=True)
+def weasyprint(monkeypatch):
+    """WeasyPrint falso: as bibliotecas nativas não são necessárias no teste."""
+
+    class HTML:
+        def __init__(self, string):
+            self.string = string
+
+        def write_pdf(self, target):
+            target.write(b"%PDF-" + self.string.encode())
+
+    monkeypatch.setitem(sys.modules, "weasyprint", types.SimpleNamespace(HTML=HTML))
+
+
+@pytest.fixture
+def api(teacher):
+    client = APIClient()
+    client.force_authenticate(teacher)
+    return client
+
+
+@pytest.fixture
+def essays(student, submit):
+    return [submit(student, title=f"Tema {index}") for index in range(3)]
+
+
+def export(api, output):
+    return api.get(
+        reverse("essays:essay-export"), {"output": output, "status": "submitted"}
+    )
+
+
+def test_merged_pdf_uses_a_temporary_file_outside_the_cache(
+    api, essays, media_root, monkeypatch
+):
+    opened = []
+    temporary_file = export_service.tempfile.TemporaryFile
+
+    def track(*args, **kwargs):
+        opened.append(temporary_file(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(export_service.tempfile, "TemporaryFile", track)
+
+    response = export(api, "pdf")
+    body = b"".join(response.streaming_content)
+    response.close()
+
+    assert response.status_code == 200
+    assert body.startswith(b"%PDF-") and b"Tema 2" in body
+    assert not media_root.exists()  # nada gravado no cache
+    assert len(opened) == 1 and opened[0].closed
+
+
+def test_zip_streams_one_cached_pdf_per_essay(api, essays, media_root):
+    response = export(api, "zip")
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+
+    names = archive.namelist()
+    assert len(names) == 3
+    assert all(name.startswith("aluno@example.com/") for name in names)
+    assert len(list(media_root.rglob("*.pdf"))) == 3
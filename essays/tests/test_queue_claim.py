@@ -0,0 +1,40 @@
+"""
+Reserva de redações pela fila: validação de `count`.
+"""
+
+import pytest
+from rest_framework.test import APIClient
+
+from essays.services.queue_service import CorrectionQueueService
+
+
+@pytest.fixture
+def api(teacher):
+    client = APIClient()
+    client.force_authenticate(teacher)
+    return client
+
+
+@pytest.mark.parametrize("count", [0, -1, "x"])
+def test_claim_rejects_invalid_count(count, api, student, submit):
+    submit(student)
+
+    response = api.post("/api/essays/queue/claim/", {"count": count}, format="json")
+
+    assert response.status_code == 400
+    assert "count" in response.json()
+
+
+def test_claim_default_count(api, student, submit):
+    essay = submit(student)
+
+    response = api.post("/api/essays/queue/claim/", {}, format="json")
+
+    assert response.status_code == 200
+    assert [row["id"] for row in response.json()["results"]] == [essay.pk]
+
+
+def test_service_claims_nothing_for_zero(teacher, student, submit):
+    submit(student)
+
+    assert CorrectionQueueService.claim(teacher, count=0) == []
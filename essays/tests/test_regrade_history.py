@@ -0,0 +1,25 @@
+"""Histórico ponto-a-ponto: uma linha por redação, também após recorreção."""
+
+from essays.models import CompetenceScore
+from essays.services.correction_service import CorrectionService
+from performance.models import CompetenceHistory, StudentPerformance
+
+
+def test_regrade_updates_history_row(student, teacher, submit, scores):
+    essay = submit(student)
+    CorrectionService.correct(essay.pk, teacher, scores)
+
+    CorrectionService.regrade(essay.pk, teacher, {**scores, "c1": 0})
+
+    history = CompetenceHistory.objects.get(essay=essay)
+    assert history.c1 == 0
+    assert StudentPerformance.objects.get(student=student).sum_c1 == 0
+
+
+def test_deleting_score_removes_history(student, teacher, submit, scores):
+    essay = submit(student)
+    CorrectionService.correct(essay.pk, teacher, scores)
+
+    CompetenceScore.objects.filter(essay=essay).delete()
+
+    assert not CompetenceHistory.objects.filter(essay=essay).exists()
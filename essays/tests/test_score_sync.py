@@ -0,0 +1,52 @@
+"""
+Notas gravadas fora do CorrectionService e conflito na criação da nota.
+"""
+
+import pytest
+
+from essays.exceptions import EssayConflict
+from essays.models import CompetenceScore, Essay
+from essays.services.correction_service import CorrectionService
+from performance.models import CompetenceHistory, StudentPerformance
+
+
+def test_external_save_syncs_essay_and_metrics(student, teacher, submit, scores):
+    essay = submit(student)
+
+    score = CompetenceScore.objects.create(essay=essay, corrected_by=teacher, **scores)
+
+    essay.refresh_from_db()
+    assert essay.status == Essay.Status.CORRECTED
+    assert essay.score_total == sum(scores.values())
+    performance = StudentPerformance.objects.get(student=student)
+    assert performance.total_essays_corrected == 1
+    assert performance.average_score == sum(scores.values())
+
+    score.c1 = 0
+    score.save()
+
+    essay.refresh_from_db()
+    assert essay.score_total == sum(scores.values()) - scores["c1"]
+    assert CompetenceHistory.objects.get(essay=essay).c1 == 0
+    performance.refresh_from_db()
+    assert performance.total_essays_corrected == 1
+    assert performance.average_score == essay.score_total
+
+
+def test_service_write_is_not_synced_twice(student, teacher, submit, scores):
+    CorrectionService.correct(submit(student).pk, teacher, scores)
+
+    assert StudentPerformance.objects.get(student=student).total_essays_corrected == 1
+    assert CompetenceHistory.objects.filter(student=student).count() == 1
+
+
+def test_existing_score_is_a_conflict(student, teacher, submit, scores):
+    essay = submit(student)
+    # Nota de outra transação, sem signals e com a redação ainda SUBMITTED
+    CompetenceScore.objects.bulk_create([CompetenceScore(essay=essay, **scores)])
+
+    with pytest.raises(EssayConflict):
+        CorrectionService.correct(essay.pk, teacher, scores)
+
+    essay.refresh_from_db()
+    assert essay.status == Essay.Status.SUBMITTED
@@ -0,0 +1,224 @@
+"""
+Recebimento dos PDFs de redações enviados por formulário.
+
+PDFUploadHandler substitui os handlers padrão do Django nas views de envio:
+- grava os blocos direto em um arquivo temporário (nada fica em memória);
+- calcula o SHA-256 enquanto recebe;
+- rejeita cedo: assinatura %PDF-, ESSAY_PDF_MAX_BYTES e ESSAY_PDF_MAX_PAGES
+  são verificados a cada bloco, e o restante do arquivo é descartado;
+- guarda o arquivo pelo conteúdo (pdfs/uploads/<aa>/<sha256>.pdf): o mesmo
+  PDF enviado várias vezes ocupa o disco uma vez só.
+
+O valor em request.FILES é um ReceivedPDF ainda no temporário: a view só
+chama save() depois das próprias validações (papel, título, CSRF) e cria a
+redação com Essay.pdf = received.save() em um único INSERT. O temporário
+não salvo é apagado no close(), ao fim da requisição — envios recusados
+não deixam arquivos em pdfs/uploads/.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+
+from django.conf import settings
+from django.core.files.uploadhandler import (
+    FileUploadHandler,
+    SkipFile,
+    StopFutureHandlers,
+)
+from django.template.defaultfilters import filesizeformat
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+
+from core.throttling import check_throttle
+
+UPLOAD_DIR = "pdfs/uploads"
+
+# "/Type /Page" (e não "/Pages"): contagem aproximada de páginas. PDFs com
+# object streams comprimidos escondem esses objetos; nesses casos o limite
+# de páginas não é aplicado e vale apenas o de tamanho.
+PAGE_RE = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+PAGE_RE_OVERLAP = 32
+
+
+class ReceivedPDF:
+    """PDF recebido e validado, ainda no temporário (valor de request.FILES)."""
+
+    def __init__(self, tmp_path, original_name, size, sha256, pages):
+        self.tmp_path = tmp_path
+        self.name = None  # caminho relativo a MEDIA_ROOT, após save()
+        self.original_name = original_name
+        self.size = size
+        self.sha256 = sha256
+        self.pages = pages
+
+    def save(self):
+        """Grava no storage (uma vez só) e devolve o nome do arquivo."""
+
+        if self.name is None:
+            self.name = store_pdf(self.tmp_path, self.sha256)
+            self.tmp_path = None
+        return self.name
+
+    def close(self):
+        # Chamado pelo Django ao fim da requisição: descarta o não salvo
+        if self.tmp_path is not None:
+            if os.path.exists(self.tmp_path):
+                os.unlink(self.tmp_path)
+            self.tmp_path = None
+
+
+class PDFUploadHandler(FileUploadHandler):
+    """Recebe PDFs em streaming, com hash e limites aplicados por bloco."""
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.error = None
+        self.tmp = None
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        super().new_file(field_name, file_name, *args, **kwargs)
+
+        if self.content_length and self.content_length > settings.ESSAY_PDF_MAX_BYTES:
+            self._reject(self._size_error())
+
+        tmp_dir = os.path.join(settings.MEDIA_ROOT, UPLOAD_DIR, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        # Mesmo sistema de arquivos do destino: os.replace atômico no final
+        self.tmp = tempfile.NamedTemporaryFile(
+            dir=tmp_dir, suffix=".upload", delete=False
+        )
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.pages = 0
+        self.tail = b""
+
+        raise StopFutureHandlers  # este handler é o dono do arquivo
+
+    def receive_data_chunk(self, raw_data, start):
+        if start == 0 and not raw_data.startswith(b"%PDF-"):
+            self._reject("O arquivo enviado não é um PDF.")
+
+        self.size += len(raw_data)
+        if self.size > settings.ESSAY_PDF_MAX_BYTES:
+            self._reject(self._size_error())
+
+        # Conta as páginas que terminam neste bloco (a sobreposição com o
+        # bloco anterior pega marcadores divididos entre dois blocos)
+        window = self.tail + raw_data
+        self.pages += sum(
+            1 for match in PAGE_RE.finditer(window) if match.end() > len(self.tail)
+        )
+        self.tail = window[-PAGE_RE_OVERLAP:]
+        if self.pages > settings.ESSAY_PDF_MAX_PAGES:
+            self._reject(f"O PDF tem mais de {settings.ESSAY_PDF_MAX_PAGES} páginas.")
+
+        self.digest.update(raw_data)
+        self.tmp.write(raw_data)
+        return None
+
+    def file_complete(self, file_size):
+        if self.tmp is None:
+            return None
+
+        self.tmp.close()
+        received = ReceivedPDF(
+            self.tmp.name,
+            self.file_name,
+            file_size,
+            self.digest.hexdigest(),
+            self.pages,
+        )
+        self.tmp = None
+        return received
+
+    def upload_interrupted(self):
+        self._discard()
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    def _reject(self, message):
+        self.error = message
+        self._discard()
+        raise SkipFile(message)  # o parser descarta o resto do arquivo
+
+    def _discard(self):
+        if self.tmp is not None:
+            self.tmp.close()
+            os.unlink(self.tmp.name)
+            self.tmp = None
+
+    @staticmethod
+    def _size_error():
+        return (
+            f"O PDF deve ter no máximo {filesizeformat(settings.ESSAY_PDF_MAX_BYTES)}."
+        )
+
+
+def is_uploaded(name):
+    """True se o arquivo de Essay.pdf veio de um envio (e não foi gerado)."""
+    return bool(name) and name.startswith(f"{UPLOAD_DIR}/")
+
+
+def store_pdf(tmp_path, sha256):
+    """
+    Move o temporário para pdfs/uploads/<aa>/<sha256>.pdf.
+
+    Returns:
+        str: nome do arquivo no storage (relativo a MEDIA_ROOT).
+    """
+
+    name = f"{UPLOAD_DIR}/{sha256[:2]}/{sha256}.pdf"
+    path = os.path.join(settings.MEDIA_ROOT, name)
+
+    if os.path.exists(path):
+        os.unlink(tmp_path)  # mesmo conteúdo já guardado
+        return name
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.chmod(tmp_path, settings.FILE_UPLOAD_PERMISSIONS or 0o644)
+    os.replace(tmp_path, path)
+    return name
+
+
+class PDFUploadMixin:
+    """
+    Instala o PDFUploadHandler antes de o corpo da requisição ser lido.
+
+    O CSRF é verificado depois da troca de handlers (o middleware leria
+    request.POST antes); a view implementa
+    post_upload(request, upload_error, *args, **kwargs).
+
+    Com throttle_scope na view, o limite de envios (core/throttling.py) é
+    verificado antes de ler o corpo: o arquivo recusado nem chega ao disco.
+    """
+
+    @method_decorator(csrf_exempt)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+
+    def post(self, request, *args, **kwargs):
+        wait = check_throttle(request, self)
+        if wait is not None:
+            # Só mensagem + redirect: o corpo (e o CSRF) não é lido
+            response = self.post_upload(
+                request,
+                f"Muitos envios seguidos. Tente novamente em {wait} s.",
+                *args,
+                **kwargs,
+            )
+            response["Retry-After"] = str(wait)
+            return response
+
+        handler = PDFUploadHandler(request)
+        request.upload_handlers = [handler]
+        return self._post_protected(request, handler, *args, **kwargs)
+
+    @method_decorator(csrf_protect)
+    def _post_protected(self, request, handler, *args, **kwargs):
+        # handler.error só existe depois do parse do corpo: o CSRF nem sempre
+        # lê request.POST (token no cabeçalho, checagem desligada nos testes)
+        request.FILES
+        return self.post_upload(request, handler.error, *args, **kwargs)
@@ -3,15 +3,29 @@ Rotas do módulo de Redações ENEM.
 
 Cada rota usa uma view responsável:
 - EssayCreateView → aluno envia redação
-- EssayListView → aluno vê suas redações
+- EssayBatchCreateView → envio de redações em lote
+- EssayListView → aluno vê suas redações (paginação por cursor)
+- EssayDetailView → texto completo de uma redação
+- EssayPDFView → status da geração do PDF (polling)
 - EssayCorrectionView → professor corrige redação por ID
+- EssayBulkCorrectionView → professor corrige várias redações de uma vez
+- EssayQueue*View → fila de correção com reservas (claim/lease)
+- EssayExportView → exportação da turma (ZIP ou PDF único)
 """
 
 from django.urls import path
 from .views import (
     EssayCreateView,
+    EssayBatchCreateView,
     EssayListView,
+    EssayDetailView,
+    EssayPDFView,
     EssayCorrectionView,
+    EssayBulkCorrectionView,
+    EssayQueueClaimView,
+    EssayQueueReleaseView,
+    EssayQueueCorrectView,
+    EssayExportView,
 )
 
 app_name = "essays"
@@ -23,15 +37,57 @@ urlpatterns = [
     # ==========================================================
     path("create/", EssayCreateView.as_view(), name="essay-create"),
     # ==========================================================
+    # 1.1 Envio em lote (turmas / simulados)
+    # POST /api/essays/batch/
+    # ==========================================================
+    path("batch/", EssayBatchCreateView.as_view(), name="essay-batch"),
+    # ==========================================================
     # 2. Aluno lista suas próprias redações
     # GET /api/essays/my/
     # ==========================================================
     path("my/", EssayListView.as_view(), name="essay-list"),
     # ==========================================================
+    # 2.1 Corpo completo de uma redação
+    # GET /api/essays/<ID>/
+    # ==========================================================
+    path("<int:pk>/", EssayDetailView.as_view(), name="essay-detail"),
+    # ==========================================================
+    # 2.2 Status do PDF (GET) / gerar novamente (POST)
+    # GET|POST /api/essays/<ID>/pdf/
+    # ==========================================================
+    path("<int:pk>/pdf/", EssayPDFView.as_view(), name="essay-pdf"),
+    # ==========================================================
     # 3. Professor corrige uma redação por ID
     # POST /api/essays/<ID>/correct/
     # ==========================================================
     path(
         "<int:essay_id>/correct/", EssayCorrectionView.as_view(), name="essay-correct"
     ),
+    # ==========================================================
+    # 4. Professor corrige várias redações em lote
+    # POST /api/essays/correct/bulk/
+    # ==========================================================
+    path(
+        "correct/bulk/",
+        EssayBulkCorrectionView.as_view(),
+        name="essay-correct-bulk",
+    ),
+    # ==========================================================
+    # 5. Fila de correção (reserva → corrige → próxima)
+    # POST /api/essays/queue/claim/
+    # POST /api/essays/queue/release/
+    # POST /api/essays/queue/<ID>/correct/
+    # ==========================================================
+    path("queue/claim/", EssayQueueClaimView.as_view(), name="queue-claim"),
+    path("queue/release/", EssayQueueReleaseView.as_view(), name="queue-release"),
+    path(
+        "queue/<int:essay_id>/correct/",
+        EssayQueueCorrectView.as_view(),
+        name="queue-correct",
+    ),
+    # ==========================================================
+    # 6. Exportação da turma (professor/admin)
+    # GET /api/essays/export/?output=zip|pdf&student=&start=&end=&status=
+    # ==========================================================
+    path("export/", EssayExportView.as_view(), name="essay-export"),
 ]
@@ -3,23 +3,51 @@ Views do módulo de redações ENEM.
 
 Responsabilidades:
 - Permitir que o aluno envie redações.
-- Permitir listagem das próprias redações.
+- Permitir listagem paginada (cursor) das próprias redações.
+- Permitir a leitura do corpo completo de uma redação.
+- Expor o status da geração do PDF (consultado pelo flipbook).
+- Permitir o envio de redações em lote (importação de turmas).
 - Permitir ao professor corrigir uma redação (CompetenceScore).
+- Permitir ao professor corrigir várias redações de uma vez.
+- Fila de correção com reservas (claim/lease) para professores.
+- Exportar as redações da turma em ZIP ou PDF único.
 - Implementar regras de permissão baseadas em roles:
     - student → pode criar e listar suas redações
     - teacher → pode corrigir redações
     - admin → pode fazer tudo
 """
 
+from django.conf import settings
+from django.db import transaction
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
-from performance.services.performance_service import PerformanceService
 
 
-from .models import Essay, CompetenceScore
-from .serializers import EssaySerializer, CompetenceScoreSerializer
-
+from .exceptions import EssayConflict
+from .models import Essay
+from .pagination import EssayKeysetPagination
+from .serializers import (
+    EssaySerializer,
+    EssayListSerializer,
+    EssayQueueSerializer,
+    EssayQueueClaimSerializer,
+    EssayQueueReleaseSerializer,
+    EssayPDFSerializer,
+    EssayExportQuerySerializer,
+    CompetenceScoreSerializer,
+)
+from .services.correction_service import CorrectionService
+from .services.export_service import EssayExportService
+from .services.queue_service import CorrectionQueueService
+from .services.submission_service import SubmissionService
+from performance.models import DailyActivity
+from performance.services.rollup_service import ActivityRollupService
+from profiles.tasks import schedule_sync_counters
+from dashboard.tasks import schedule_essay_pdf
 
 # ==========================================================
 # 1. Permissões baseadas no papel do usuário
@@ -40,6 +68,16 @@ class IsTeacher(permissions.BasePermission):
         return request.user.is_authenticated and request.user.role == "teacher"
 
 
+class IsTeacherOrAdmin(permissions.BasePermission):
+    """Permite acesso para professores e administradores."""
+
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and request.user.role in (
+            "teacher",
+            "admin",
+        )
+
+
 # ==========================================================
 # 2. CREATE — Aluno envia redação
 # ==========================================================
@@ -56,10 +94,64 @@ class EssayCreateView(generics.CreateAPIView):
 
     serializer_class = EssaySerializer
     permission_classes = [IsStudent]
+    throttle_scope = "essay_submit"
 
     def perform_create(self, serializer):
         # Define automaticamente o aluno dono da redação
-        serializer.save(student=self.request.user)
+        with transaction.atomic():
+            serializer.save(student=self.request.user)
+            ActivityRollupService.record(DailyActivity.Event.CREATED)
+            schedule_sync_counters(self.request.user.pk)
+
+
+# ==========================================================
+# 2.1 BATCH — Envio de redações em lote
+# ==========================================================
+
+
+class EssayBatchCreateView(APIView):
+    """
+    Cria várias redações em uma única requisição.
+
+    Regra:
+    - Student: todos os itens pertencem ao próprio aluno.
+    - Teacher/Admin: cada item informa "student" (id) ou "student_email".
+    - Itens inválidos não bloqueiam o lote: voltam em "errors" com o índice.
+
+    Body:
+        {"essays": [{"title": "...", "text": "...", "student_email": "..."}]}
+    """
+
+    throttle_scope = "essay_submit"
+
+    def post(self, request):
+        items = request.data
+        if isinstance(items, dict):
+            items = items.get("essays")
+
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"detail": "Envie uma lista não vazia em 'essays'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if len(items) > settings.ESSAY_BATCH_MAX_ITEMS:
+            return Response(
+                {
+                    "detail": f"Máximo de {settings.ESSAY_BATCH_MAX_ITEMS} "
+                    "redações por lote."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user = request.user
+        owner = user if user.role == "student" else None
+        result = SubmissionService.bulk_submit(items, student=owner)
+
+        response_status = (
+            status.HTTP_201_CREATED if result.created else status.HTTP_400_BAD_REQUEST
+        )
+        return Response(result.as_dict(), status=response_status)
 
 
 # ==========================================================
@@ -69,19 +161,90 @@ class EssayCreateView(generics.CreateAPIView):
 
 class EssayListView(generics.ListAPIView):
     """
-    Lista todas as redações enviadas pelo aluno logado.
+    Lista as redações enviadas pelo aluno logado, paginadas por cursor.
 
     Regra:
     - Student vê apenas suas redações.
     - Teacher e Admin poderiam ver todas se quiséssemos,
       mas aqui mantemos restrito ao aluno.
+
+    Modos:
+    - Sem parâmetros → lista simples completa (formato original da API).
+    - Com ?cursor= ou ?page_size= → paginação keyset em (created_at, id),
+      custo fixo por página, e projeção sem 'text' (o corpo fica em
+      EssayDetailView).
     """
 
-    serializer_class = EssaySerializer
     permission_classes = [IsStudent]
+    pagination_class = EssayKeysetPagination
+
+    def paginated(self):
+        return self.paginator.is_requested(self.request)
+
+    def get_serializer_class(self):
+        return EssayListSerializer if self.paginated() else EssaySerializer
+
+    def get_queryset(self):
+        queryset = Essay.objects.filter(student=self.request.user).order_by(
+            "-created_at", "-id"
+        )
+        if self.paginated():
+            queryset = queryset.defer("text", "pdf")
+        return queryset
+
+
+class EssayDetailView(generics.RetrieveAPIView):
+    """
+    Retorna a redação completa (incluindo 'text').
+
+    Regra:
+    - Student acessa apenas suas próprias redações.
+    - Teacher e Admin acessam qualquer redação (necessário para corrigir).
+    """
+
+    serializer_class = EssaySerializer
+
+    def get_queryset(self):
+        user = self.request.user
+        queryset = Essay.objects.all()
+        if user.role == "student":
+            queryset = queryset.filter(student=user)
+        return queryset
+
+
+class EssayPDFView(generics.RetrieveAPIView):
+    """
+    Status do PDF da redação (gerado em segundo plano pelo runworker).
+
+    - GET  → {"pdf_status": "none|pending|ready|failed", "pdf_error", "pdf_url"}
+    - POST → enfileira a geração a partir de "none" ou "failed" → 202;
+      pronto ou já gerando → 200 com o status atual (nada é refeito)
+
+    Mesma regra de acesso de EssayDetailView.
+    """
+
+    serializer_class = EssayPDFSerializer
 
     def get_queryset(self):
-        return Essay.objects.filter(student=self.request.user).order_by("-created_at")
+        user = self.request.user
+        queryset = Essay.objects.only(
+            "id", "student_id", "pdf", "pdf_status", "pdf_error"
+        )
+        if user.role == "student":
+            queryset = queryset.filter(student=user)
+        return queryset
+
+    def post(self, request, pk):
+        essay = self.get_object()
+        if not schedule_essay_pdf(essay.pk):
+            essay.refresh_from_db(fields=["pdf", "pdf_status", "pdf_error"])
+            return Response(self.get_serializer(essay).data)
+
+        essay.pdf_status = Essay.PdfStatus.PENDING
+        essay.pdf_error = ""
+        return Response(
+            self.get_serializer(essay).data, status=status.HTTP_202_ACCEPTED
+        )
 
 
 # ==========================================================
@@ -95,36 +258,228 @@ class EssayCorrectionView(generics.CreateAPIView):
 
     Fluxo completo:
     - Professor envia POST /api/essays/<id>/correct/
-    - O backend:
-        1. cria CompetenceScore
-        2. marca a redação como CORRIGIDA
-        3. calcula score_total = soma das 5 competências
-        4. registra quem corrigiu
+    - O backend (CorrectionService, em UMA transação):
+        1. cria CompetenceScore e registra quem corrigiu
+        2. marca a redação como CORRIGIDA com score_total
+        3. grava o histórico e atualiza as métricas do aluno
+    - PUT no mesmo endpoint refaz a correção (recorreção).
     """
 
     serializer_class = CompetenceScoreSerializer
     permission_classes = [IsTeacher]
+    throttle_scope = "essay_correction"
 
     def perform_create(self, serializer):
         # ID da redação vem pela URL
-        essay_id = self.kwargs["essay_id"]
-        essay = get_object_or_404(Essay, id=essay_id)
+        serializer.instance = CorrectionService.correct(
+            self.kwargs["essay_id"],
+            teacher=self.request.user,
+            scores=serializer.validated_data,
+        )
+
+    def put(self, request, essay_id):
+        """Recorreção: substitui as notas c1..c5 de uma redação já corrigida."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        competence = CorrectionService.regrade(
+            essay_id, teacher=request.user, scores=serializer.validated_data
+        )
+        return Response(self.get_serializer(competence).data)
+
 
-        # Atualiza status e nota total
-        c1 = serializer.validated_data["c1"]
-        c2 = serializer.validated_data["c2"]
-        c3 = serializer.validated_data["c3"]
-        c4 = serializer.validated_data["c4"]
-        c5 = serializer.validated_data["c5"]
+# ==========================================================
+# 5. CORREÇÃO EM LOTE — Professor envia várias folhas de nota
+# ==========================================================
 
-        total = c1 + c2 + c3 + c4 + c5
 
-        essay.status = Essay.Status.CORRECTED
-        essay.score_total = total
-        essay.save()
+class EssayBulkCorrectionView(APIView):
+    """
+    Corrige várias redações em uma única transação.
+
+    Body:
+        {"corrections": [{"essay_id": 1, "c1": 160, ..., "c5": 120}]}
 
-        # Cria o objeto de competências
-        serializer.save(
-            essay=essay,
-            corrected_by=self.request.user,
+    - Linhas inválidas, repetidas ou já corrigidas voltam em "errors".
+    - As demais são gravadas com INSERT/UPDATE em lote e as métricas
+      de desempenho são recalculadas uma vez por aluno.
+    """
+
+    permission_classes = [IsTeacher]
+    throttle_scope = "essay_correction"
+
+    def post(self, request):
+        rows = request.data
+        if isinstance(rows, dict):
+            rows = rows.get("corrections")
+
+        if not isinstance(rows, list) or not rows:
+            return Response(
+                {"detail": "Envie uma lista não vazia em 'corrections'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if len(rows) > settings.ESSAY_BATCH_MAX_ITEMS:
+            return Response(
+                {
+                    "detail": f"Máximo de {settings.ESSAY_BATCH_MAX_ITEMS} "
+                    "correções por lote."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        result = CorrectionService.bulk_correct(rows, teacher=request.user)
+
+        response_status = (
+            status.HTTP_200_OK if result.corrected else status.HTTP_400_BAD_REQUEST
+        )
+        return Response(result.as_dict(), status=response_status)
+
+
+# ==========================================================
+# 6. FILA DE CORREÇÃO — reservas com prazo (claim/lease)
+# ==========================================================
+
+
+class EssayQueueClaimView(APIView):
+    """
+    Reserva as próximas N redações enviadas para o professor logado.
+
+    Body: {"count": 5}
+    - Reservas expiram após ESSAY_CLAIM_LEASE_MINUTES.
+    - Redações reservadas por outro professor nunca são entregues.
+    """
+
+    permission_classes = [IsTeacher]
+
+    def post(self, request):
+        serializer = EssayQueueClaimSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        essays = CorrectionQueueService.claim(
+            request.user, count=serializer.validated_data["count"]
+        )
+        return Response(
+            {"results": EssayQueueSerializer(essays, many=True).data},
+            status=status.HTTP_200_OK,
+        )
+
+
+class EssayQueueReleaseView(APIView):
+    """
+    Devolve redações reservadas à fila.
+
+    Body: {"essay_ids": [1, 2, 3]}
+    """
+
+    permission_classes = [IsTeacher]
+
+    def post(self, request):
+        serializer = EssayQueueReleaseSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        released = CorrectionQueueService.release(
+            request.user, serializer.validated_data["essay_ids"]
+        )
+        return Response({"released": released})
+
+
+class EssayQueueCorrectView(APIView):
+    """
+    Corrige uma redação reservada e já devolve a próxima da fila.
+
+    Fluxo (uma única ida e volta):
+    1. valida a reserva do professor
+    2. grava a correção (CorrectionService)
+    3. retorna a próxima reserva ativa — ou reserva uma nova
+    """
+
+    permission_classes = [IsTeacher]
+    throttle_scope = "essay_correction"
+
+    def post(self, request, essay_id):
+        essay = get_object_or_404(
+            Essay.objects.only("id", "status", "claimed_by_id", "claim_expires_at"),
+            id=essay_id,
+        )
+
+        if essay.status == Essay.Status.CORRECTED:
+            raise EssayConflict("Redação já corrigida.")
+        if essay.claimed_by_id != request.user.pk:
+            raise EssayConflict("Reserve a redação antes de corrigir.")
+
+        serializer = CompetenceScoreSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        CorrectionService.correct(
+            essay_id, teacher=request.user, scores=serializer.validated_data
+        )
+
+        next_essay = CorrectionQueueService.next_for(request.user)
+        return Response(
+            {
+                "corrected": essay_id,
+                "next": (EssayQueueSerializer(next_essay).data if next_essay else None),
+            }
+        )
+
+
+# ==========================================================
+# 7. EXPORTAÇÃO DA TURMA — ZIP (streaming) ou PDF único
+# ==========================================================
+
+
+class EssayExportView(APIView):
+    """
+    Exporta as redações filtradas.
+
+    GET /api/essays/export/?output=zip&student=10&start=2025-03-01&status=corrected
+    - output=zip → um PDF por redação, enviado enquanto os PDFs são
+      renderizados (memória constante).
+    - output=pdf → um único PDF com uma redação por página (arquivo
+      temporário, apagado quando a resposta termina).
+    """
+
+    permission_classes = [IsTeacherOrAdmin]
+
+    def get(self, request):
+        query = EssayExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        queryset = EssayExportService.queryset(
+            student_id=params.get("student"),
+            start=params.get("start"),
+            end=params.get("end"),
+            status=params["status"],
+        )
+
+        limit = (
+            settings.ESSAY_EXPORT_MAX_MERGED
+            if params["output"] == "pdf"
+            else settings.ESSAY_EXPORT_MAX_ESSAYS
+        )
+        total = queryset.count()
+        if total > limit:
+            return Response(
+                {
+                    "detail": f"A exportação tem {total} redações; o máximo em "
+                    f"'{params['output']}' é {limit}. Refine os filtros."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        filename = f"redacoes-{timezone.localdate():%Y%m%d}.{params['output']}"
+
+        if params["output"] == "pdf":
+            return FileResponse(
+                EssayExportService.merged_pdf(queryset),
+                as_attachment=True,
+                filename=filename,
+                content_type="application/pdf",
+            )
+
+        response = StreamingHttpResponse(
+            EssayExportService.stream_zip(queryset),
+            content_type="application/zip",
         )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
@@ -0,0 +1,19 @@
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = (
+        "task",
+        "status",
+        "priority",
+        "attempts",
+        "run_at",
+        "locked_by",
+        "finished_at",
+    )
+    list_filter = ("status", "task")
+    search_fields = ("task", "key", "last_error")
+    readonly_fields = ("created_at", "updated_at", "finished_at")
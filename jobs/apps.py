@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "jobs"
+    verbose_name = "Fila de tarefas"
+
+    def ready(self):
+        # Registra as tarefas declaradas em <app>/tasks.py
+        from django.utils.module_loading import autodiscover_modules
+
+        autodiscover_modules("tasks")
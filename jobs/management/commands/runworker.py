@@ -0,0 +1,152 @@
+import os
+import signal
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+
+from jobs.registry import registered_tasks
+from jobs.services.job_service import JobService
+
+
+class Command(BaseCommand):
+    """
+    Executa as tarefas da fila (jobs.Job).
+
+    Uso:
+        poetry run python manage.py runworker
+        poetry run python manage.py runworker --concurrency=4
+        poetry run python manage.py runworker --once   # esvazia a fila e sai
+
+    Vários workers (em máquinas ou processos diferentes) podem rodar ao
+    mesmo tempo: a reserva garante que cada tarefa execute uma única vez.
+    Ctrl+C / SIGTERM → termina as tarefas em andamento e sai.
+    """
+
+    help = "Executa as tarefas em segundo plano gravadas no banco"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Quantidade de threads executando tarefas",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.JOBS_POLL_INTERVAL,
+            help="Segundos de espera quando a fila está vazia",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Sai quando não houver mais tarefas prontas",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=0,
+            help="Sai após executar N tarefas (0 = sem limite)",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = options["concurrency"]
+        if concurrency < 1:
+            raise CommandError("--concurrency deve ser maior que zero.")
+
+        if connection.vendor == "sqlite" and concurrency > 1:
+            # Transações concorrentes no SQLite falham com "database is locked"
+            self.stdout.write(
+                self.style.WARNING("SQLite serializa escritas: usando 1 thread.")
+            )
+            concurrency = 1
+
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.stopping = threading.Event()
+        self._install_signal_handlers()
+
+        self.stdout.write(
+            f"Worker {self.worker_id} ({concurrency} threads) — "
+            f"tarefas: {', '.join(registered_tasks()) or 'nenhuma'}"
+        )
+
+        done = failed = 0
+        max_jobs = options["max_jobs"]
+        running = set()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while not self.stopping.is_set():
+                free = concurrency - len(running)
+                if max_jobs:
+                    free = min(free, max_jobs - done - failed - len(running))
+
+                jobs = JobService.claim(self.worker_id, free) if free > 0 else []
+                for job in jobs:
+                    running.add(pool.submit(self._execute, job))
+
+                if not running:
+                    if options["once"] or (max_jobs and done + failed >= max_jobs):
+                        break
+                    self.stopping.wait(options["poll_interval"])
+                    continue
+
+                finished, running = wait(
+                    running,
+                    timeout=None if free <= len(jobs) else options["poll_interval"],
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in finished:
+                    if future.result():
+                        done += 1
+                    else:
+                        failed += 1
+
+            # Encerramento: espera as tarefas que já começaram
+            for future in wait(running).done:
+                if future.result():
+                    done += 1
+                else:
+                    failed += 1
+
+        connection.close()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Worker encerrado: {done} concluídas, {failed} falharam"
+            )
+        )
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    def _execute(self, job):
+        # Cada thread tem a sua conexão: descarta as quebradas/expiradas
+        close_old_connections()
+        try:
+            started = time.perf_counter()
+            ok = JobService.run(job, self.worker_id)
+            elapsed = (time.perf_counter() - started) * 1000
+
+            style = self.style.SUCCESS if ok else self.style.ERROR
+            self.stdout.write(
+                style(
+                    f"{job.task} #{job.pk} {'ok' if ok else 'erro'} ({elapsed:.0f}ms)"
+                )
+            )
+            return ok
+        finally:
+            connection.close()
+
+    def _install_signal_handlers(self):
+        def stop(signum, frame):
+            if not self.stopping.is_set():
+                self.stdout.write("Encerrando após as tarefas em andamento...")
+            self.stopping.set()
+
+        signal.signal(signal.SIGINT, stop)
+        signal.signal(signal.SIGTERM, stop)
@@ -0,0 +1,64 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    Tarefa em segundo plano persistida no próprio banco.
+
+    Objetivos:
+    - Tirar do request o trabalho derivado (métricas, PDFs, contadores).
+    - Dispensar broker externo: funciona com SQLite e PostgreSQL.
+    - Ser gravada na MESMA transação do dado principal → sem tarefas órfãs.
+
+    Executada pelo comando: poetry run python manage.py runworker
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Na fila"
+        RUNNING = "running", "Executando"
+        DONE = "done", "Concluída"
+        FAILED = "failed", "Falhou"
+
+    task = models.CharField(max_length=200, help_text="Nome registrado da tarefa.")
+    payload = models.JSONField(default=dict, blank=True)
+
+    # Evita duplicar tarefas idênticas que ainda estão na fila
+    key = models.CharField(max_length=255, blank=True, db_index=True)
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.QUEUED,
+    )
+    priority = models.SmallIntegerField(
+        default=0, help_text="Maior prioridade executa antes."
+    )
+
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+
+    run_at = models.DateTimeField(
+        default=timezone.now, help_text="Não executar antes deste momento."
+    )
+
+    # Reserva do worker: se ele morrer, a tarefa volta para a fila
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "-priority", "run_at"],
+                name="job_status_priority_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
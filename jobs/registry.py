@@ -0,0 +1,66 @@
+"""
+Registro de tarefas executáveis pelo worker.
+
+Uso (em <app>/tasks.py):
+
+    from jobs.registry import task
+
+    @task("performance.reconcile_student")
+    def reconcile_student(student_id):
+        ...
+
+    reconcile_student.enqueue({"student_id": 10}, priority=5)
+    reconcile_student.enqueue_many([({"student_id": 10}, "chave"), ...])
+
+O payload é JSON: passe ids, nunca instâncias de modelo.
+
+on_failure(payload, error) é chamado quando a tarefa esgota as tentativas
+(ex.: marcar o registro relacionado como "falhou").
+"""
+
+_registry = {}
+
+
+class UnknownTask(LookupError):
+    """Tarefa gravada na fila, mas não registrada neste processo."""
+
+
+def task(name, max_attempts=None, on_failure=None):
+    """Registra a função como tarefa com o nome informado."""
+
+    def decorator(func):
+        if name in _registry and _registry[name] is not func:
+            raise ValueError(f"Tarefa já registrada: {name}")
+
+        _registry[name] = func
+        func.task_name = name
+        func.on_failure = on_failure
+
+        def enqueue(payload=None, **options):
+            from jobs.services.job_service import JobService
+
+            options.setdefault("max_attempts", max_attempts)
+            return JobService.enqueue(name, payload, **options)
+
+        def enqueue_many(items, **options):
+            from jobs.services.job_service import JobService
+
+            options.setdefault("max_attempts", max_attempts)
+            return JobService.enqueue_many(name, items, **options)
+
+        func.enqueue = enqueue
+        func.enqueue_many = enqueue_many
+        return func
+
+    return decorator
+
+
+def get_task(name):
+    try:
+        return _registry[name]
+    except KeyError:
+        raise UnknownTask(name)
+
+
+def registered_tasks():
+    return sorted(_registry)
@@ -0,0 +1,289 @@
+"""
+Service Layer da fila de tarefas (jobs).
+
+- enqueue(): grava a tarefa (na mesma transação do chamador).
+- enqueue_many(): várias tarefas do mesmo tipo com 1 consulta + 1 INSERT.
+- claim(): reserva as próximas tarefas para um worker.
+- run(): executa, marca como concluída ou agenda nova tentativa.
+
+run() NÃO abre transação em volta da tarefa: uma renderização longa não
+segura o banco (no SQLite, bloquearia as outras escritas). Cada tarefa é
+atômica e idempotente por conta própria — pode rodar de novo após uma
+falha no meio. Enquanto ela executa, LeaseHeartbeat renova locked_until
+a cada JOBS_HEARTBEAT_SECONDS: tarefas mais longas que JOBS_LEASE_SECONDS
+não são reservadas (e executadas) por outro worker.
+
+A reserva segue a mesma estratégia da fila de correção de redações:
+SELECT ... FOR UPDATE SKIP LOCKED no PostgreSQL e UPDATE atômico com
+subconsulta no SQLite.
+"""
+
+import logging
+import random
+import threading
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.registry import get_task
+
+logger = logging.getLogger(__name__)
+
+# Chaves por consulta / tarefas por INSERT em enqueue_many()
+ENQUEUE_BATCH_SIZE = 500
+
+
+class JobService:
+    """Enfileira, reserva e executa tarefas em segundo plano."""
+
+    @staticmethod
+    def enqueue(task, payload=None, priority=0, delay=None, max_attempts=None, key=""):
+        """
+        Coloca uma tarefa na fila.
+
+        Args:
+            task: nome registrado com @task.
+            payload: dict JSON com os argumentos da tarefa.
+            priority: maior = executa antes.
+            delay: timedelta para adiar a primeira execução.
+            key: se informado, não duplica uma tarefa com a mesma chave
+                que ainda esteja na fila.
+
+        Returns:
+            Job | None: None quando a tarefa já estava na fila (key).
+        """
+
+        if key and Job.objects.filter(key=key, status=Job.Status.QUEUED).exists():
+            return None
+
+        return Job.objects.create(
+            task=task,
+            payload=payload or {},
+            priority=priority,
+            key=key,
+            run_at=timezone.now() + (delay or timedelta()),
+            max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+        )
+
+    @staticmethod
+    def enqueue_many(task, items, priority=0, delay=None, max_attempts=None):
+        """
+        Coloca várias tarefas do mesmo tipo na fila, em lote.
+
+        Args:
+            items: iterável de (payload, key). Chaves que já estão na fila
+                (ou repetidas em items) são ignoradas, como em enqueue().
+
+        Returns:
+            list[Job]: tarefas criadas.
+        """
+
+        items = list(items)
+        keys = [key for _, key in items if key]
+        queued = set()
+        for start in range(0, len(keys), ENQUEUE_BATCH_SIZE):
+            queued.update(
+                Job.objects.filter(
+                    key__in=keys[start : start + ENQUEUE_BATCH_SIZE],
+                    status=Job.Status.QUEUED,
+                ).values_list("key", flat=True)
+            )
+
+        run_at = timezone.now() + (delay or timedelta())
+        jobs = []
+        for payload, key in items:
+            if key:
+                if key in queued:
+                    continue
+                queued.add(key)
+            jobs.append(
+                Job(
+                    task=task,
+                    payload=payload or {},
+                    priority=priority,
+                    key=key,
+                    run_at=run_at,
+                    max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+                )
+            )
+
+        return Job.objects.bulk_create(jobs, batch_size=ENQUEUE_BATCH_SIZE)
+
+    @staticmethod
+    def claimable(now):
+        """Tarefas prontas ou com reserva vencida (worker que morreu)."""
+        return Q(status=Job.Status.QUEUED, run_at__lte=now) | Q(
+            status=Job.Status.RUNNING, locked_until__lte=now
+        )
+
+    @staticmethod
+    def claim(worker_id, limit=1):
+        """
+        Reserva até `limit` tarefas para o worker, por prioridade e ordem.
+
+        Returns:
+            list[Job]
+        """
+
+        now = timezone.now()
+        locked_until = now + timedelta(seconds=settings.JOBS_LEASE_SECONDS)
+        candidates = (
+            Job.objects.filter(JobService.claimable(now))
+            .order_by("-priority", "run_at", "id")
+            .values_list("id", flat=True)
+        )
+        values = {
+            "status": Job.Status.RUNNING,
+            "locked_by": worker_id,
+            "locked_until": locked_until,
+            "attempts": F("attempts") + 1,
+            "updated_at": now,
+        }
+
+        with transaction.atomic():
+            if connection.features.has_select_for_update_skip_locked:
+                ids = list(candidates.select_for_update(skip_locked=True)[:limit])
+                Job.objects.filter(id__in=ids).update(**values)
+            else:
+                Job.objects.filter(id__in=candidates[:limit]).filter(
+                    JobService.claimable(now)
+                ).update(**values)
+
+        return list(
+            Job.objects.filter(locked_by=worker_id, locked_until=locked_until).order_by(
+                "-priority", "run_at", "id"
+            )
+        )
+
+    @staticmethod
+    def extend_lease(job_id, worker_id):
+        """
+        Renova a reserva da tarefa em execução.
+
+        Returns:
+            bool: False se a reserva já não é deste worker.
+        """
+
+        now = timezone.now()
+        return bool(
+            Job.objects.filter(
+                pk=job_id, locked_by=worker_id, status=Job.Status.RUNNING
+            ).update(
+                locked_until=now + timedelta(seconds=settings.JOBS_LEASE_SECONDS),
+                updated_at=now,
+            )
+        )
+
+    @staticmethod
+    def run(job, worker_id):
+        """
+        Executa a tarefa (fora de transação, com a reserva renovada).
+
+        Returns:
+            bool: True se concluiu com sucesso.
+        """
+
+        mine = Job.objects.filter(pk=job.pk, locked_by=worker_id)
+        func = None
+
+        try:
+            func = get_task(job.task)
+            with LeaseHeartbeat(job, worker_id):
+                func(**job.payload)
+        except Exception:
+            error = traceback.format_exc()
+            now = timezone.now()
+
+            if job.attempts >= job.max_attempts:
+                logger.error("Tarefa %s falhou definitivamente:\n%s", job, error)
+                mine.update(
+                    status=Job.Status.FAILED,
+                    last_error=error,
+                    locked_by="",
+                    locked_until=None,
+                    finished_at=now,
+                    updated_at=now,
+                )
+                JobService._on_failure(job, func, error)
+            else:
+                retry_at = now + JobService.backoff(job.attempts)
+                logger.warning("Tarefa %s falhou, nova tentativa em %s", job, retry_at)
+                mine.update(
+                    status=Job.Status.QUEUED,
+                    last_error=error,
+                    locked_by="",
+                    locked_until=None,
+                    run_at=retry_at,
+                    updated_at=now,
+                )
+            return False
+
+        now = timezone.now()
+        mine.update(
+            status=Job.Status.DONE,
+            locked_by="",
+            locked_until=None,
+            finished_at=now,
+            updated_at=now,
+        )
+        return True
+
+    @staticmethod
+    def _on_failure(job, func, error):
+        """Chama o on_failure da tarefa (falha nele não derruba o worker)."""
+
+        if func is None or func.on_failure is None:
+            return
+        try:
+            with transaction.atomic():
+                func.on_failure(job.payload, error)
+        except Exception:
+            logger.exception("on_failure da tarefa %s falhou", job)
+
+    @staticmethod
+    def backoff(attempts):
+        """Espera exponencial com jitter: base * 2^(tentativas-1), limitada."""
+
+        seconds = settings.JOBS_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0))
+        seconds = min(seconds, settings.JOBS_BACKOFF_MAX_SECONDS)
+        return timedelta(seconds=seconds * random.uniform(0.8, 1.2))
+
+
+class LeaseHeartbeat:
+    """
+    Renova locked_until enquanto a tarefa executa, em uma thread própria
+    (com a sua conexão, fechada ao final).
+    """
+
+    def __init__(self, job, worker_id, interval=None):
+        self.job = job
+        self.worker_id = worker_id
+        self.interval = interval or settings.JOBS_HEARTBEAT_SECONDS
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=self._beat, name=f"heartbeat-{job.pk}", daemon=True
+        )
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+
+    def _beat(self):
+        try:
+            while not self.stopped.wait(self.interval):
+                if not JobService.extend_lease(self.job.pk, self.worker_id):
+                    logger.warning("Reserva da tarefa %s perdida", self.job)
+                    return
+        except Exception:
+            logger.exception("Falha ao renovar a reserva da tarefa %s", self.job)
+        finally:
+            connection.close()
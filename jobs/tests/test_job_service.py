@@ -0,0 +1,137 @@
+"""
+Fila de tarefas: reserva exclusiva, novas tentativas, reserva vencida,
+renovação da reserva e o comando runworker.
+"""
+
+import time
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.registry import task
+from jobs.services.job_service import JobService, LeaseHeartbeat
+
+calls = []
+failures = []
+
+
+@task("tests.record")
+def record(value):
+    calls.append(value)
+
+
+@task("tests.explode", on_failure=lambda payload, error: failures.append(payload))
+def explode():
+    raise RuntimeError("falhou")
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+    failures.clear()
+
+
+def test_claim_is_exclusive(db):
+    for value in range(3):
+        record.enqueue({"value": value})
+
+    first = JobService.claim("worker-a", limit=2)
+    second = JobService.claim("worker-b", limit=2)
+
+    assert len(first) == 2 and len(second) == 1
+    assert not {job.pk for job in first} & {job.pk for job in second}
+    assert JobService.claim("worker-c", limit=2) == []
+    assert all(job.status == Job.Status.RUNNING and job.attempts == 1 for job in first)
+
+
+def test_failure_retries_with_backoff_until_max_attempts(db):
+    job = explode.enqueue(max_attempts=2)
+
+    [claimed] = JobService.claim("worker", limit=1)
+    assert JobService.run(claimed, "worker") is False
+
+    job.refresh_from_db()
+    assert job.status == Job.Status.QUEUED
+    assert job.run_at > timezone.now()
+    assert job.locked_by == "" and "RuntimeError" in job.last_error
+    assert JobService.claim("worker", limit=1) == []  # ainda no backoff
+    assert failures == []
+
+    Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+    [claimed] = JobService.claim("worker", limit=1)
+    assert claimed.attempts == 2
+    assert JobService.run(claimed, "worker") is False
+
+    job.refresh_from_db()
+    assert job.status == Job.Status.FAILED
+    assert job.finished_at is not None
+    assert failures == [{}]
+
+
+def test_success_marks_done(db):
+    job = record.enqueue({"value": 7})
+
+    [claimed] = JobService.claim("worker", limit=1)
+    assert JobService.run(claimed, "worker") is True
+
+    job.refresh_from_db()
+    assert job.status == Job.Status.DONE and job.locked_by == ""
+    assert calls == [7]
+
+
+def test_expired_lease_is_claimed_again(db):
+    job = record.enqueue({"value": 1})
+    [stale] = JobService.claim("worker-a", limit=1)
+
+    assert JobService.claim("worker-b", limit=1) == []
+    Job.objects.filter(pk=job.pk).update(
+        locked_until=timezone.now() - timedelta(seconds=1)
+    )
+    [claimed] = JobService.claim("worker-b", limit=1)
+
+    assert claimed.pk == job.pk and claimed.attempts == 2
+    # O worker antigo não renova nem conclui a tarefa que perdeu
+    assert JobService.extend_lease(job.pk, "worker-a") is False
+    JobService.run(stale, "worker-a")
+    job.refresh_from_db()
+    assert job.status == Job.Status.RUNNING and job.locked_by == "worker-b"
+
+
+def test_extend_lease(db, settings):
+    settings.JOBS_LEASE_SECONDS = 600
+    job = record.enqueue({"value": 1})
+    [claimed] = JobService.claim("worker", limit=1)
+
+    assert JobService.extend_lease(job.pk, "worker") is True
+
+    job.refresh_from_db()
+    assert job.locked_until > claimed.locked_until
+
+
+def test_heartbeat_renews_lease(transactional_db):
+    job = record.enqueue({"value": 1})
+    [claimed] = JobService.claim("worker", limit=1)
+    expired = timezone.now() - timedelta(seconds=1)
+    Job.objects.filter(pk=job.pk).update(locked_until=expired)
+
+    with LeaseHeartbeat(claimed, "worker", interval=0.05):
+        time.sleep(0.3)  # sem consultas aqui: o SQLite de teste bloqueia a tabela
+
+    job.refresh_from_db()
+    assert job.locked_until > timezone.now()
+
+
+def test_runworker_once(transactional_db):
+    record.enqueue({"value": 1})
+    explode.enqueue(max_attempts=1)
+
+    call_command("runworker", "--once", stdout=None)
+
+    assert calls == [1]
+    assert set(Job.objects.values_list("task", "status")) == {
+        ("tests.record", Job.Status.DONE),
+        ("tests.explode", Job.Status.FAILED),
+    }
@@ -0,0 +1,90 @@
+import argparse
+import sys
+import time
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from performance.services.data_export_service import (
+    DATASETS,
+    OUTPUTS,
+    DataExportService,
+)
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Exporta redações, notas, histórico ou performance em CSV/JSONL.
+
+    Uso:
+        poetry run python manage.py export_data scores > notas.csv
+        poetry run python manage.py export_data essays --output jsonl --gzip \\
+            --start 2025-01-01 --end 2025-06-30 --file redacoes.jsonl.gz
+
+    Mesma geração em streaming da API (memória constante), sem o limite de
+    tempo de uma requisição HTTP.
+    """
+
+    help = "Exporta dados brutos em CSV ou JSONL (opcionalmente gzip)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("dataset", choices=sorted(DATASETS))
+        parser.add_argument("--output", choices=OUTPUTS, default="csv")
+        parser.add_argument("--gzip", action="store_true", help="Comprime com gzip")
+        parser.add_argument("--start", type=self._date, help="AAAA-MM-DD")
+        parser.add_argument("--end", type=self._date, help="AAAA-MM-DD")
+        parser.add_argument("--role", choices=User.Role.values)
+        parser.add_argument("--chunk-size", type=int, default=None)
+        parser.add_argument(
+            "--file",
+            default="-",
+            help="Arquivo de saída (padrão: saída padrão)",
+        )
+
+    def handle(self, *args, **options):
+        if options["start"] and options["end"] and options["start"] > options["end"]:
+            raise CommandError("--start deve ser anterior a --end.")
+        if options["role"] and DATASETS[options["dataset"]].role_field is None:
+            raise CommandError(
+                f"O dataset '{options['dataset']}' não aceita o filtro --role."
+            )
+
+        chunks = DataExportService.stream(
+            options["dataset"],
+            output=options["output"],
+            compress=options["gzip"],
+            chunk_size=options["chunk_size"],
+            start=options["start"],
+            end=options["end"],
+            role=options["role"],
+        )
+
+        started = time.monotonic()
+        written = 0
+        if options["file"] == "-":
+            target = sys.stdout.buffer
+            for chunk in chunks:
+                target.write(chunk)
+                written += len(chunk)
+            target.flush()
+        else:
+            with open(options["file"], "wb") as target:
+                for chunk in chunks:
+                    target.write(chunk)
+                    written += len(chunk)
+
+        self.stderr.write(
+            self.style.SUCCESS(
+                f"{written} bytes exportados em {time.monotonic() - started:.1f}s."
+            )
+        )
+
+    @staticmethod
+    def _date(value):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"data inválida: {value} (use AAAA-MM-DD)")
@@ -0,0 +1,150 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from performance.services.rebuild_service import (
+    PerformanceRebuildService,
+    RebuildResult,
+)
+
+User = get_user_model()
+
+
+def _rebuild_chunk(student_ids, batch_size):
+    """Executado em um processo do pool (cada processo abre a sua conexão)."""
+
+    try:
+        return PerformanceRebuildService.rebuild_students(student_ids, batch_size)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    """
+    Reconstrói StudentPerformance, CompetenceHistory e MonthlyEvolution a
+    partir de CompetenceScore.
+
+    Uso:
+        poetry run python manage.py rebuild_performance
+        poetry run python manage.py rebuild_performance --workers=4
+        poetry run python manage.py rebuild_performance --student=10 --student=11
+
+    Os alunos são lidos em blocos (--chunk-size); cada bloco é recalculado
+    com consultas agrupadas e gravado em lote, em uma transação própria.
+    """
+
+    help = "Reconstrói as tabelas de performance a partir das notas"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Quantidade de alunos por bloco",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.ESSAY_BULK_BATCH_SIZE,
+            help="Tamanho de cada INSERT em lote",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processos em paralelo (PostgreSQL)",
+        )
+        parser.add_argument(
+            "--student",
+            type=int,
+            action="append",
+            dest="students",
+            help="Reconstrói apenas este aluno (pode repetir)",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        batch_size = options["batch_size"]
+        workers = options["workers"]
+        if chunk_size < 1 or workers < 1:
+            raise CommandError("--chunk-size e --workers devem ser maiores que zero.")
+
+        if connection.vendor == "sqlite" and workers > 1:
+            # Processos escrevendo ao mesmo tempo falham com "database is locked"
+            self.stdout.write(
+                self.style.WARNING("SQLite serializa escritas: usando 1 processo.")
+            )
+            workers = 1
+
+        students = User.objects.filter(role="student")
+        if options["students"]:
+            students = students.filter(pk__in=options["students"])
+
+        total_students = students.count()
+        ids = students.order_by("pk").values_list("pk", flat=True)
+        chunks = self._chunks(ids.iterator(chunk_size=chunk_size), chunk_size)
+
+        self.totals = RebuildResult()
+        self.total_students = total_students
+        self.started = time.perf_counter()
+
+        if workers == 1:
+            for chunk in chunks:
+                self._progress(
+                    PerformanceRebuildService.rebuild_students(chunk, batch_size)
+                )
+        else:
+            self._run_parallel(list(chunks), batch_size, workers)
+
+        elapsed = time.perf_counter() - self.started
+        totals = self.totals
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{totals.students} alunos reconstruídos em {elapsed:.2f}s: "
+                f"{totals.performance} performances, {totals.history} históricos, "
+                f"{totals.months} meses ({totals.rows / (elapsed or 1):.0f} linhas/s)"
+            )
+        )
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    def _run_parallel(self, chunks, batch_size, workers):
+        # Conexões abertas não podem ser herdadas pelos processos filhos
+        connections.close_all()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=django.setup,
+        ) as pool:
+            futures = [
+                pool.submit(_rebuild_chunk, chunk, batch_size) for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                self._progress(future.result())
+
+    def _progress(self, result):
+        self.totals.add(result)
+        elapsed = time.perf_counter() - self.started
+        self.stdout.write(
+            f"{self.totals.students}/{self.total_students} alunos — "
+            f"{self.totals.rows} linhas ({self.totals.rows / (elapsed or 1):.0f} linhas/s)"
+        )
+
+    @staticmethod
+    def _chunks(ids, size):
+        chunk = []
+        for pk in ids:
+            chunk.append(pk)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
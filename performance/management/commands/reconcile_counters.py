@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from performance.services.counter_service import CounterService
+from performance.services.metrics_cache import MetricsCache
+
+
+class Command(BaseCommand):
+    """
+    Confere os contadores globais (PlatformCounter) com contagens exatas.
+
+    Uso:
+        poetry run python manage.py reconcile_counters
+        poetry run python manage.py reconcile_counters --dry-run
+
+    Deve rodar periodicamente (ex.: cron a cada hora): corrige divergências
+    deixadas por operações que não disparam signals (QuerySet.update,
+    SQL direto, restauração de backup).
+    """
+
+    help = "Corrige os contadores globais de usuários e redações"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas mostra as divergências, sem gravar",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+
+        with transaction.atomic():
+            drift = CounterService.reconcile(dry_run=dry_run)
+            if drift and not dry_run:
+                transaction.on_commit(MetricsCache.invalidate)
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Contadores em dia."))
+            return
+
+        for key, (current, wanted) in sorted(drift.items()):
+            self.stdout.write(f"{key}: {current} → {wanted}")
+
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING(f"{len(drift)} contadores divergentes (dry-run).")
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"{len(drift)} contadores corrigidos.")
+            )
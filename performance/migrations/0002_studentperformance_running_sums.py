@@ -0,0 +1,92 @@
+# Generated by Django 5.1 on 2026-10-18 10:27
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_running_sums(apps, schema_editor):
+    """
+    Preenche as somas acumuladas a partir das notas já existentes e recalcula
+    as médias a partir delas (como PerformanceService.reconcile_student_performance):
+    somas e médias saem coerentes, sem depender de rebuild_performance.
+    """
+    CompetenceScore = apps.get_model("essays", "CompetenceScore")
+    StudentPerformance = apps.get_model("performance", "StudentPerformance")
+
+    rows = (
+        CompetenceScore.objects.values("essay__student_id")
+        .annotate(
+            count=Count("id"),
+            sum_c1=Sum("c1"),
+            sum_c2=Sum("c2"),
+            sum_c3=Sum("c3"),
+            sum_c4=Sum("c4"),
+            sum_c5=Sum("c5"),
+        )
+        .order_by()
+    )
+    for row in rows.iterator():
+        count = row["count"]
+        sums = {f"sum_c{i}": row[f"sum_c{i}"] or 0 for i in range(1, 6)}
+        sum_total = sum(sums.values())
+        StudentPerformance.objects.update_or_create(
+            student_id=row["essay__student_id"],
+            defaults={
+                "total_essays_corrected": count,
+                "sum_total": sum_total,
+                "average_score": sum_total / count,
+                **sums,
+                **{f"avg_c{i}": sums[f"sum_c{i}"] / count for i in range(1, 6)},
+            },
+        )
+
+    # Linhas de alunos sem nenhuma nota: zeradas, como no reconcile
+    StudentPerformance.objects.exclude(
+        student_id__in=CompetenceScore.objects.values("essay__student_id")
+    ).update(
+        total_essays_corrected=0,
+        average_score=0,
+        **{f"avg_c{i}": 0 for i in range(1, 6)},
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("essays", "0005_essay_claim"),
+        ("performance", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="studentperformance",
+            name="sum_c1",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="studentperformance",
+            name="sum_c2",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="studentperformance",
+            name="sum_c3",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="studentperformance",
+            name="sum_c4",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="studentperformance",
+            name="sum_c5",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="studentperformance",
+            name="sum_total",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_running_sums, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.1 on 2026-10-18 10:28
+
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncMonth
+
+
+def rebuild_monthly_evolution(apps, schema_editor):
+    """
+    Reconstrói a evolução mensal a partir das notas, agrupando pelo mês
+    local da correção (antes era o mês do servidor no momento do cálculo).
+    """
+    CompetenceScore = apps.get_model("essays", "CompetenceScore")
+    MonthlyEvolution = apps.get_model("performance", "MonthlyEvolution")
+
+    rows = (
+        CompetenceScore.objects.annotate(
+            month_start=TruncMonth("corrected_at", tzinfo=ZoneInfo(settings.TIME_ZONE))
+        )
+        .values("essay__student_id", "month_start")
+        .annotate(
+            count=Count("id"),
+            total=Sum(F("c1") + F("c2") + F("c3") + F("c4") + F("c5")),
+        )
+    )
+
+    MonthlyEvolution.objects.all().delete()
+    MonthlyEvolution.objects.bulk_create(
+        [
+            MonthlyEvolution(
+                student_id=row["essay__student_id"],
+                year=row["month_start"].year,
+                month=row["month_start"].month,
+                essays_count=row["count"],
+                score_sum=row["total"] or 0,
+                avg_score_month=(row["total"] or 0) / row["count"],
+            )
+            for row in rows.iterator()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("essays", "0005_essay_claim"),
+        ("performance", "0002_studentperformance_running_sums"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="monthlyevolution",
+            name="essays_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="monthlyevolution",
+            name="score_sum",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(rebuild_monthly_evolution, migrations.RunPython.noop),
+    ]
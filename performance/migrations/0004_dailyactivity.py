@@ -0,0 +1,122 @@
+# Generated by Django 5.1 on 2026-10-18 10:34
+
+from zoneinfo import ZoneInfo
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_activity(apps, schema_editor):
+    """
+    Preenche os contadores diários com o histórico existente:
+    envios por Essay.created_at e correções por CompetenceScore.corrected_at
+    (total da plataforma + por professor), no dia local.
+    """
+    Essay = apps.get_model("essays", "Essay")
+    CompetenceScore = apps.get_model("essays", "CompetenceScore")
+    DailyActivity = apps.get_model("performance", "DailyActivity")
+
+    tz = ZoneInfo(settings.TIME_ZONE)
+    rows = []
+
+    created = (
+        Essay.objects.annotate(day=TruncDate("created_at", tzinfo=tz))
+        .values("day")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    rows += [
+        DailyActivity(day=row["day"], event="created", count=row["count"])
+        for row in created
+    ]
+
+    corrected = (
+        CompetenceScore.objects.annotate(day=TruncDate("corrected_at", tzinfo=tz))
+        .values("day", "corrected_by_id")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    totals = {}
+    for row in corrected:
+        totals[row["day"]] = totals.get(row["day"], 0) + row["count"]
+        if row["corrected_by_id"] is not None:
+            rows.append(
+                DailyActivity(
+                    day=row["day"],
+                    event="corrected",
+                    teacher_id=row["corrected_by_id"],
+                    count=row["count"],
+                )
+            )
+    rows += [
+        DailyActivity(day=day, event="corrected", count=count)
+        for day, count in totals.items()
+    ]
+
+    DailyActivity.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("essays", "0005_essay_claim"),
+        ("performance", "0003_monthlyevolution_running_sums"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyActivity",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                (
+                    "event",
+                    models.CharField(
+                        choices=[
+                            ("created", "Redações enviadas"),
+                            ("corrected", "Redações corrigidas"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "teacher",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_activity",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("teacher__isnull", True)),
+                        fields=("event", "day"),
+                        name="daily_activity_total_uniq",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("teacher__isnull", False)),
+                        fields=("teacher", "event", "day"),
+                        name="daily_activity_teacher_uniq",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_daily_activity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.1 on 2026-10-18 10:39
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_platform_counters(apps, schema_editor):
+    """
+    Cria todas as chaves conhecidas com as contagens atuais:
+    usuários (total e por papel) e redações (total e por status).
+    """
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    Essay = apps.get_model("essays", "Essay")
+    PlatformCounter = apps.get_model("performance", "PlatformCounter")
+
+    values = {"users": 0, "essays": 0}
+    for role in ("student", "teacher", "admin"):
+        values[f"users:role:{role}"] = 0
+    for status in ("draft", "submitted", "corrected"):
+        values[f"essays:status:{status}"] = 0
+
+    for row in User.objects.values("role").annotate(total=Count("id")).order_by():
+        values["users"] += row["total"]
+        values[f"users:role:{row['role']}"] = row["total"]
+
+    for row in Essay.objects.values("status").annotate(total=Count("id")).order_by():
+        values["essays"] += row["total"]
+        values[f"essays:status:{row['status']}"] = row["total"]
+
+    PlatformCounter.objects.bulk_create(
+        [PlatformCounter(key=key, value=value) for key, value in values.items()]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("performance", "0004_dailyactivity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlatformCounter",
+            fields=[
+                (
+                    "key",
+                    models.CharField(max_length=100, primary_key=True, serialize=False),
+                ),
+                ("value", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_platform_counters, migrations.RunPython.noop),
+    ]
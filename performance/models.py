@@ -39,6 +39,15 @@ class StudentPerformance(models.Model):
     avg_c4 = models.FloatField(default=0)
     avg_c5 = models.FloatField(default=0)
 
+    # Somas acumuladas — atualizadas com F() a cada correção, permitem
+    # recalcular as médias em O(1) sem varrer o histórico do aluno
+    sum_total = models.PositiveBigIntegerField(default=0)
+    sum_c1 = models.PositiveBigIntegerField(default=0)
+    sum_c2 = models.PositiveBigIntegerField(default=0)
+    sum_c3 = models.PositiveBigIntegerField(default=0)
+    sum_c4 = models.PositiveBigIntegerField(default=0)
+    sum_c5 = models.PositiveBigIntegerField(default=0)
+
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
@@ -97,6 +106,10 @@ class MonthlyEvolution(models.Model):
     - mês 6 de 2025 → média geral 760 → mostra evolução
 
     Permite análises temporais e insights sobre progresso.
+
+    Manutenção incremental:
+    - score_sum / essays_count avançam com F() a cada correção.
+    - O mês é o mês LOCAL (TIME_ZONE = America/Sao_Paulo) da correção.
     """
 
     student = models.ForeignKey(
@@ -110,6 +123,10 @@ class MonthlyEvolution(models.Model):
 
     avg_score_month = models.FloatField(default=0)
 
+    # Soma das notas totais e quantidade de correções do mês
+    score_sum = models.PositiveBigIntegerField(default=0)
+    essays_count = models.PositiveIntegerField(default=0)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -117,3 +134,77 @@ class MonthlyEvolution(models.Model):
 
     def __str__(self):
         return f"Evolução mensal: {self.student.email} {self.month}/{self.year}"
+
+
+# ==========================================================
+# 4. Atividade diária (gráficos dos dashboards)
+# ==========================================================
+class DailyActivity(models.Model):
+    """
+    Contadores diários de envios e correções, mantidos pelos serviços.
+
+    - Uma linha por (dia, evento) com teacher vazio → total da plataforma.
+    - Uma linha por (dia, evento, professor) → correções de cada professor.
+    - O dia é o dia LOCAL (TIME_ZONE) do evento.
+
+    Os gráficos de 7 dias leem um intervalo pequeno desta tabela, em vez
+    de contar redações dia a dia (custo independente do volume).
+    """
+
+    class Event(models.TextChoices):
+        CREATED = "created", "Redações enviadas"
+        CORRECTED = "corrected", "Redações corrigidas"
+
+    day = models.DateField()
+    event = models.CharField(max_length=20, choices=Event.choices)
+
+    teacher = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="daily_activity",
+    )
+
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "day"],
+                condition=models.Q(teacher__isnull=True),
+                name="daily_activity_total_uniq",
+            ),
+            models.UniqueConstraint(
+                fields=["teacher", "event", "day"],
+                condition=models.Q(teacher__isnull=False),
+                name="daily_activity_teacher_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_event_display()} em {self.day:%d/%m/%Y}: {self.count}"
+
+
+# ==========================================================
+# 5. Contadores globais (KPIs do admin)
+# ==========================================================
+class PlatformCounter(models.Model):
+    """
+    Contadores mantidos a cada escrita, para os KPIs do admin sem COUNT(*).
+
+    Chaves:
+    - "users" / "users:role:<role>"
+    - "essays" / "essays:status:<status>"
+
+    Atualizados na mesma transação da escrita (signals + serviços em lote).
+    Divergências são corrigidas por: manage.py reconcile_counters
+    """
+
+    key = models.CharField(max_length=100, primary_key=True)
+    value = models.BigIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.key} = {self.value}"
@@ -0,0 +1,102 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework import serializers
+
+from performance.services.data_export_service import DATASETS, OUTPUTS
+from performance.services.timeseries_service import (
+    BREAKDOWNS,
+    GRANULARITIES,
+    METRICS,
+    TimeSeriesService,
+)
+
+User = get_user_model()
+
+
+class TimeSeriesQuerySerializer(serializers.Serializer):
+    """
+    Valida os parâmetros de GET /api/performance/timeseries/.
+
+    - metrics: lista separada por vírgula (padrão: todas)
+    - start / end: datas locais, inclusive (padrão: últimos 30 dias)
+    - granularity: day | week | month
+    - student / teacher: filtros por id
+    - breakdown: student | teacher | competence
+    """
+
+    metrics = serializers.CharField(required=False)
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    granularity = serializers.ChoiceField(choices=GRANULARITIES, default="day")
+    student = serializers.IntegerField(required=False, min_value=1)
+    teacher = serializers.IntegerField(required=False, min_value=1)
+    breakdown = serializers.ChoiceField(choices=BREAKDOWNS, required=False)
+
+    def validate_metrics(self, value):
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        invalid = sorted(set(names) - set(METRICS))
+        if invalid:
+            raise serializers.ValidationError(
+                f"Métricas inválidas: {', '.join(invalid)}. "
+                f"Use: {', '.join(METRICS)}."
+            )
+        return list(dict.fromkeys(names))
+
+    def validate(self, attrs):
+        attrs.setdefault("metrics", list(METRICS))
+        attrs["end"] = attrs.get("end") or timezone.localdate()
+        attrs["start"] = attrs.get("start") or attrs["end"] - timedelta(days=29)
+
+        if attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError(
+                {"start": "A data inicial deve ser anterior à final."}
+            )
+
+        buckets = TimeSeriesService.buckets(
+            attrs["start"], attrs["end"], attrs["granularity"]
+        )
+        if len(buckets) > settings.PERFORMANCE_TIMESERIES_MAX_BUCKETS:
+            raise serializers.ValidationError(
+                {
+                    "granularity": "Intervalo longo demais para esta granularidade "
+                    f"(máximo de {settings.PERFORMANCE_TIMESERIES_MAX_BUCKETS} "
+                    "períodos)."
+                }
+            )
+        return attrs
+
+
+class DataExportQuerySerializer(serializers.Serializer):
+    """
+    Valida os parâmetros de GET /api/performance/export/<dataset>/.
+
+    - output: csv | jsonl
+    - gzip: true → arquivo .gz comprimido em streaming
+    - start / end: datas locais, inclusive (opcionais)
+    - role: papel do usuário de cada linha (aluno da redação, professor
+      da nota...); recusado nos datasets sem esse filtro (performance)
+
+    Espera o dataset em context["dataset"].
+    """
+
+    output = serializers.ChoiceField(choices=OUTPUTS, default="csv")
+    gzip = serializers.BooleanField(default=False)
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    role = serializers.ChoiceField(choices=User.Role.choices, required=False)
+
+    def validate_role(self, value):
+        if DATASETS[self.context["dataset"]].role_field is None:
+            raise serializers.ValidationError(
+                f"O dataset '{self.context['dataset']}' não aceita o filtro role."
+            )
+        return value
+
+    def validate(self, attrs):
+        if attrs.get("start") and attrs.get("end") and attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError(
+                {"start": "A data inicial deve ser anterior à final."}
+            )
+        return attrs
@@ -0,0 +1,187 @@
+"""
+Service Layer dos contadores globais (PlatformCounter).
+
+Chamado por:
+- performance/signals.py → save/delete de CustomUser e Essay
+- SubmissionService / CorrectionService → operações em lote (sem signals)
+- manage.py reconcile_counters → correção de divergências
+
+Lido por GlobalMetrics.platform_counts() com UMA consulta por chave primária.
+"""
+
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.db.models import Case, Count, F, Value, When
+
+from essays.models import Essay
+from performance.models import PlatformCounter
+
+User = get_user_model()
+
+
+class CounterService:
+    """Incrementa, lê e reconcilia os contadores globais."""
+
+    @staticmethod
+    def bump(deltas):
+        """
+        Aplica {chave: delta} com UM UPDATE (CASE por chave).
+
+        Chaves ainda inexistentes (raro: a migração cria todas as chaves
+        conhecidas) são criadas com INSERT ... ON CONFLICT DO NOTHING e
+        recebem o UPDATE em seguida.
+        """
+
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        if CounterService._apply(deltas) == len(deltas):
+            return
+
+        present = set(
+            PlatformCounter.objects.filter(key__in=list(deltas)).values_list(
+                "key", flat=True
+            )
+        )
+        missing = {key: delta for key, delta in deltas.items() if key not in present}
+
+        PlatformCounter.objects.bulk_create(
+            [PlatformCounter(key=key) for key in missing], ignore_conflicts=True
+        )
+        CounterService._apply(missing)
+
+    @staticmethod
+    def values(keys):
+        """{chave: valor} das chaves pedidas (0 quando não existe)."""
+
+        found = dict(
+            PlatformCounter.objects.filter(key__in=list(keys)).values_list(
+                "key", "value"
+            )
+        )
+        return {key: found.get(key, 0) for key in keys}
+
+    # ==========================================================
+    # Eventos
+    # ==========================================================
+    @staticmethod
+    def essays_created(status, count=1):
+        deltas = {"essays": count}
+        if status:
+            deltas[CounterService.essay_status_key(status)] = count
+        CounterService.bump(deltas)
+
+    @staticmethod
+    def essays_deleted(status, count=1):
+        CounterService.essays_created(status, -count)
+
+    @staticmethod
+    def essay_status_changed(transitions):
+        """transitions: iterável de (status_antigo, status_novo)."""
+
+        deltas = Counter()
+        for old, new in transitions:
+            if not old or not new or old == new:
+                continue
+            deltas[CounterService.essay_status_key(old)] -= 1
+            deltas[CounterService.essay_status_key(new)] += 1
+        CounterService.bump(deltas)
+
+    @staticmethod
+    def users_created(role, count=1):
+        deltas = {"users": count}
+        if role:
+            deltas[CounterService.user_role_key(role)] = count
+        CounterService.bump(deltas)
+
+    @staticmethod
+    def users_deleted(role, count=1):
+        CounterService.users_created(role, -count)
+
+    @staticmethod
+    def user_role_changed(old, new):
+        if not old or not new or old == new:
+            return
+        CounterService.bump(
+            {
+                CounterService.user_role_key(old): -1,
+                CounterService.user_role_key(new): 1,
+            }
+        )
+
+    @staticmethod
+    def essay_status_key(status):
+        return f"essays:status:{status}"
+
+    @staticmethod
+    def user_role_key(role):
+        return f"users:role:{role}"
+
+    # ==========================================================
+    # Reconciliação
+    # ==========================================================
+    @staticmethod
+    def exact_values():
+        """Contagens exatas (2 consultas agrupadas) no formato das chaves."""
+
+        values = Counter()
+        for role, total in (
+            User.objects.values_list("role").annotate(total=Count("id")).order_by()
+        ):
+            values["users"] += total
+            values[CounterService.user_role_key(role)] = total
+
+        for status, total in (
+            Essay.objects.values_list("status").annotate(total=Count("id")).order_by()
+        ):
+            values["essays"] += total
+            values[CounterService.essay_status_key(status)] = total
+
+        for role in User._meta.get_field("role").choices or ():
+            values.setdefault(CounterService.user_role_key(role[0]), 0)
+        for status in Essay.Status.values:
+            values.setdefault(CounterService.essay_status_key(status), 0)
+
+        return dict(values)
+
+    @staticmethod
+    def reconcile(dry_run=False):
+        """
+        Compara os contadores com as contagens exatas e corrige a diferença.
+
+        A correção é aplicada como delta (value + diferença), para não
+        perder incrementos feitos durante a contagem.
+
+        Returns:
+            dict: {chave: (valor_atual, valor_exato)} das chaves divergentes.
+        """
+
+        exact = CounterService.exact_values()
+        stored = dict(PlatformCounter.objects.values_list("key", "value"))
+
+        drift = {
+            key: (stored.get(key, 0), exact.get(key, 0))
+            for key in set(exact) | set(stored)
+            if stored.get(key, 0) != exact.get(key, 0)
+        }
+
+        if drift and not dry_run:
+            CounterService.bump(
+                {key: wanted - current for key, (current, wanted) in drift.items()}
+            )
+
+        return drift
+
+    @staticmethod
+    def _apply(deltas):
+        if not deltas:
+            return 0
+        return PlatformCounter.objects.filter(key__in=list(deltas)).update(
+            value=F("value")
+            + Case(
+                *(When(key=key, then=Value(delta)) for key, delta in deltas.items()),
+                default=Value(0),
+            )
+        )
@@ -0,0 +1,220 @@
+"""
+Service Layer das exportações de dados brutos (CSV / JSONL).
+
+Usado por:
+- PerformanceDataExportView → GET /api/performance/export/<dataset>/
+- manage.py export_data
+
+Cada exportação é UMA consulta lida com .iterator(chunk_size) sobre uma
+projeção values_list; as linhas são serializadas em blocos de ~64 KB e
+(opcionalmente) comprimidas com gzip em streaming. A memória fica
+constante, independentemente da quantidade de linhas.
+"""
+
+import csv
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from essays.models import CompetenceScore, Essay
+from performance.models import CompetenceHistory, StudentPerformance
+
+OUTPUTS = ("csv", "jsonl")
+FLUSH_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Modelo exportado, colunas e campos usados nos filtros."""
+
+    model: type
+    columns: tuple
+    date_field: str  # filtro start/end
+    role_field: str | None  # filtro role (papel do usuário da linha); None → sem filtro
+
+
+DATASETS = {
+    "essays": Dataset(
+        Essay,
+        (
+            "id",
+            "student_id",
+            "student__email",
+            "title",
+            "status",
+            "score_total",
+            "pdf_status",
+            "created_at",
+            "updated_at",
+        ),
+        "created_at",
+        "student__role",
+    ),
+    "scores": Dataset(
+        CompetenceScore,
+        (
+            "id",
+            "essay_id",
+            "essay__student_id",
+            "corrected_by_id",
+            "c1",
+            "c2",
+            "c3",
+            "c4",
+            "c5",
+            "corrected_at",
+        ),
+        "corrected_at",
+        "corrected_by__role",
+    ),
+    "history": Dataset(
+        CompetenceHistory,
+        ("id", "student_id", "essay_id", "c1", "c2", "c3", "c4", "c5", "created_at"),
+        "created_at",
+        "student__role",
+    ),
+    "performance": Dataset(
+        StudentPerformance,
+        (
+            "student_id",
+            "student__email",
+            "total_essays_corrected",
+            "average_score",
+            "avg_c1",
+            "avg_c2",
+            "avg_c3",
+            "avg_c4",
+            "avg_c5",
+            "updated_at",
+        ),
+        "updated_at",
+        # Só existe performance de aluno: filtrar por papel não faz sentido
+        None,
+    ),
+}
+
+
+class _Echo:
+    """csv.writer escreve aqui e recebe a linha de volta (sem buffer)."""
+
+    def write(self, value):
+        return value
+
+
+class DataExportService:
+    """Gera exportações CSV/JSONL em streaming."""
+
+    @staticmethod
+    def queryset(dataset, start=None, end=None, role=None):
+        """
+        Projeção values_list do dataset, filtrada por datas locais e papel.
+
+        Raises:
+            ValueError: role em um dataset sem filtro por papel.
+        """
+
+        spec = DATASETS[dataset]
+        if role and spec.role_field is None:
+            raise ValueError(f"O dataset '{dataset}' não aceita o filtro role.")
+
+        queryset = spec.model.objects.all()
+
+        tz = ZoneInfo(settings.TIME_ZONE)
+        if start:
+            queryset = queryset.filter(
+                **{
+                    f"{spec.date_field}__gte": datetime.combine(
+                        start, time.min, tzinfo=tz
+                    )
+                }
+            )
+        if end:
+            queryset = queryset.filter(
+                **{
+                    f"{spec.date_field}__lte": datetime.combine(
+                        end, time.max, tzinfo=tz
+                    )
+                }
+            )
+        if role:
+            queryset = queryset.filter(**{spec.role_field: role})
+
+        # Ordem pela chave primária: percorre o índice, sem ordenação em memória
+        return queryset.order_by("pk").values_list(*spec.columns)
+
+    @staticmethod
+    def stream(dataset, output="csv", compress=False, chunk_size=None, **filters):
+        """
+        Gera os bytes da exportação.
+
+        Args:
+            dataset: chave de DATASETS.
+            output: "csv" ou "jsonl".
+            compress: True → gzip em streaming.
+            filters: start, end (datas locais) e role.
+        """
+
+        spec = DATASETS[dataset]
+        rows = DataExportService.queryset(dataset, **filters).iterator(
+            chunk_size=chunk_size or settings.DATA_EXPORT_CHUNK_SIZE
+        )
+
+        if output == "csv":
+            lines = DataExportService._csv_lines(spec.columns, rows)
+        else:
+            lines = DataExportService._jsonl_lines(spec.columns, rows)
+
+        chunks = DataExportService._buffered(lines)
+        if compress:
+            chunks = DataExportService._gzip(chunks)
+        return chunks
+
+    @staticmethod
+    def filename(dataset, output, compress):
+        return f"{dataset}.{output}" + (".gz" if compress else "")
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    @staticmethod
+    def _csv_lines(columns, rows):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow(row)
+
+    @staticmethod
+    def _jsonl_lines(columns, rows):
+        encoder = DjangoJSONEncoder(ensure_ascii=False)
+        for row in rows:
+            yield encoder.encode(dict(zip(columns, row))) + "\n"
+
+    @staticmethod
+    def _buffered(lines):
+        """Junta as linhas em blocos de ~FLUSH_BYTES (menos writes no socket)."""
+
+        buffer = []
+        size = 0
+        for line in lines:
+            data = line.encode()
+            buffer.append(data)
+            size += len(data)
+            if size >= FLUSH_BYTES:
+                yield b"".join(buffer)
+                buffer = []
+                size = 0
+        if buffer:
+            yield b"".join(buffer)
+
+    @staticmethod
+    def _gzip(chunks):
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # 31 → formato gzip
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
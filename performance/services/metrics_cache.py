@@ -0,0 +1,198 @@
+"""
+Cache compartilhado das métricas globais (stale-while-revalidate).
+
+Usado por:
+- dashboard/services.py → painéis de admin e professor
+- performance/views.py → DashboardAdminMetrics / DashboardTeacherMetrics
+
+Funcionamento:
+- Valor dentro do TTL → devolvido direto do cache (nenhuma consulta).
+- Valor vencido (ou invalidado) → devolvido na hora, e UMA thread recalcula
+  em segundo plano (lock single-flight com cache.add).
+- Sem valor → calculado na requisição; concorrentes aguardam o primeiro.
+
+Invalidação: performance/signals.py marca as métricas como vencidas quando
+redações, notas ou usuários mudam; os serviços em lote chamam invalidate().
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+
+from essays.models import Essay
+from performance.models import DailyActivity
+from performance.services.counter_service import CounterService
+from performance.services.rollup_service import ActivityRollupService
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+class MetricsCache:
+    """Leitura com stale-while-revalidate sobre o cache do Django."""
+
+    PREFIX = "metrics:"
+
+    @staticmethod
+    def get(name, compute, ttl=None):
+        """
+        Devolve o valor de `name`, recalculando com `compute()` se preciso.
+
+        Args:
+            name: chave da métrica.
+            compute: função sem argumentos que consulta o banco.
+            ttl: segundos em que o valor é considerado fresco.
+        """
+
+        entry = cache.get(MetricsCache.PREFIX + name)
+
+        if entry is None:
+            return MetricsCache._compute_once(name, compute, ttl)
+
+        if entry["expires"] <= time.time():
+            MetricsCache._refresh_in_background(name, compute, ttl)
+
+        return entry["value"]
+
+    @staticmethod
+    def set(name, value, ttl=None):
+        ttl = ttl or settings.METRICS_CACHE_TTL
+        cache.set(
+            MetricsCache.PREFIX + name,
+            {"value": value, "expires": time.time() + ttl},
+            ttl + settings.METRICS_CACHE_STALE_TTL,
+        )
+
+    @staticmethod
+    def invalidate(*names):
+        """
+        Marca as métricas como vencidas (padrão: todas as globais).
+
+        O valor antigo continua sendo servido até o recálculo terminar.
+        """
+
+        keys = [MetricsCache.PREFIX + name for name in names or GLOBAL_METRICS]
+        entries = cache.get_many(keys)
+        if not entries:
+            return
+
+        for entry in entries.values():
+            entry["expires"] = 0
+        cache.set_many(entries, settings.METRICS_CACHE_STALE_TTL)
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    @staticmethod
+    def _lock(name):
+        return cache.add(
+            f"{MetricsCache.PREFIX}{name}:lock",
+            1,
+            settings.METRICS_CACHE_LOCK_TIMEOUT,
+        )
+
+    @staticmethod
+    def _unlock(name):
+        cache.delete(f"{MetricsCache.PREFIX}{name}:lock")
+
+    @staticmethod
+    def _compute_once(name, compute, ttl):
+        """Cache vazio: um processo calcula, os demais esperam um pouco."""
+
+        if not MetricsCache._lock(name):
+            deadline = time.monotonic() + settings.METRICS_CACHE_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                entry = cache.get(MetricsCache.PREFIX + name)
+                if entry is not None:
+                    return entry["value"]
+            # Quem segura o lock demorou demais: calcula sem gravar
+            return compute()
+
+        try:
+            value = compute()
+            MetricsCache.set(name, value, ttl)
+            return value
+        finally:
+            MetricsCache._unlock(name)
+
+    @staticmethod
+    def _refresh_in_background(name, compute, ttl):
+        if not MetricsCache._lock(name):
+            return  # outro processo/thread já está recalculando
+
+        def refresh():
+            try:
+                MetricsCache.set(name, compute(), ttl)
+            except Exception:
+                logger.exception("Falha ao recalcular a métrica %s", name)
+            finally:
+                MetricsCache._unlock(name)
+                if settings.METRICS_CACHE_ASYNC_REFRESH:
+                    connection.close()
+
+        if settings.METRICS_CACHE_ASYNC_REFRESH:
+            threading.Thread(target=refresh, daemon=True).start()
+        else:
+            refresh()
+
+
+class GlobalMetrics:
+    """Métricas iguais para todos os usuários, servidas pelo MetricsCache."""
+
+    @staticmethod
+    def platform_counts():
+        """
+        {"users_count", "students_count", "teachers_count",
+         "essays_count", "pending_count", "corrected_count"}
+        """
+        return MetricsCache.get("platform_counts", GlobalMetrics._platform_counts)
+
+    @staticmethod
+    def activity(event):
+        """Rótulos e valores dos últimos 7 dias de um evento DailyActivity."""
+        return MetricsCache.get(
+            f"activity:{event}", lambda: ActivityRollupService.series(event)
+        )
+
+    @staticmethod
+    def recent_essays(limit=10):
+        """Últimas redações da plataforma (tabela do painel admin)."""
+        return MetricsCache.get(
+            f"recent_essays:{limit}",
+            lambda: list(
+                Essay.objects.only(
+                    "id", "title", "status", "score_total", "created_at"
+                ).order_by("-created_at", "-id")[:limit]
+            ),
+        )
+
+    @staticmethod
+    def _platform_counts():
+        """Lidos dos contadores mantidos (UMA consulta por chave primária)."""
+
+        keys = {
+            "users_count": "users",
+            "students_count": CounterService.user_role_key(User.Role.STUDENT),
+            "teachers_count": CounterService.user_role_key(User.Role.TEACHER),
+            "essays_count": "essays",
+            "pending_count": CounterService.essay_status_key(Essay.Status.SUBMITTED),
+            "corrected_count": CounterService.essay_status_key(Essay.Status.CORRECTED),
+        }
+        values = CounterService.values(keys.values())
+        return {name: values[key] for name, key in keys.items()}
+
+
+# Chaves invalidadas por MetricsCache.invalidate() sem argumentos
+GLOBAL_METRICS = (
+    "platform_counts",
+    f"activity:{DailyActivity.Event.CREATED}",
+    f"activity:{DailyActivity.Event.CORRECTED}",
+    "recent_essays:10",
+)
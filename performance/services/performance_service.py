@@ -1,147 +1,328 @@
 """
 Service Layer responsável por atualizar as métricas de performance do aluno.
 
-Chamado automaticamente quando o professor corrige uma redação.
+Chamado pelo CorrectionService, dentro da mesma transação da correção.
+Com PERFORMANCE_METRICS_ASYNC=True, as tabelas agregadas são recalculadas
+pela tarefa "performance.reconcile_student" (manage.py runworker).
 """
 
-from datetime import datetime
-from django.db.models import Avg
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db.models import Count, F, FloatField, Sum, Value
+from django.db.models.functions import Cast, Coalesce, NullIf, TruncMonth
 from performance.models import (
     StudentPerformance,
     CompetenceHistory,
     MonthlyEvolution,
 )
+from django.utils import timezone
 from essays.models import Essay, CompetenceScore
 
+COMPETENCES = ("c1", "c2", "c3", "c4", "c5")
+
 
 class PerformanceService:
     """
     Camada de serviço para atualizar métricas de forma limpa e escalável.
 
-    Chamado em EssayCorrectionView → perform_create()
+    Chamado em CorrectionService.correct() / bulk_correct()
     """
 
     @staticmethod
-    def update_all_metrics(essay: Essay, competence: CompetenceScore):
+    def update_all_metrics(
+        essay: Essay, competence: CompetenceScore, previous: dict | None = None
+    ):
         """
         Atualiza:
         - histórico ponto-a-ponto
-        - métricas agregadas
+        - métricas agregadas (incrementais, O(1))
         - evolução mensal
+
+        Args:
+            previous: notas anteriores {"c1".."c5"} quando é uma recorreção.
+        """
+
+        new = PerformanceService.scores_of(competence)
+        delta = PerformanceService._diff(new, previous)
+
+        PerformanceService._save_competence_history(essay, competence, previous)
+        if settings.PERFORMANCE_METRICS_ASYNC:
+            PerformanceService.schedule_reconcile(essay.student_id)
+            return
+
+        PerformanceService.apply_performance_delta(
+            essay.student_id, delta, 0 if previous else 1
+        )
+        PerformanceService._update_monthly_evolution(essay, competence, previous)
+
+    @staticmethod
+    def revert_metrics(student_id, previous: dict, corrected_at):
+        """
+        Desfaz a contribuição de uma nota removida (CompetenceScore apagado).
+        """
+
+        if settings.PERFORMANCE_METRICS_ASYNC:
+            PerformanceService.schedule_reconcile(student_id)
+            return
+
+        delta = {name: -value for name, value in previous.items()}
+        PerformanceService.apply_performance_delta(
+            student_id, delta, -1, create_missing=False
+        )
+        PerformanceService.apply_monthly_delta(
+            student_id, corrected_at, -sum(previous.values()), -1
+        )
+
+    @staticmethod
+    def delete_competence_history(essay_id):
+        """Remove o ponto do histórico de uma nota apagada."""
+
+        CompetenceHistory.objects.filter(essay_id=essay_id).delete()
+
+    @staticmethod
+    def record_bulk_corrections(student_id, sums: dict, count: int, corrected_at):
+        """
+        Aplica de uma só vez as notas de várias correções de UM aluno.
+
+        O histórico já foi gravado em lote pelo chamador; aqui apenas
+        as tabelas agregadas são atualizadas (uma vez por aluno).
         """
 
-        PerformanceService._save_competence_history(essay, competence)
-        PerformanceService._update_student_performance(essay.student)
-        PerformanceService._update_monthly_evolution(essay, competence)
+        if settings.PERFORMANCE_METRICS_ASYNC:
+            PerformanceService.schedule_reconcile(student_id)
+            return
+
+        PerformanceService.apply_performance_delta(student_id, sums, count)
+        PerformanceService.apply_monthly_delta(
+            student_id, corrected_at, sum(sums.values()), count
+        )
+
+    @staticmethod
+    def schedule_reconcile(student_id):
+        """Enfileira o recálculo do aluno (uma tarefa pendente por aluno)."""
+
+        from performance.tasks import reconcile_student
+
+        reconcile_student.enqueue(
+            {"student_id": student_id},
+            key=f"performance.reconcile_student:{student_id}",
+        )
+
+    @staticmethod
+    def scores_of(competence) -> dict:
+        return {name: getattr(competence, name) for name in COMPETENCES}
+
+    @staticmethod
+    def _diff(new: dict, previous: dict | None) -> dict:
+        if not previous:
+            return dict(new)
+        return {name: new[name] - previous[name] for name in COMPETENCES}
 
     # ==========================================================
     # 1. Histórico da redação (ponto no gráfico)
     # ==========================================================
     @staticmethod
-    def _save_competence_history(essay: Essay, competence: CompetenceScore):
+    def _save_competence_history(
+        essay: Essay, competence: CompetenceScore, previous: dict | None = None
+    ):
+        """Uma linha por redação: a recorreção atualiza a linha existente."""
+
+        scores = PerformanceService.scores_of(competence)
+        if previous and CompetenceHistory.objects.filter(essay_id=essay.pk).update(
+            **scores
+        ):
+            return
+
         CompetenceHistory.objects.create(
-            student=essay.student,
-            essay=essay,
-            c1=competence.c1,
-            c2=competence.c2,
-            c3=competence.c3,
-            c4=competence.c4,
-            c5=competence.c5,
+            student_id=essay.student_id, essay_id=essay.pk, **scores
         )
 
     # ==========================================================
     # 2. Atualiza agregações gerais
     # ==========================================================
     @staticmethod
-    def _update_student_performance(student):
+    def apply_performance_delta(
+        student_id, delta: dict, count_delta: int, create_missing=True
+    ):
         """
-        Atualiza automaticamente:
-        - média geral
-        - média por competência
-        - total de redações corrigidas
+        Soma `delta` às somas acumuladas do aluno com UM UPDATE atômico.
+
+        - Somas e contagem avançam com F() → sem corrida entre transações.
+        - As médias são recalculadas no mesmo comando a partir das novas
+          somas (o SQL avalia o lado direito com os valores antigos).
+        - Custo constante, independente do tamanho do histórico.
+
+        Se o aluno ainda não tem linha de performance, ela é criada por
+        reconcile_student_performance (cálculo exato).
         """
 
-        corrections = CompetenceScore.objects.filter(essay__student=student)
+        count = F("total_essays_corrected") + count_delta
+        total_delta = sum(delta.values())
 
-        if not corrections.exists():
-            return
+        values = {
+            "total_essays_corrected": count,
+            "sum_total": F("sum_total") + total_delta,
+            "average_score": PerformanceService._average(
+                F("sum_total") + total_delta, count
+            ),
+            "updated_at": timezone.now(),
+        }
+        for name in COMPETENCES:
+            new_sum = F(f"sum_{name}") + delta.get(name, 0)
+            values[f"sum_{name}"] = new_sum
+            values[f"avg_{name}"] = PerformanceService._average(new_sum, count)
+
+        updated = StudentPerformance.objects.filter(student_id=student_id).update(
+            **values
+        )
+        if not updated and create_missing:
+            PerformanceService.reconcile_student_performance(student_id)
 
-        perf, _ = StudentPerformance.objects.get_or_create(student=student)
+    @staticmethod
+    def reconcile_student_performance(student_id):
+        """
+        Reconstrói EXATAMENTE as somas e médias do aluno a partir de
+        CompetenceScore (uma consulta agregada + um upsert).
 
-        perf.total_essays_corrected = corrections.count()
+        Usado na primeira correção do aluno e para corrigir divergências.
+        """
 
-        perf.average_score = (
-            corrections.aggregate(
-                total=Avg(
-                    (
-                        models.F("c1")
-                        + models.F("c2")
-                        + models.F("c3")
-                        + models.F("c4")
-                        + models.F("c5")
-                    )
-                )
-            )["total"]
-            or 0
+        totals = CompetenceScore.objects.filter(essay__student_id=student_id).aggregate(
+            count=Count("id"),
+            **{f"sum_{name}": Sum(name) for name in COMPETENCES},
         )
 
-        perf.avg_c1 = corrections.aggregate(Avg("c1"))["c1__avg"] or 0
-        perf.avg_c2 = corrections.aggregate(Avg("c2"))["c2__avg"] or 0
-        perf.avg_c3 = corrections.aggregate(Avg("c3"))["c3__avg"] or 0
-        perf.avg_c4 = corrections.aggregate(Avg("c4"))["c4__avg"] or 0
-        perf.avg_c5 = corrections.aggregate(Avg("c5"))["c5__avg"] or 0
+        count = totals.pop("count")
+        sums = {key: value or 0 for key, value in totals.items()}
+        sum_total = sum(sums.values())
+
+        values = {
+            "total_essays_corrected": count,
+            "sum_total": sum_total,
+            "average_score": sum_total / count if count else 0,
+            **sums,
+            **{
+                f"avg_{name}": sums[f"sum_{name}"] / count if count else 0
+                for name in COMPETENCES
+            },
+        }
 
-        perf.save()
+        StudentPerformance.objects.update_or_create(
+            student_id=student_id, defaults=values
+        )
+
+    @staticmethod
+    def _average(sum_expression, count_expression):
+        """sum / count em ponto flutuante; 0 quando count = 0."""
+        return Coalesce(
+            Cast(sum_expression, FloatField()) / NullIf(count_expression, 0),
+            Value(0.0),
+        )
 
     # ==========================================================
     # 3. Atualiza evolução mensal
     # ==========================================================
     @staticmethod
-    def _update_monthly_evolution(essay: Essay, competence: CompetenceScore):
+    def _update_monthly_evolution(
+        essay: Essay, competence: CompetenceScore, previous: dict | None = None
+    ):
         """
-        Registra a média do mês corrente.
+        Soma a nota no mês LOCAL da correção.
         O gráfico de evolução usa esses dados.
+
+        Em uma recorreção, o mês continua sendo o da correção original
+        e apenas a diferença de nota é aplicada.
         """
 
-        now = datetime.now()
-        month = now.month
-        year = now.year
+        new_total = competence.total()
+        old_total = sum(previous.values()) if previous else 0
 
-        total = (
-            competence.c1
-            + competence.c2
-            + competence.c3
-            + competence.c4
-            + competence.c5
+        PerformanceService.apply_monthly_delta(
+            essay.student_id,
+            competence.corrected_at,
+            new_total - old_total,
+            0 if previous else 1,
         )
 
-        evolution, created = MonthlyEvolution.objects.get_or_create(
-            student=essay.student,
-            month=month,
-            year=year,
-            defaults={"avg_score_month": total},
+    @staticmethod
+    def apply_monthly_delta(student_id, moment, total_delta, count_delta):
+        """
+        Atualiza o mês de `moment` com UM UPDATE atômico (caminho comum).
+
+        - Primeira correção do mês: INSERT ... ON CONFLICT DO NOTHING e
+          o mesmo UPDATE novamente (seguro contra corrida, sem savepoint).
+        - Mês que ficou sem correções (remoções) é apagado.
+        """
+
+        year, month = PerformanceService.local_month(moment)
+        bucket = MonthlyEvolution.objects.filter(
+            student_id=student_id, year=year, month=month
         )
 
-        if not created:
-            # atualizar média mensal recalculando baseado no histórico
-            all_scores = CompetenceHistory.objects.filter(
-                student=essay.student, created_at__year=year, created_at__month=month
-            )
+        count = F("essays_count") + count_delta
+        new_sum = F("score_sum") + total_delta
+        values = {
+            "essays_count": count,
+            "score_sum": new_sum,
+            "avg_score_month": PerformanceService._average(new_sum, count),
+        }
+
+        if bucket.update(**values):
+            if count_delta < 0:
+                bucket.filter(essays_count=0).delete()
+            return
+
+        if count_delta <= 0:
+            return
+
+        MonthlyEvolution.objects.bulk_create(
+            [MonthlyEvolution(student_id=student_id, year=year, month=month)],
+            ignore_conflicts=True,
+        )
+        bucket.update(**values)
+
+    @staticmethod
+    def local_month(moment):
+        """(ano, mês) de `moment` no fuso do projeto (TIME_ZONE)."""
+
+        moment = moment or timezone.now()
+        if timezone.is_aware(moment):
+            moment = timezone.localtime(moment)
+        return moment.year, moment.month
 
-            new_avg = (
-                all_scores.aggregate(
-                    avg=Avg(
-                        (
-                            models.F("c1")
-                            + models.F("c2")
-                            + models.F("c3")
-                            + models.F("c4")
-                            + models.F("c5")
-                        )
-                    )
-                )["avg"]
-                or total
+    @staticmethod
+    def reconcile_monthly_evolution(student_id):
+        """
+        Reconstrói a evolução mensal do aluno a partir de CompetenceScore,
+        agrupando pelo mês local da correção (uma consulta agregada).
+        """
+
+        rows = (
+            CompetenceScore.objects.filter(essay__student_id=student_id)
+            .annotate(
+                month_start=TruncMonth(
+                    "corrected_at", tzinfo=ZoneInfo(settings.TIME_ZONE)
+                )
             )
+            .values("month_start")
+            .annotate(
+                count=Count("id"),
+                total=Sum(F("c1") + F("c2") + F("c3") + F("c4") + F("c5")),
+            )
+        )
 
-            evolution.avg_score_month = new_avg
-            evolution.save()
+        MonthlyEvolution.objects.filter(student_id=student_id).delete()
+        MonthlyEvolution.objects.bulk_create(
+            [
+                MonthlyEvolution(
+                    student_id=student_id,
+                    year=row["month_start"].year,
+                    month=row["month_start"].month,
+                    essays_count=row["count"],
+                    score_sum=row["total"] or 0,
+                    avg_score_month=(row["total"] or 0) / row["count"],
+                )
+                for row in rows
+            ]
+        )
@@ -0,0 +1,194 @@
+"""
+Service Layer que reconstrói as tabelas de performance a partir das notas.
+
+Usado por:
+- manage.py rebuild_performance → após importações ou divergências
+
+Fonte da verdade: CompetenceScore. Para cada bloco de alunos:
+- StudentPerformance → 1 consulta agrupada + 1 upsert em lote
+- CompetenceHistory → 1 DELETE + INSERT em lote (uma linha por redação)
+- MonthlyEvolution → 1 consulta agrupada por mês local + INSERT em lote
+"""
+
+from dataclasses import dataclass
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum
+from django.db.models.functions import TruncMonth
+
+from essays.models import CompetenceScore
+from performance.models import CompetenceHistory, MonthlyEvolution, StudentPerformance
+
+COMPETENCES = ("c1", "c2", "c3", "c4", "c5")
+
+
+@dataclass
+class RebuildResult:
+    """Linhas gravadas na reconstrução de um bloco de alunos."""
+
+    students: int = 0
+    performance: int = 0
+    history: int = 0
+    months: int = 0
+
+    @property
+    def rows(self):
+        return self.performance + self.history + self.months
+
+    def add(self, other):
+        self.students += other.students
+        self.performance += other.performance
+        self.history += other.history
+        self.months += other.months
+
+
+class PerformanceRebuildService:
+    """Recalcula StudentPerformance, CompetenceHistory e MonthlyEvolution."""
+
+    @staticmethod
+    def rebuild_students(student_ids, batch_size=None) -> RebuildResult:
+        """
+        Reconstrói as três tabelas para um bloco de alunos, em uma transação.
+
+        Alunos sem correções ficam sem linhas de performance/histórico/mês.
+        """
+
+        batch_size = batch_size or settings.ESSAY_BULK_BATCH_SIZE
+        student_ids = list(student_ids)
+        result = RebuildResult(students=len(student_ids))
+
+        with transaction.atomic():
+            result.performance = PerformanceRebuildService._rebuild_performance(
+                student_ids, batch_size
+            )
+            result.history = PerformanceRebuildService._rebuild_history(
+                student_ids, batch_size
+            )
+            result.months = PerformanceRebuildService._rebuild_monthly(
+                student_ids, batch_size
+            )
+
+        return result
+
+    # ==========================================================
+    # 1. Performance geral
+    # ==========================================================
+    @staticmethod
+    def _rebuild_performance(student_ids, batch_size):
+        rows = (
+            CompetenceScore.objects.filter(essay__student_id__in=student_ids)
+            .values("essay__student_id")
+            .annotate(
+                count=Count("id"),
+                **{f"sum_{name}": Sum(name) for name in COMPETENCES},
+            )
+            .order_by()
+        )
+
+        objects = []
+        for row in rows:
+            count = row["count"]
+            sums = {f"sum_{name}": row[f"sum_{name}"] or 0 for name in COMPETENCES}
+            sum_total = sum(sums.values())
+            objects.append(
+                StudentPerformance(
+                    student_id=row["essay__student_id"],
+                    total_essays_corrected=count,
+                    sum_total=sum_total,
+                    average_score=sum_total / count,
+                    **sums,
+                    **{
+                        f"avg_{name}": sums[f"sum_{name}"] / count
+                        for name in COMPETENCES
+                    },
+                )
+            )
+
+        StudentPerformance.objects.filter(student_id__in=student_ids).exclude(
+            student_id__in=[obj.student_id for obj in objects]
+        ).delete()
+
+        StudentPerformance.objects.bulk_create(
+            objects,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["student"],
+            update_fields=[
+                "total_essays_corrected",
+                "average_score",
+                "sum_total",
+                "updated_at",
+                *(f"sum_{name}" for name in COMPETENCES),
+                *(f"avg_{name}" for name in COMPETENCES),
+            ],
+        )
+        return len(objects)
+
+    # ==========================================================
+    # 2. Histórico ponto-a-ponto
+    # ==========================================================
+    @staticmethod
+    def _rebuild_history(student_ids, batch_size):
+        CompetenceHistory.objects.filter(student_id__in=student_ids).delete()
+
+        rows = CompetenceScore.objects.filter(
+            essay__student_id__in=student_ids
+        ).values_list("essay__student_id", "essay_id", *COMPETENCES)
+
+        history = [
+            CompetenceHistory(
+                student_id=student_id,
+                essay_id=essay_id,
+                **dict(zip(COMPETENCES, scores)),
+            )
+            for student_id, essay_id, *scores in rows.iterator(chunk_size=batch_size)
+        ]
+        CompetenceHistory.objects.bulk_create(history, batch_size=batch_size)
+
+        # created_at é auto_now_add: alinha com a data da correção em 1 UPDATE
+        CompetenceHistory.objects.filter(student_id__in=student_ids).update(
+            created_at=Subquery(
+                CompetenceScore.objects.filter(essay_id=OuterRef("essay_id")).values(
+                    "corrected_at"
+                )[:1]
+            )
+        )
+        return len(history)
+
+    # ==========================================================
+    # 3. Evolução mensal (mês local da correção)
+    # ==========================================================
+    @staticmethod
+    def _rebuild_monthly(student_ids, batch_size):
+        MonthlyEvolution.objects.filter(student_id__in=student_ids).delete()
+
+        rows = (
+            CompetenceScore.objects.filter(essay__student_id__in=student_ids)
+            .annotate(
+                month_start=TruncMonth(
+                    "corrected_at", tzinfo=ZoneInfo(settings.TIME_ZONE)
+                )
+            )
+            .values("essay__student_id", "month_start")
+            .annotate(
+                count=Count("id"),
+                total=Sum(F("c1") + F("c2") + F("c3") + F("c4") + F("c5")),
+            )
+            .order_by()
+        )
+
+        months = [
+            MonthlyEvolution(
+                student_id=row["essay__student_id"],
+                year=row["month_start"].year,
+                month=row["month_start"].month,
+                essays_count=row["count"],
+                score_sum=row["total"] or 0,
+                avg_score_month=(row["total"] or 0) / row["count"],
+            )
+            for row in rows
+        ]
+        MonthlyEvolution.objects.bulk_create(months, batch_size=batch_size)
+        return len(months)
@@ -0,0 +1,79 @@
+"""
+Service Layer dos contadores diários (DailyActivity).
+
+Chamado por:
+- SubmissionService / views de envio → evento CREATED
+- CorrectionService → evento CORRECTED (total + professor)
+
+Lido pelos gráficos dos dashboards (dashboard/services.py).
+"""
+
+from datetime import timedelta
+
+from django.db.models import F
+from django.utils import timezone
+
+from performance.models import DailyActivity
+
+
+class ActivityRollupService:
+    """Incrementa e consulta os contadores diários de atividade."""
+
+    @staticmethod
+    def record(event, count=1, teacher_id=None, moment=None):
+        """
+        Soma `count` ao dia LOCAL de `moment` (padrão: agora).
+
+        Com teacher_id, incrementa também a linha do professor.
+        """
+
+        if count <= 0:
+            return
+
+        day = timezone.localdate(moment)
+        ActivityRollupService._bump(day, event, None, count)
+        if teacher_id:
+            ActivityRollupService._bump(day, event, teacher_id, count)
+
+    @staticmethod
+    def series(event, days=7, teacher_id=None, today=None):
+        """
+        Contagens dos últimos `days` dias (inclui hoje), com zeros nos
+        dias sem atividade. Uma consulta por intervalo.
+
+        Returns:
+            tuple[list[str], list[int]]: rótulos "dd/mm" e valores.
+        """
+
+        today = today or timezone.localdate()
+        start = today - timedelta(days=days - 1)
+
+        counts = dict(
+            DailyActivity.objects.filter(
+                event=event,
+                teacher_id=teacher_id,
+                day__range=(start, today),
+            ).values_list("day", "count")
+        )
+
+        labels = []
+        values = []
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            labels.append(day.strftime("%d/%m"))
+            values.append(counts.get(day, 0))
+        return labels, values
+
+    @staticmethod
+    def _bump(day, event, teacher_id, count):
+        """UPDATE atômico; na primeira vez do dia, INSERT ... ON CONFLICT."""
+
+        row = DailyActivity.objects.filter(day=day, event=event, teacher_id=teacher_id)
+        if row.update(count=F("count") + count):
+            return
+
+        DailyActivity.objects.bulk_create(
+            [DailyActivity(day=day, event=event, teacher_id=teacher_id)],
+            ignore_conflicts=True,
+        )
+        row.update(count=F("count") + count)
@@ -0,0 +1,271 @@
+"""
+Service Layer das séries temporais de métricas.
+
+Usado por:
+- PerformanceTimeSeriesView → GET /api/performance/timeseries/
+
+Cada série é calculada com UMA consulta Trunc + GROUP BY (ou lida dos
+contadores diários DailyActivity quando não há filtro por aluno). Os
+períodos sem dados são preenchidos em Python.
+"""
+
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Avg, Count, DateField, F, Sum
+from django.db.models.functions import Trunc
+
+from essays.models import CompetenceScore, Essay
+from performance.models import DailyActivity
+
+User = get_user_model()
+
+COMPETENCES = ("c1", "c2", "c3", "c4", "c5")
+
+METRICS = ("submissions", "corrections", "average_score")
+GRANULARITIES = ("day", "week", "month")
+BREAKDOWNS = ("student", "teacher", "competence")
+
+
+class TimeSeriesService:
+    """Monta séries de envios, correções e nota média por período."""
+
+    @staticmethod
+    def build(
+        metrics,
+        start: date,
+        end: date,
+        granularity="day",
+        student_id=None,
+        teacher_id=None,
+        breakdown=None,
+    ) -> dict:
+        """
+        Args:
+            metrics: subconjunto de METRICS.
+            start, end: datas LOCAIS (inclusive).
+            granularity: "day", "week" (segunda-feira) ou "month".
+            student_id / teacher_id: filtros opcionais.
+            breakdown: "student", "teacher" ou "competence" (média por Cx).
+
+        Returns:
+            dict: {"granularity", "start", "end", "breakdown", "buckets", "series"}
+        """
+
+        buckets = TimeSeriesService.buckets(start, end, granularity)
+        series = []
+
+        for metric in metrics:
+            rows = TimeSeriesService._rows(
+                metric, start, end, granularity, student_id, teacher_id, breakdown
+            )
+            if rows is None:
+                continue
+            series.extend(TimeSeriesService._fill(metric, rows, buckets))
+
+        if breakdown in ("student", "teacher"):
+            TimeSeriesService._label_groups(series)
+
+        return {
+            "granularity": granularity,
+            "start": start,
+            "end": end,
+            "breakdown": breakdown,
+            "buckets": buckets,
+            "series": series,
+        }
+
+    @staticmethod
+    def buckets(start: date, end: date, granularity):
+        """Início de cada período entre start e end (inclusive)."""
+
+        current = TimeSeriesService._truncate(start, granularity)
+        result = []
+        while current <= end:
+            result.append(current)
+            if granularity == "day":
+                current += timedelta(days=1)
+            elif granularity == "week":
+                current += timedelta(weeks=1)
+            else:
+                current = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
+        return result
+
+    # ==========================================================
+    # Consultas (uma por série)
+    # ==========================================================
+    @staticmethod
+    def _rows(metric, start, end, granularity, student_id, teacher_id, breakdown):
+        """Linhas {"bucket", "group", "value"} de uma métrica, ou None."""
+
+        if metric == "submissions":
+            if teacher_id or breakdown == "teacher":
+                return None  # envio não tem professor
+            if not student_id and breakdown != "student":
+                return TimeSeriesService._rollup_rows(
+                    DailyActivity.Event.CREATED, start, end, granularity, None
+                )
+            queryset = Essay.objects.filter(
+                created_at__range=TimeSeriesService._moments(start, end)
+            )
+            if student_id:
+                queryset = queryset.filter(student_id=student_id)
+            return TimeSeriesService._grouped(
+                queryset,
+                "created_at",
+                granularity,
+                {"student": "student_id"}.get(breakdown),
+                {"value": Count("id")},
+            )
+
+        queryset = CompetenceScore.objects.filter(
+            corrected_at__range=TimeSeriesService._moments(start, end)
+        )
+        if student_id:
+            queryset = queryset.filter(essay__student_id=student_id)
+        if teacher_id:
+            queryset = queryset.filter(corrected_by_id=teacher_id)
+        group = {"student": "essay__student_id", "teacher": "corrected_by_id"}.get(
+            breakdown
+        )
+
+        if metric == "corrections":
+            if not student_id and breakdown != "student":
+                return TimeSeriesService._rollup_rows(
+                    DailyActivity.Event.CORRECTED,
+                    start,
+                    end,
+                    granularity,
+                    teacher_id,
+                    by_teacher=breakdown == "teacher",
+                )
+            return TimeSeriesService._grouped(
+                queryset, "corrected_at", granularity, group, {"value": Count("id")}
+            )
+
+        if breakdown == "competence":
+            rows = TimeSeriesService._grouped(
+                queryset,
+                "corrected_at",
+                granularity,
+                None,
+                {name: Avg(name) for name in COMPETENCES},
+            )
+            return [
+                {"bucket": row["bucket"], "group": name, "value": row[name]}
+                for row in rows
+                for name in COMPETENCES
+            ]
+
+        return TimeSeriesService._grouped(
+            queryset,
+            "corrected_at",
+            granularity,
+            group,
+            {"value": Avg(F("c1") + F("c2") + F("c3") + F("c4") + F("c5"))},
+        )
+
+    @staticmethod
+    def _grouped(queryset, field, granularity, group, aggregates, local=True):
+        """
+        SELECT Trunc(field) [, group], agregados ... GROUP BY 1 [, 2].
+
+        local=True: `field` é data/hora e o período é o do fuso local.
+        """
+
+        columns = ["bucket", group] if group else ["bucket"]
+        rows = (
+            queryset.annotate(
+                bucket=Trunc(
+                    field,
+                    granularity,
+                    output_field=DateField(),
+                    tzinfo=ZoneInfo(settings.TIME_ZONE) if local else None,
+                )
+            )
+            .values(*columns)
+            .annotate(**aggregates)
+            .order_by()
+        )
+        for row in rows:
+            row["group"] = row.pop(group) if group else None
+            yield row
+
+    @staticmethod
+    def _rollup_rows(event, start, end, granularity, teacher_id, by_teacher=False):
+        """Soma os contadores diários por período (sem tocar em Essay)."""
+
+        queryset = DailyActivity.objects.filter(event=event, day__range=(start, end))
+        if by_teacher:
+            queryset = queryset.filter(teacher__isnull=False)
+        else:
+            queryset = queryset.filter(teacher_id=teacher_id)
+
+        return TimeSeriesService._grouped(
+            queryset,
+            "day",
+            granularity,
+            "teacher_id" if by_teacher else None,
+            {"value": Sum("count")},
+            local=False,
+        )
+
+    # ==========================================================
+    # Helpers
+    # ==========================================================
+    @staticmethod
+    def _fill(metric, rows, buckets):
+        """Uma série por grupo, com zero (contagens) ou None (médias) nos vazios."""
+
+        empty = None if metric == "average_score" else 0
+        groups = {}
+        for row in rows:
+            value = row["value"]
+            if value is not None and metric == "average_score":
+                value = round(value, 2)
+            groups.setdefault(row["group"], {})[row["bucket"]] = value
+
+        if not groups:
+            groups[None] = {}
+
+        return [
+            {
+                "metric": metric,
+                "group": group,
+                "values": [values.get(bucket, empty) for bucket in buckets],
+            }
+            for group, values in sorted(groups.items(), key=lambda item: str(item[0]))
+        ]
+
+    @staticmethod
+    def _label_groups(series):
+        """Troca ids de aluno/professor por {"id", "email"} (1 consulta)."""
+
+        ids = {item["group"] for item in series if item["group"] is not None}
+        emails = dict(User.objects.filter(pk__in=ids).values_list("pk", "email"))
+        for item in series:
+            if item["group"] is not None:
+                item["group"] = {
+                    "id": item["group"],
+                    "email": emails.get(item["group"]),
+                }
+
+    @staticmethod
+    def _truncate(day: date, granularity):
+        if granularity == "week":
+            return day - timedelta(days=day.weekday())
+        if granularity == "month":
+            return day.replace(day=1)
+        return day
+
+    @staticmethod
+    def _moments(start: date, end: date):
+        """Intervalo [início de start, fim de end] no fuso local."""
+
+        tz = ZoneInfo(settings.TIME_ZONE)
+        return (
+            datetime.combine(start, time.min, tzinfo=tz),
+            datetime.combine(end, time.max, tzinfo=tz),
+        )
@@ -0,0 +1,95 @@
+"""
+Signals do módulo de performance.
+
+Mantêm o cache das métricas globais coerente: quando redações, notas ou
+usuários mudam, as métricas são marcadas como vencidas após o commit
+(o valor antigo continua sendo servido até o recálculo em segundo plano).
+
+Também mantêm os contadores globais (PlatformCounter): criação e remoção
+de usuários/redações e mudanças de papel/status viram incrementos na
+mesma transação do save.
+
+Operações em lote (bulk_create/update) não disparam signals: os serviços
+de lote chamam MetricsCache.invalidate() e CounterService diretamente.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from essays.models import CompetenceScore, Essay
+from performance.services.counter_service import CounterService
+from performance.services.metrics_cache import MetricsCache
+
+User = get_user_model()
+
+
+def _invalidate_after_commit():
+    transaction.on_commit(MetricsCache.invalidate)
+
+
+@receiver(post_save, sender=Essay)
+@receiver(post_delete, sender=Essay)
+@receiver(post_save, sender=CompetenceScore)
+def invalidate_on_essay_change(sender, **kwargs):
+    _invalidate_after_commit()
+
+
+@receiver(post_save, sender=User)
+def invalidate_on_user_save(sender, instance, created, update_fields=None, **kwargs):
+    # Ignora saves parciais que não mudam as contagens (ex.: last_login)
+    if created or update_fields is None or "role" in update_fields:
+        _invalidate_after_commit()
+
+
+@receiver(post_delete, sender=User)
+def invalidate_on_user_delete(sender, **kwargs):
+    _invalidate_after_commit()
+
+
+# ==========================================================
+# Contadores globais (PlatformCounter)
+# ==========================================================
+@receiver(post_init, sender=Essay)
+def remember_essay_status(sender, instance, **kwargs):
+    # __dict__ evita consulta extra quando o campo foi adiado (.only/.defer);
+    # status desconhecido atualiza só o total (reconcile_counters corrige)
+    instance._counted_status = instance.__dict__.get("status")
+
+
+@receiver(post_save, sender=Essay)
+def count_essay_save(sender, instance, created, update_fields=None, **kwargs):
+    status = instance.__dict__.get("status")
+    if created:
+        CounterService.essays_created(status)
+    elif instance._counted_status and (
+        update_fields is None or "status" in update_fields
+    ):
+        CounterService.essay_status_changed([(instance._counted_status, status)])
+    instance._counted_status = status
+
+
+@receiver(post_delete, sender=Essay)
+def count_essay_delete(sender, instance, **kwargs):
+    CounterService.essays_deleted(instance._counted_status)
+
+
+@receiver(post_init, sender=User)
+def remember_user_role(sender, instance, **kwargs):
+    instance._counted_role = instance.__dict__.get("role")
+
+
+@receiver(post_save, sender=User)
+def count_user_save(sender, instance, created, update_fields=None, **kwargs):
+    role = instance.__dict__.get("role")
+    if created:
+        CounterService.users_created(role)
+    elif instance._counted_role and (update_fields is None or "role" in update_fields):
+        CounterService.user_role_changed(instance._counted_role, role)
+    instance._counted_role = role
+
+
+@receiver(post_delete, sender=User)
+def count_user_delete(sender, instance, **kwargs):
+    CounterService.users_deleted(instance._counted_role)
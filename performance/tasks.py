@@ -0,0 +1,21 @@
+"""
+Tarefas em segundo plano do app performance (executadas pelo runworker).
+"""
+
+from django.db import transaction
+
+from jobs.registry import task
+from performance.services.performance_service import PerformanceService
+
+
+@task("performance.reconcile_student")
+def reconcile_student(student_id):
+    """
+    Recalcula as métricas agregadas e a evolução mensal do aluno.
+
+    Idempotente: reconstrução a partir das notas, em uma transação.
+    """
+
+    with transaction.atomic():
+        PerformanceService.reconcile_student_performance(student_id)
+        PerformanceService.reconcile_monthly_evolution(student_id)
@@ -0,0 +1,44 @@
+"""
+Exportação de dados: o filtro role só vale para datasets que têm papel.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+User = get_user_model()
+
+
+@pytest.fixture
+def api(db):
+    admin = User.objects.create_user(
+        email="admin@example.com", username="admin", password="x", role="admin"
+    )
+    client = APIClient()
+    client.force_authenticate(admin)
+    return client
+
+
+def export_url(dataset):
+    return reverse("performance:data-export", args=[dataset])
+
+
+def test_role_filter_is_rejected_for_performance(api):
+    response = api.get(export_url("performance"), {"role": "teacher"})
+
+    assert response.status_code == 400
+    assert "role" in response.data
+
+
+def test_role_filter_still_applies_to_essays(api):
+    response = api.get(export_url("essays"), {"role": "student"})
+
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content).startswith(b"id,student_id")
+
+
+def test_command_rejects_role_for_performance(db):
+    with pytest.raises(CommandError):
+        call_command("export_data", "performance", "--role", "student")
@@ -4,6 +4,8 @@ from .views import (
     DashboardTeacherMetrics,
     DashboardAdminMetrics,
     DashboardMe,
+    PerformanceTimeSeriesView,
+    PerformanceDataExportView,
 )
 
 app_name = "performance"
@@ -15,4 +17,12 @@ urlpatterns = [
     path("student/", DashboardStudentMetrics.as_view(), name="dashboard-student"),
     path("teacher/", DashboardTeacherMetrics.as_view(), name="dashboard-teacher"),
     path("admin/", DashboardAdminMetrics.as_view(), name="dashboard-admin"),
+    # Séries temporais para gráficos
+    path("timeseries/", PerformanceTimeSeriesView.as_view(), name="timeseries"),
+    # Exportação CSV/JSONL em streaming (admin)
+    path(
+        "export/<str:dataset>/",
+        PerformanceDataExportView.as_view(),
+        name="data-export",
+    ),
 ]
@@ -1,10 +1,15 @@
+from django.http import Http404, StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import permissions
 from essays.models import Essay, CompetenceScore
-from accounts.models import CustomUser
 from django.db.models import Avg
 
+from .serializers import DataExportQuerySerializer, TimeSeriesQuerySerializer
+from .services.data_export_service import DATASETS, DataExportService
+from .services.metrics_cache import GlobalMetrics
+from .services.timeseries_service import TimeSeriesService
+
 
 class IsStudentOrTeacher(permissions.BasePermission):
     """
@@ -16,6 +21,13 @@ class IsStudentOrTeacher(permissions.BasePermission):
         return request.user.is_authenticated
 
 
+class IsAdminRole(permissions.BasePermission):
+    """Permite acesso apenas para usuários com role = admin."""
+
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and request.user.role == "admin"
+
+
 # ==========================================================
 # 1) API DO ALUNO /api/performance/student/
 # ==========================================================
@@ -91,7 +103,7 @@ class DashboardTeacherMetrics(APIView):
     def get(self, request):
         user = request.user
 
-        pending = Essay.objects.filter(status="submitted").count()
+        pending = GlobalMetrics.platform_counts()["pending_count"]
         corrected = CompetenceScore.objects.filter(corrected_by=user).count()
 
         return Response(
@@ -116,17 +128,15 @@ class DashboardAdminMetrics(APIView):
 
     def get(self, request):
 
-        users_total = CustomUser.objects.count()
-        students_total = CustomUser.objects.filter(role="student").count()
-        teachers_total = CustomUser.objects.filter(role="teacher").count()
-        essays_total = Essay.objects.count()
+        # Iguais para todos os admins: servidas do cache compartilhado
+        counts = GlobalMetrics.platform_counts()
 
         return Response(
             {
-                "users_total": users_total,
-                "students_total": students_total,
-                "teachers_total": teachers_total,
-                "essays_total": essays_total,
+                "users_total": counts["users_count"],
+                "students_total": counts["students_count"],
+                "teachers_total": counts["teachers_count"],
+                "essays_total": counts["essays_count"],
             }
         )
 
@@ -159,3 +169,117 @@ class DashboardMe(APIView):
             return DashboardAdminMetrics().get(request)
 
         return Response({"detail": "Role desconhecida"}, status=400)
+
+
+# ==========================================================
+# 5) /timeseries/ — Séries temporais para gráficos
+# ==========================================================
+
+
+class PerformanceTimeSeriesView(APIView):
+    """
+    Envios, correções e nota média por dia, semana ou mês.
+
+    Exemplo:
+        GET /api/performance/timeseries/?start=2025-01-01&end=2025-12-31
+            &granularity=week&metrics=corrections,average_score
+            &breakdown=teacher
+
+    Regras de acesso:
+    - student → sempre apenas as próprias redações
+    - teacher → pode filtrar alunos; correções de professor só as próprias
+    - admin → sem restrições
+    """
+
+    permission_classes = [IsStudentOrTeacher]
+
+    def get(self, request):
+        query = TimeSeriesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        user = request.user
+        student_id = params.get("student")
+        teacher_id = params.get("teacher")
+        breakdown = params.get("breakdown")
+
+        if user.role == "student":
+            if breakdown in ("student", "teacher") or teacher_id:
+                return Response(
+                    {"detail": "Aluno só pode consultar as próprias métricas."},
+                    status=403,
+                )
+            student_id = user.pk
+
+        elif user.role == "teacher":
+            if breakdown == "teacher" or teacher_id not in (None, user.pk):
+                return Response(
+                    {"detail": "Professor só pode consultar as próprias correções."},
+                    status=403,
+                )
+
+        elif user.role != "admin":
+            return Response({"detail": "Role desconhecida"}, status=400)
+
+        data = TimeSeriesService.build(
+            params["metrics"],
+            params["start"],
+            params["end"],
+            granularity=params["granularity"],
+            student_id=student_id,
+            teacher_id=teacher_id,
+            breakdown=breakdown,
+        )
+        return Response(data)
+
+
+# ==========================================================
+# 6) /export/<dataset>/ — Exportação CSV/JSONL (admin)
+# ==========================================================
+
+
+class PerformanceDataExportView(APIView):
+    """
+    Exporta redações, notas, histórico ou performance em streaming.
+
+    Exemplo:
+        GET /api/performance/export/scores/?output=jsonl&gzip=true
+            &start=2025-01-01&end=2025-06-30&role=teacher
+
+    Datasets: essays, scores, history, performance.
+    Memória constante: uma consulta lida em blocos, enviada enquanto lê.
+    """
+
+    permission_classes = [IsAdminRole]
+
+    def get(self, request, dataset):
+        if dataset not in DATASETS:
+            raise Http404(f"Dataset desconhecido: {dataset}.")
+
+        query = DataExportQuerySerializer(
+            data=request.query_params, context={"dataset": dataset}
+        )
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        response = StreamingHttpResponse(
+            DataExportService.stream(
+                dataset,
+                output=params["output"],
+                compress=params["gzip"],
+                start=params.get("start"),
+                end=params.get("end"),
+                role=params.get("role"),
+            ),
+            content_type=(
+                "application/gzip"
+                if params["gzip"]
+                else {"csv": "text/csv", "jsonl": "application/x-ndjson"}[
+                    params["output"]
+                ]
+                + "; charset=utf-8"
+            ),
+        )
+        filename = DataExportService.filename(dataset, params["output"], params["gzip"])
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
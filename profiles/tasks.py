@@ -0,0 +1,37 @@
+"""
+Tarefas em segundo plano do app profiles (executadas pelo runworker).
+"""
+
+from django.db import transaction
+
+from essays.models import CompetenceScore, Essay
+from jobs.registry import task
+from profiles.models import StudentProfile, TeacherProfile
+
+
+@task("profiles.sync_counters")
+def sync_counters(user_id):
+    """
+    Atualiza os contadores do perfil (redações enviadas / corrigidas).
+
+    Idempotente: recontagem a partir do banco, em uma transação.
+    """
+
+    with transaction.atomic():
+        StudentProfile.objects.filter(user_id=user_id).update(
+            total_essays=Essay.objects.filter(student_id=user_id).count()
+        )
+        TeacherProfile.objects.filter(user_id=user_id).update(
+            total_corrections=CompetenceScore.objects.filter(
+                corrected_by_id=user_id
+            ).count()
+        )
+
+
+def schedule_sync_counters(*user_ids):
+    """Enfileira a sincronização (uma tarefa pendente por usuário, em lote)."""
+
+    sync_counters.enqueue_many(
+        ({"user_id": user_id}, f"profiles.sync_counters:{user_id}")
+        for user_id in sorted(set(user_ids))
+    )